@@ -0,0 +1,86 @@
+"""Compare decoding a 250-hit search response via dicts vs. straight from bytes.
+
+    python benchmarks/bench_decode.py [--per-page 250] [--repeat 200]
+
+The "dict" path is what commands did before: ``json.loads`` the body, then
+``Job.model_validate`` each hit. The "bytes" path is ``decode_results``.
+Documents carry extra fields the models do not declare, as real ones do.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import timeit
+
+from simplify_cli.decode import decode_results
+from simplify_cli.models.job import Job
+
+
+def make_body(per_page: int) -> bytes:
+    hits = []
+    for i in range(per_page):
+        hits.append({
+            "document": {
+                "id": f"job{i}",
+                "posting_id": f"{i:08d}",
+                "title": f"Software Engineer {i}",
+                "company_name": f"Company {i % 40}",
+                "company_id": f"c{i % 40}",
+                "company_logo": f"https://cdn.example.com/logos/{i % 40}.png",
+                "locations": ["New York, NY", "San Francisco, CA", "Remote in USA"],
+                "countries": ["United States"],
+                "experience_level": ["Senior", "Mid Level"],
+                "type": "Full-Time",
+                "functions": ["Software Engineering", "Backend Engineering"],
+                "min_salary": 120000 + i,
+                "max_salary": 180000 + i,
+                "currency_type": "USD",
+                "salary_period": 1,
+                "sponsors_h1b": i % 2 == 0,
+                "updated_date": 1_760_000_000 + i,
+                "start_date": None,
+                "seasons": [],
+                "majors": ["Computer Science"],
+                "skills": ["Python", "Go", "Kubernetes", "PostgreSQL"],
+                "shuffle_key": i * 7919 % 1000,
+                "description": "Build and operate distributed systems. " * 12,
+            },
+            "highlights": [{"field": "title", "snippet": f"<mark>Software</mark> Engineer {i}"}],
+            "text_match": 578730123365711993,
+        })
+    result = {"found": 12345, "page": 1, "out_of": 50000, "search_time_ms": 3, "hits": hits}
+    return json.dumps({"results": [result]}).encode()
+
+
+def via_dicts(body: bytes) -> list[Job]:
+    result = json.loads(body)["results"][0]
+    return [Job.model_validate(hit["document"]) for hit in result["hits"]]
+
+
+def via_bytes(body: bytes) -> list[Job]:
+    return decode_results(body)[0].jobs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--per-page", type=int, default=250)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    body = make_body(args.per_page)
+    if via_dicts(body) != via_bytes(body):
+        raise SystemExit("decoders disagree")
+
+    print(f"{args.per_page} hits, {len(body) / 1024:.0f} KiB body, best of 5 x {args.repeat} runs")
+    timings = {}
+    for name, fn in (("dict", via_dicts), ("bytes", via_bytes)):
+        runs = timeit.repeat(lambda: fn(body), number=args.repeat, repeat=5)
+        timings[name] = min(runs) / args.repeat * 1000
+        print(f"  {name:<6} {timings[name]:7.3f} ms/response  (median {statistics.median(runs) / args.repeat * 1000:.3f})")
+    print(f"  speedup {timings['dict'] / timings['bytes']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Memory and build time for N job documents as Job models vs. one JobBatch.
+
+    python benchmarks/bench_jobbatch.py [--rows 50000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+import uuid
+
+from simplify_cli.models.job import Job, JobBatch
+
+
+def make_documents(rows: int) -> list[str]:
+    return [
+        json.dumps({
+            "id": str(uuid.uuid4()),
+            "posting_id": str(uuid.uuid4()),
+            "title": f"Software Engineer {i % 300}",
+            "company_name": f"Company {i % 500}",
+            "company_id": f"c{i % 500}",
+            "company_logo": f"https://cdn.example.com/logos/{i % 500}.png",
+            "locations": ["New York, NY", "Remote in USA"] if i % 2 else ["London, UK"],
+            "experience_level": ["Senior"],
+            "type": "Full-Time",
+            "functions": ["Software Engineering"],
+            "min_salary": 100_000 + i,
+            "max_salary": None if i % 3 == 0 else 200_000,
+            "currency_type": "USD",
+            "salary_period": 1,
+            "sponsors_h1b": i % 2 == 0,
+            "updated_date": 1_760_000_000 + i,
+            "seasons": [],
+            "majors": ["Computer Science"],
+        })
+        for i in range(rows)
+    ]
+
+
+def as_models(raw: list[str]) -> list[Job]:
+    return [Job.model_validate_json(doc) for doc in raw]
+
+
+def as_batch(raw: list[str]) -> JobBatch:
+    return JobBatch.from_documents(json.loads(doc) for doc in raw)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000)
+    args = parser.parse_args()
+
+    raw = make_documents(args.rows)
+    print(f"{args.rows:,} documents")
+    sizes = {}
+    for name, build in (("models", as_models), ("batch", as_batch)):
+        start = time.perf_counter()
+        build(raw)
+        elapsed = time.perf_counter() - start
+        tracemalloc.start()
+        kept = build(raw)
+        sizes[name], _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del kept
+        print(f"  {name:<7} {sizes[name] / 1e6:6.1f} MB retained, built in {elapsed:.2f} s")
+    print(f"  {sizes['models'] / sizes['batch']:.1f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
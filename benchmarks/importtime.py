@@ -0,0 +1,107 @@
+"""Import-time budget for CLI startup, measured with ``python -X importtime``.
+
+    python benchmarks/importtime.py [--runs 5] [--scale 1.0]
+
+For each command path below, a fresh interpreter imports the app and
+resolves the command the way dispatch does, without running it. The
+import time on top of a bare interpreter is compared against the budget,
+and light paths must not import the modules listed for them. Exits 1 if
+any check fails; ``--scale`` loosens the budgets on slow machines.
+``tests/test_importtime.py`` runs the same checks under pytest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+# Command path -> (budget in ms, modules it must not import).
+BUDGETS: dict[tuple[str, ...], tuple[float, tuple[str, ...]]] = {
+    (): (150, ("httpx", "pydantic", "keyring", "rich.table", "simplify_cli.commands")),
+    ("auth", "status"): (250, ("httpx", "pydantic", "keyring", "simplify_cli.commands.jobs_cmd")),
+    ("cache", "stats"): (350, ("keyring", "simplify_cli.commands.jobs_cmd")),
+    ("jobs", "search"): (
+        700,
+        (
+            "keyring",
+            "numpy",
+            "simplify_cli.commands.tracker_cmd",
+            "simplify_cli.search.mirror",
+            "simplify_cli.search.watch",
+            "simplify_cli.search.browse",
+        ),
+    ),
+    ("tracker", "list"): (800, ("keyring", "numpy", "simplify_cli.commands.jobs_cmd")),
+}
+
+_RESOLVE = """
+import sys
+import typer.main
+from simplify_cli.app import app
+command = typer.main.get_command(app)
+for name in sys.argv[1:]:
+    command = command.get_command(None, name)
+    assert command is not None, name
+print(",".join(sorted(sys.modules)))
+"""
+
+
+def _import_ms(stderr: str) -> float:
+    """Sum the per-module self times reported by -X importtime."""
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        total += int(line.split("|")[0].split(":")[1])
+    return total / 1000
+
+
+def measure(path: tuple[str, ...]) -> tuple[float, set[str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _RESOLVE, *path],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return _import_ms(proc.stderr), set(proc.stdout.strip().split(","))
+
+
+def baseline() -> float:
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "pass"], capture_output=True, text=True, check=True)
+    return _import_ms(proc.stderr)
+
+
+def check(path: tuple[str, ...], base: float, runs: int = 5, scale: float = 1.0) -> tuple[float, float, list[str]]:
+    """Median import ms of ``path`` above ``base``, its scaled budget, and the forbidden modules it imported."""
+    budget, forbidden = BUDGETS[path]
+    samples = [measure(path) for _ in range(runs)]
+    ms = statistics.median(s[0] for s in samples) - base
+    modules = samples[0][1]
+    leaked = [m for m in forbidden if any(x == m or x.startswith(m + ".") for x in modules)]
+    return ms, budget * scale, leaked
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Interpreters started per command (median is used)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget by this")
+    args = parser.parse_args()
+
+    base = statistics.median(baseline() for _ in range(args.runs))
+    failures = 0
+    for path in BUDGETS:
+        ms, limit, leaked = check(path, base, runs=args.runs, scale=args.scale)
+        ok = ms <= limit and not leaked
+        failures += not ok
+        label = " ".join(("simplify", *path)) if path else "simplify --help"
+        print(f"{'ok  ' if ok else 'FAIL'} {label:<24} {ms:6.1f} ms (budget {limit:.0f})")
+        for module in leaked:
+            print(f"     imports {module}")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,22 +1,33 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
 from types import TracebackType
-from typing import Any
+from typing import Any, TypeVar
 
 import httpx
 from rich import print as rprint
+from rich.markup import escape
 
-from simplify_cli.auth import get_auth_token, get_csrf_token
+from simplify_cli.api.ratelimit import adaptive_transports
+from simplify_cli.auth import CredentialStoreError, get_credentials
+from simplify_cli.decode import decode, loads
+
+T = TypeVar("T")
 
 
 class SimplifyAPIClient:
     def __init__(self) -> None:
-        csrf = get_csrf_token()
-        auth = get_auth_token()
-        if not csrf or not auth:
+        try:
+            credentials = get_credentials()
+        except CredentialStoreError as e:
+            rprint(f"[red]Error:[/red] {escape(str(e))}")
+            sys.exit(1)
+        if credentials is None:
             rprint("[red]Error:[/red] Not authenticated. Run [bold]simplify auth login[/bold] first.")
             sys.exit(1)
+        csrf, auth = credentials
         self._client = httpx.Client(
             headers={
                 "X-CSRF-TOKEN": csrf,
@@ -25,6 +36,7 @@ class SimplifyAPIClient:
             cookies={"csrf": csrf, "authorization": auth},
             timeout=30.0,
             follow_redirects=True,
+            **adaptive_transports(),
         )
 
     def __enter__(self) -> SimplifyAPIClient:
@@ -41,14 +53,28 @@ class SimplifyAPIClient:
     def get(self, url: str, **params: Any) -> Any:
         resp = self._client.get(url, params=params)
         resp.raise_for_status()
-        return resp.json()
+        return loads(resp.content)
+
+    def get_as(self, tp: type[T], url: str, **params: Any) -> T:
+        """GET ``url`` and validate the body straight into ``tp``."""
+        resp = self._client.get(url, params=params)
+        resp.raise_for_status()
+        return decode(resp.content, tp)
 
     def post(self, url: str, json: Any = None) -> Any:
         resp = self._client.post(url, json=json)
         resp.raise_for_status()
-        return resp.json()
+        return loads(resp.content)
 
     def get_raw(self, url: str, **params: Any) -> httpx.Response:
         resp = self._client.get(url, params=params)
         resp.raise_for_status()
         return resp
+
+    @contextmanager
+    def stream(self, url: str, headers: dict[str, str] | None = None, **params: Any) -> Iterator[httpx.Response]:
+        """GET ``url`` without reading the body; error statuses other than 416 raise."""
+        with self._client.stream("GET", url, params=params, headers=headers) as resp:
+            if resp.status_code != 416:
+                resp.raise_for_status()
+            yield resp
@@ -4,6 +4,7 @@ from typing import Any
 
 from simplify_cli.api.client import SimplifyAPIClient
 from simplify_cli.api.endpoints import ME, PREFERENCES, RESUMES
+from simplify_cli.models.profile import Profile, Resume, ResumePage
 
 
 def get_profile(client: SimplifyAPIClient) -> dict[str, Any]:
@@ -16,3 +17,13 @@ def get_preferences(client: SimplifyAPIClient) -> dict[str, Any]:
 
 def get_resumes(client: SimplifyAPIClient) -> list[dict[str, Any]]:
     return client.get(RESUMES)
+
+
+def fetch_profile(client: SimplifyAPIClient) -> Profile:
+    return client.get_as(Profile, ME)
+
+
+def fetch_resumes(client: SimplifyAPIClient) -> list[Resume]:
+    # The endpoint has returned both a bare list and an {"items": [...]} page.
+    data = client.get_as(list[Resume] | ResumePage, RESUMES)
+    return data.items if isinstance(data, ResumePage) else data
@@ -0,0 +1,411 @@
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import ipaddress
+import random
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+from urllib.request import getproxies
+
+import httpx
+
+from simplify_cli.config import load_config
+
+# Responses that mean "slow down" rather than "this request is wrong".
+THROTTLE_STATUSES = {429, 503}
+RETRY_STATUSES = {429, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+
+
+@dataclass
+class RetryPolicy:
+    max_retries: int = 4
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Seconds to wait before retry ``attempt`` (0-based), with full jitter."""
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit for one host, usable from threads and event loops.
+
+    Each success below the latency tolerance grows the limit by about one
+    request per round trip; slow responses shrink it gently and throttling
+    responses halve it. A ``Retry-After`` pauses every request to the host,
+    not just the one that was throttled.
+    """
+
+    def __init__(
+        self,
+        initial: int = 8,
+        minimum: int = 1,
+        maximum: int = 64,
+        latency_tolerance: float = 2.0,
+    ) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_tolerance = latency_tolerance
+        self._limit = float(max(minimum, min(initial, maximum)))
+        self._in_flight = 0
+        self._min_latency: float | None = None
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _pause_remaining(self) -> float:
+        return self._paused_until - time.monotonic()
+
+    def _try_acquire(self) -> bool:
+        if self._in_flight < int(self._limit):
+            self._in_flight += 1
+            return True
+        return False
+
+    def acquire(self) -> None:
+        while (pause := self._pause_remaining()) > 0:
+            time.sleep(pause)
+        with self._cond:
+            while not self._try_acquire():
+                self._cond.wait()
+
+    async def acquire_async(self) -> None:
+        while (pause := self._pause_remaining()) > 0:
+            await asyncio.sleep(pause)
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._try_acquire():
+                    return
+                waiter: asyncio.Future[None] = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            await waiter
+
+    def release(self) -> None:
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+            waiters, self._async_waiters = self._async_waiters, []
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+    def record_success(self, latency: float) -> None:
+        with self._cond:
+            if self._min_latency is None or latency < self._min_latency:
+                self._min_latency = latency
+            if latency <= self._min_latency * self.latency_tolerance:
+                self._limit = min(self.maximum, self._limit + 1 / self._limit)
+            else:
+                self._limit = max(self.minimum, self._limit * 0.95)
+            self._cond.notify_all()
+
+    def record_throttle(self, retry_after: float | None = None) -> None:
+        with self._cond:
+            self._limit = max(self.minimum, self._limit / 2)
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+
+
+def _wake(waiter: asyncio.Future[None]) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+_limiters: dict[str, AdaptiveLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def load_rate_settings() -> dict[str, Any]:
+    return load_config()["rate_limit"]
+
+
+def get_limiter(host: str, settings: dict[str, Any] | None = None) -> AdaptiveLimiter:
+    """Return the limiter shared by every client talking to ``host``."""
+    with _limiters_lock:
+        if host not in _limiters:
+            settings = settings or load_rate_settings()
+            _limiters[host] = AdaptiveLimiter(
+                initial=settings["initial_concurrency"],
+                minimum=settings["min_concurrency"],
+                maximum=settings["max_concurrency"],
+                latency_tolerance=settings["latency_tolerance"],
+            )
+        return _limiters[host]
+
+
+def retry_policy(settings: dict[str, Any] | None = None) -> RetryPolicy:
+    settings = settings or load_rate_settings()
+    return RetryPolicy(
+        max_retries=settings["max_retries"],
+        backoff_base=settings["backoff_base"],
+        backoff_max=settings["backoff_max"],
+    )
+
+
+def _should_retry(request: httpx.Request, status: int, retry_posts: bool) -> bool:
+    if status == 429:
+        # The server refused before doing any work, so even a POST is safe to resend.
+        return True
+    return status in RETRY_STATUSES and (retry_posts or request.method in IDEMPOTENT_METHODS)
+
+
+def _can_retry_error(request: httpx.Request, error: httpx.TransportError, retry_posts: bool) -> bool:
+    if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)):
+        return True
+    return retry_posts or request.method in IDEMPOTENT_METHODS
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """Response body that gives the limiter slot back when it is closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            release, self._release = self._release, None
+            if release is not None:
+                release()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    """Async counterpart of ``_ReleasingStream``."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            release, self._release = self._release, None
+            if release is not None:
+                release()
+
+
+class AdaptiveTransport(httpx.BaseTransport):
+    """Wrap a transport with the host's AIMD limiter and jittered retries.
+
+    ``retry_posts`` marks POSTs through this transport as safe to repeat,
+    which holds for read-only endpoints such as Typesense multi_search.
+    A request holds its limiter slot until the response is closed, so a
+    streamed body counts against the limit for as long as it is read.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        *,
+        retry_posts: bool = False,
+        settings: dict[str, Any] | None = None,
+    ) -> None:
+        self._transport = transport
+        self._retry_posts = retry_posts
+        self._settings = settings or load_rate_settings()
+        self._policy = retry_policy(self._settings)
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = get_limiter(request.url.host, self._settings)
+        attempt = 0
+        while True:
+            limiter.acquire()
+            start = time.monotonic()
+            try:
+                response = self._transport.handle_request(request)
+            except httpx.TransportError as e:
+                limiter.release()
+                if attempt >= self._policy.max_retries or not _can_retry_error(request, e, self._retry_posts):
+                    raise
+                time.sleep(self._policy.delay(attempt))
+                attempt += 1
+                continue
+            if response.is_closed:
+                limiter.release()
+            else:
+                response.stream = _ReleasingStream(response.stream, limiter.release)
+
+            status = response.status_code
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if status in THROTTLE_STATUSES:
+                limiter.record_throttle(retry_after)
+            elif status < 500:
+                limiter.record_success(time.monotonic() - start)
+
+            if attempt >= self._policy.max_retries or not _should_retry(request, status, self._retry_posts):
+                return response
+            response.close()
+            time.sleep(self._policy.delay(attempt, retry_after))
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncAdaptiveTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of ``AdaptiveTransport`` sharing the same limiters."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        *,
+        retry_posts: bool = False,
+        settings: dict[str, Any] | None = None,
+    ) -> None:
+        self._transport = transport
+        self._retry_posts = retry_posts
+        self._settings = settings or load_rate_settings()
+        self._policy = retry_policy(self._settings)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        limiter = get_limiter(request.url.host, self._settings)
+        attempt = 0
+        while True:
+            await limiter.acquire_async()
+            start = time.monotonic()
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError as e:
+                limiter.release()
+                if attempt >= self._policy.max_retries or not _can_retry_error(request, e, self._retry_posts):
+                    raise
+                await asyncio.sleep(self._policy.delay(attempt))
+                attempt += 1
+                continue
+            if response.is_closed:
+                limiter.release()
+            else:
+                response.stream = _AsyncReleasingStream(response.stream, limiter.release)
+
+            status = response.status_code
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if status in THROTTLE_STATUSES:
+                limiter.record_throttle(retry_after)
+            elif status < 500:
+                limiter.record_success(time.monotonic() - start)
+
+            if attempt >= self._policy.max_retries or not _should_retry(request, status, self._retry_posts):
+                return response
+            await response.aclose()
+            await asyncio.sleep(self._policy.delay(attempt, retry_after))
+            attempt += 1
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _no_proxy_pattern(host: str) -> str:
+    if "://" in host:
+        return host
+    try:
+        address = ipaddress.ip_address(host.split("/")[0])
+    except ValueError:
+        # curl semantics: "example.com" also covers subdomains, ".example.com" only them.
+        return f"all://{host}" if host.lower() == "localhost" else f"all://*{host}"
+    return f"all://[{host}]" if address.version == 6 else f"all://{host}"
+
+
+def environment_proxies() -> dict[str, str | None]:
+    """httpx mount patterns for the proxies configured in the environment.
+
+    Each ``HTTP(S)_PROXY``/``ALL_PROXY`` maps its scheme to the proxy URL and
+    each ``NO_PROXY`` host maps to None, which httpx treats as "use the
+    default transport". ``NO_PROXY=*`` turns proxying off altogether.
+    """
+    # getproxies() also reads the system settings on Windows and macOS.
+    proxies = getproxies()
+    mounts: dict[str, str | None] = {}
+    for scheme in ("http", "https", "all"):
+        url = proxies.get(scheme)
+        if url:
+            mounts[f"{scheme}://"] = url if "://" in url else f"http://{url}"
+    for host in (h.strip() for h in proxies.get("no", "").split(",")):
+        if host == "*":
+            return {}
+        if host:
+            mounts[_no_proxy_pattern(host)] = None
+    return mounts
+
+
+def adaptive_transports(
+    *,
+    retry_posts: bool = False,
+    settings: dict[str, Any] | None = None,
+    **transport_options: Any,
+) -> dict[str, Any]:
+    """``transport`` and ``mounts`` arguments for an ``httpx.Client`` whose
+    requests all go through an ``AdaptiveTransport``.
+
+    httpx ignores ``HTTP(S)_PROXY`` and ``NO_PROXY`` once a custom transport
+    is given, so the proxies it would have read from the environment are
+    mounted here, each wrapped the same way. ``transport_options`` are
+    passed to every ``httpx.HTTPTransport``.
+    """
+
+    def wrap(**proxy: Any) -> httpx.BaseTransport:
+        inner = httpx.HTTPTransport(**transport_options, **proxy)
+        return AdaptiveTransport(inner, retry_posts=retry_posts, settings=settings)
+
+    mounts = {
+        pattern: None if url is None else wrap(proxy=url)
+        for pattern, url in environment_proxies().items()
+    }
+    return {"transport": wrap(), "mounts": mounts}
+
+
+def async_adaptive_transports(
+    *,
+    retry_posts: bool = False,
+    settings: dict[str, Any] | None = None,
+    **transport_options: Any,
+) -> dict[str, Any]:
+    """Async counterpart of ``adaptive_transports`` for ``httpx.AsyncClient``."""
+
+    def wrap(**proxy: Any) -> httpx.AsyncBaseTransport:
+        inner = httpx.AsyncHTTPTransport(**transport_options, **proxy)
+        return AsyncAdaptiveTransport(inner, retry_posts=retry_posts, settings=settings)
+
+    mounts = {
+        pattern: None if url is None else wrap(proxy=url)
+        for pattern, url in environment_proxies().items()
+    }
+    return {"transport": wrap(), "mounts": mounts}
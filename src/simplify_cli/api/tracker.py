@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from typing import Any
+import gzip
+import json as _json
+import os
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any, TypeVar
+
+import httpx
 
 from simplify_cli.api.client import SimplifyAPIClient
 from simplify_cli.api.endpoints import (
@@ -11,6 +20,28 @@ from simplify_cli.api.endpoints import (
     TRACKER_SAVE,
     TRACKER_STATUS_UPDATE,
 )
+from simplify_cli.api.ratelimit import retry_policy
+from simplify_cli.models.job import Job
+from simplify_cli.models.tracker import TrackerPage
+from simplify_cli.search.client import TypesenseClient, fetch_jobs_by_ids, get_jobs_by_ids
+
+# Job document fields joined onto tracker items by enrich_items.
+ENRICH_FIELDS = [
+    "id",
+    "locations",
+    "experience_level",
+    "type",
+    "min_salary",
+    "max_salary",
+    "currency_type",
+    "salary_period",
+    "sponsors_h1b",
+]
+
+EXPORT_CHUNK_SIZE = 64 * 1024
+COMPRESSIONS = ("gzip", "zstd")
+
+T = TypeVar("T")
 
 
 def list_tracker(client: SimplifyAPIClient, page: int = 1, size: int = 20, status: str | None = None) -> dict[str, Any]:
@@ -20,6 +51,78 @@ def list_tracker(client: SimplifyAPIClient, page: int = 1, size: int = 20, statu
     return client.get(TRACKER, **params)
 
 
+def fetch_tracker_page(
+    client: SimplifyAPIClient,
+    page: int = 1,
+    size: int = 20,
+    status: str | None = None,
+) -> TrackerPage:
+    """``list_tracker`` decoded straight into a ``TrackerPage``."""
+    params: dict[str, Any] = {"page": page, "size": size}
+    if status:
+        params["status"] = status
+    return client.get_as(TrackerPage, TRACKER, **params)
+
+
+def iter_tracker_pages(
+    client: SimplifyAPIClient,
+    size: int = 20,
+    status: str | None = None,
+    workers: int = 4,
+) -> Iterator[dict[str, Any]]:
+    """Yield every tracker page in order, fetching up to ``workers`` ahead.
+
+    The page count comes from the first response; later pages are requested
+    concurrently over the one client, and at most ``workers`` fetched pages
+    are held while waiting for an earlier one.
+    """
+
+    def fetch(page: int) -> dict[str, Any]:
+        return list_tracker(client, page=page, size=size, status=status)
+
+    return _prefetch_pages(fetch, lambda data: int(data.get("pages", 1)), workers)
+
+
+def fetch_tracker_pages(
+    client: SimplifyAPIClient,
+    size: int = 20,
+    status: str | None = None,
+    workers: int = 4,
+) -> Iterator[TrackerPage]:
+    """``iter_tracker_pages`` with each page decoded straight into a ``TrackerPage``."""
+
+    def fetch(page: int) -> TrackerPage:
+        return fetch_tracker_page(client, page=page, size=size, status=status)
+
+    return _prefetch_pages(fetch, lambda tp: tp.pages, workers)
+
+
+def _prefetch_pages(fetch: Callable[[int], T], page_count: Callable[[T], int], workers: int) -> Iterator[T]:
+    first = fetch(1)
+    yield first
+    pages = range(2, page_count(first) + 1)
+    if not pages:
+        return
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        window: list[Future[T]] = []
+        queued = iter(pages)
+        try:
+            for page in queued:
+                window.append(pool.submit(fetch, page))
+                if len(window) >= max(1, workers):
+                    break
+            while window:
+                data = window.pop(0).result()
+                page = next(queued, None)
+                if page is not None:
+                    window.append(pool.submit(fetch, page))
+                yield data
+        finally:
+            for fut in window:
+                fut.cancel()
+
+
 def save_job(client: SimplifyAPIClient, job_posting_id: str) -> dict[str, Any]:
     return client.post(TRACKER_SAVE, json={"job_posting_id": job_posting_id})
 
@@ -32,10 +135,260 @@ def update_status(client: SimplifyAPIClient, tracker_id: str, status: str) -> di
     return client.post(TRACKER_STATUS_UPDATE, json={"id": tracker_id, "status": status})
 
 
+def enrich_items(items: list[dict[str, Any]], client: TypesenseClient) -> int:
+    """Attach each item's job document under ``job``, in place.
+
+    All posting IDs are resolved together in batched multi-ID lookups that
+    go through the client's response cache. Items whose job is gone get
+    ``job: None``. Returns how many items were matched.
+    """
+    ids = [item["job_posting_id"] for item in items if item.get("job_posting_id")]
+    docs, _ = get_jobs_by_ids(ids, client, ENRICH_FIELDS)
+    by_id = {doc["id"]: doc for doc in docs}
+    for item in items:
+        item["job"] = by_id.get(item.get("job_posting_id") or "")
+    return sum(item["job"] is not None for item in items)
+
+
+def fetch_enrichment(page: TrackerPage, client: TypesenseClient) -> dict[str, Job]:
+    """Like ``enrich_items`` for a decoded page: job models keyed by tracker item ID."""
+    ids = [item.job_posting_id for item in page.items if item.job_posting_id]
+    jobs, _ = fetch_jobs_by_ids(ids, client, ENRICH_FIELDS)
+    by_id = {job.id: job for job in jobs}
+    return {item.id: by_id[item.job_posting_id] for item in page.items if item.job_posting_id in by_id}
+
+
+def run_bulk(
+    client: SimplifyAPIClient,
+    action: Callable[..., dict[str, Any]],
+    rows: Sequence[tuple[str, ...]],
+    workers: int = 8,
+) -> Iterator[tuple[tuple[str, ...], dict[str, Any] | httpx.HTTPError]]:
+    """Call ``action(client, *row)`` for every row over the one client.
+
+    Up to ``workers`` calls run at once. Outcomes are yielded in input order,
+    with HTTP failures returned in place of the response instead of raised.
+    """
+
+    def call(row: tuple[str, ...]) -> dict[str, Any] | httpx.HTTPError:
+        try:
+            return action(client, *row)
+        except httpx.HTTPError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        yield from zip(rows, pool.map(call, rows))
+
+
 def export_csv(client: SimplifyAPIClient) -> bytes:
     resp = client.get_raw(TRACKER_EXPORT_CSV)
     return resp.content
 
 
+def compression_for(path: Path) -> str | None:
+    """Pick a compression from the output file suffix."""
+    return {".gz": "gzip", ".zst": "zstd"}.get(path.suffix.lower())
+
+
+def _compressor(f: IO[bytes], compression: str | None) -> IO[bytes]:
+    if compression == "gzip":
+        return gzip.GzipFile(fileobj=f, mode="wb")
+    if compression == "zstd":
+        return _zstandard().ZstdCompressor().stream_writer(f, closefd=False)
+    return f
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError("zstd output needs the zstandard package (pip install 'simplify-cli[zstd]')") from None
+    return zstandard
+
+
+def _total_size(resp: httpx.Response) -> int | None:
+    if resp.status_code == 206:
+        total = resp.headers.get("Content-Range", "").rpartition("/")[2]
+    else:
+        total = resp.headers.get("Content-Length", "")
+    return int(total) if total.isdigit() else None
+
+
+def part_path(dest: Path) -> Path:
+    """Where ``download_csv`` keeps an unfinished export of ``dest``."""
+    return dest.with_name(f".{dest.name}.part")
+
+
+def _state_path(part: Path) -> Path:
+    return part.with_name(part.name + ".json")
+
+
+def _read_state(part: Path, compression: str | None) -> tuple[str | None, int, int]:
+    """The validator, CSV offset and part-file size an earlier run left to resume from."""
+    state_file = _state_path(part)
+    if not part.exists() or not state_file.exists():
+        return None, 0, 0
+    try:
+        state = _json.loads(state_file.read_text())
+    except ValueError:
+        return None, 0, 0
+    validator = state.get("validator")
+    if not validator or state.get("compression") != compression:
+        return None, 0, 0
+    if compression is None:
+        size = part.stat().st_size
+        return validator, size, size
+    # A compressed part is only usable up to the last member a run closed cleanly.
+    received, size = state.get("received"), state.get("size")
+    if not isinstance(received, int) or not isinstance(size, int) or part.stat().st_size < size:
+        return None, 0, 0
+    return validator, received, size
+
+
+def _write_state(part: Path, validator: str | None, compression: str | None, **offsets: int) -> None:
+    if validator:
+        _state_path(part).write_text(_json.dumps({"validator": validator, "compression": compression, **offsets}))
+    else:
+        _state_path(part).unlink(missing_ok=True)
+
+
+class _PartWriter:
+    """The part file of an export, compressed as the chunks arrive.
+
+    ``received`` counts CSV bytes, the offsets Range requests use, and
+    ``size`` the bytes of the part file kept from an earlier run. Each run
+    appends its own gzip member or zstd frame after them; both formats
+    decode concatenated members as one stream.
+    """
+
+    def __init__(self, part: Path, compression: str | None, received: int = 0, size: int = 0) -> None:
+        self.part = part
+        self.compression = compression
+        self.received = received
+        self.size = size
+        self._file: IO[bytes] | None = None
+        self._sink: IO[bytes] | None = None
+
+    def start(self, restart: bool) -> None:
+        """Get ready for a response body, from the top if ``restart``, else from ``received``."""
+        if restart:
+            self.reset()
+        if self._file is None:
+            # Only opened once a response has been accepted, so a failed first request leaves no file.
+            self._file = open(self.part, "r+b" if self.size else "wb")
+            self._file.seek(self.size)
+            self._file.truncate()
+        if self._sink is None:
+            self._sink = _compressor(self._file, self.compression)
+
+    def write(self, chunk: bytes) -> None:
+        self._sink.write(chunk)
+        self.received += len(chunk)
+
+    def reset(self) -> None:
+        """Drop everything written so far."""
+        self._close_sink()
+        if self._file is not None:
+            self._file.seek(0)
+            self._file.truncate()
+        self.received = self.size = 0
+
+    def close(self) -> None:
+        """End the current member and close the file, which is then complete up to ``size``."""
+        if self._file is None:
+            return
+        self._close_sink()
+        self.size = self._file.tell()
+        self._file.close()
+        self._file = None
+
+    def _close_sink(self) -> None:
+        if self._sink is not None and self._sink is not self._file:
+            self._sink.close()
+        self._sink = None
+
+
+def download_csv(
+    client: SimplifyAPIClient,
+    dest: Path,
+    *,
+    compression: str | None = None,
+    progress: Callable[[int, int | None], None] | None = None,
+) -> int:
+    """Stream the tracker CSV export to ``dest`` and return its size in bytes.
+
+    The CSV is written, compressed as it arrives if asked, to
+    ``part_path(dest)`` and only moved into place once it is complete. It is
+    requested with ``Accept-Encoding: identity`` so that the bytes received
+    are the bytes a Range request counts; a server that compresses the body
+    anyway gets no Range requests. If the connection drops, the download
+    resumes with a Range request from the last byte received; servers that
+    ignore Range restart from the top.
+
+    A failed download leaves the part file, and the export's ETag or
+    Last-Modified beside it, so the next run for the same ``dest`` resumes
+    where this one stopped. The server's If-Range check makes it start over
+    if the export has changed in between. A compressed part is only resumed
+    if the failing run got to close its gzip member or zstd frame.
+    """
+    if compression == "zstd":
+        _zstandard()
+    policy = retry_policy()
+    part = part_path(dest)
+    validator, received, size = _read_state(part, compression)
+    writer = _PartWriter(part, compression, received, size)
+    attempt = 0
+    encoded = False
+    try:
+        while True:
+            resumed_at = writer.received
+            headers = {"Accept-Encoding": "identity"}
+            if writer.received:
+                headers["Range"] = f"bytes={writer.received}-"
+                if validator:
+                    headers["If-Range"] = validator
+            try:
+                with client.stream(TRACKER_EXPORT_CSV, headers=headers) as resp:
+                    if resp.status_code == 416:
+                        if not writer.received:
+                            resp.raise_for_status()
+                        writer.reset()
+                        continue
+                    # Range unsupported or the export changed: a 200 is the whole CSV again.
+                    writer.start(restart=resp.status_code != 206)
+                    encoded = resp.headers.get("Content-Encoding", "identity").lower() != "identity"
+                    # Offsets into an encoded body cannot be resumed, here or by a later run.
+                    validator = None if encoded else resp.headers.get("ETag") or resp.headers.get("Last-Modified")
+                    _write_state(part, validator, compression)
+                    total = None if encoded else _total_size(resp)
+                    for chunk in resp.iter_bytes(EXPORT_CHUNK_SIZE):
+                        writer.write(chunk)
+                        if progress:
+                            progress(writer.received, total)
+                if total is None or writer.received >= total:
+                    break
+            except httpx.TransportError:
+                if attempt >= policy.max_retries:
+                    raise
+                if encoded:
+                    writer.reset()
+            else:
+                # Body ended early without a transport error; resume like a dropped connection.
+                if attempt >= policy.max_retries:
+                    raise httpx.RemoteProtocolError(f"Export ended after {writer.received} of {total} bytes")
+            # Only consecutive attempts that make no progress count towards the limit.
+            attempt = 0 if writer.received > resumed_at else attempt + 1
+            time.sleep(policy.delay(attempt))
+    except BaseException:
+        writer.close()
+        _write_state(part, validator, compression, received=writer.received, size=writer.size)
+        raise
+
+    writer.close()
+    os.replace(part, dest)
+    _state_path(part).unlink(missing_ok=True)
+    return writer.received
+
+
 def get_stats(client: SimplifyAPIClient) -> dict[str, Any]:
     return client.get(TRACKER_SANKEY)
@@ -0,0 +1,197 @@
+"""Columnar funnel analytics over the tracker replica's status events.
+
+Needs NumPy (``pip install 'simplify-cli[analytics]'``).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from simplify_cli.api.tracker_replica import REPLICA_FILE, _where
+from simplify_cli.api.tracker_stats import APPLIED_OR_LATER, INTERVIEWING, OFFER, REJECTED
+from simplify_cli.models.tracker import STATUS_MAP
+
+DAY = 86_400
+WEEK = 7 * DAY
+# The Unix epoch fell on a Thursday; shifting by three days makes weeks start on Monday.
+_MONDAY_SHIFT = 3 * DAY
+_MISSING = np.iinfo(np.int64).max
+
+PERCENTILES = (25, 50, 75, 90)
+MILESTONES = {"interview": INTERVIEWING, "offer": OFFER, "rejection": REJECTED}
+
+
+@dataclass
+class EventTable:
+    """Every status event as parallel arrays, sorted by item then time.
+
+    ``item`` indexes into ``item_ids`` and ``tracked``; timestamps are Unix
+    seconds. Events with unparseable timestamps are dropped on load.
+    """
+
+    item_ids: list[str]
+    tracked: np.ndarray  # int64, one per item
+    item: np.ndarray  # int32
+    status: np.ndarray  # int8
+    ts: np.ndarray  # int64
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+    @property
+    def n_items(self) -> int:
+        return len(self.item_ids)
+
+    def first_time(self, statuses: set[int]) -> np.ndarray:
+        """Per item, the earliest timestamp of any of ``statuses`` (``_MISSING`` if none)."""
+        first = np.full(self.n_items, _MISSING, dtype=np.int64)
+        mask = np.isin(self.status, list(statuses))
+        np.minimum.at(first, self.item[mask], self.ts[mask])
+        return first
+
+
+def load_events(
+    *,
+    status: str | None = None,
+    company: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    path: Path = REPLICA_FILE,
+) -> EventTable:
+    """Load the events of the items matching the ``tracker list`` filters."""
+    where, params = _where(status, company, since, until)
+    db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        # SQLite parses the ISO timestamps (including 'Z' and offsets) far faster than Python.
+        items = db.execute(
+            f"SELECT id, CAST(strftime('%s', tracked_date) AS INTEGER) FROM items {where} ORDER BY id",
+            params,
+        ).fetchall()
+        rows = db.execute(
+            "SELECT status_events.item_id, status_events.status, "
+            "CAST(strftime('%s', status_events.timestamp) AS INTEGER) "
+            f"FROM status_events JOIN items ON items.id = status_events.item_id {where}",
+            params,
+        ).fetchall()
+    finally:
+        db.close()
+
+    item_ids = [item_id for item_id, _ in items]
+    index = {item_id: i for i, item_id in enumerate(item_ids)}
+    tracked = np.array([t if t is not None else _MISSING for _, t in items], dtype=np.int64)
+
+    rows = [row for row in rows if row[2] is not None]
+    item = np.fromiter((index[r[0]] for r in rows), dtype=np.int32, count=len(rows))
+    event_status = np.fromiter((r[1] for r in rows), dtype=np.int8, count=len(rows))
+    ts = np.fromiter((r[2] for r in rows), dtype=np.int64, count=len(rows))
+
+    order = np.lexsort((ts, item))
+    return EventTable(item_ids, tracked, item[order], event_status[order], ts[order])
+
+
+def _distribution(seconds: np.ndarray) -> dict[str, Any]:
+    days = seconds / DAY
+    if not len(days):
+        return {"count": 0, "mean": None, **{f"p{p}": None for p in PERCENTILES}}
+    values = np.percentile(days, PERCENTILES)
+    return {
+        "count": int(len(days)),
+        "mean": round(float(days.mean()), 1),
+        **{f"p{p}": round(float(v), 1) for p, v in zip(PERCENTILES, values)},
+    }
+
+
+def time_in_stage(events: EventTable, now: int | None = None) -> dict[str, dict[str, Any]]:
+    """Days spent in each status before the next event, per status.
+
+    Stays that have not ended yet are measured up to ``now`` and reported
+    separately as ``open`` so they do not skew the completed distribution.
+    """
+    now = int(time.time()) if now is None else now
+    if not len(events):
+        return {}
+    same_item = np.append(events.item[1:] == events.item[:-1], False)
+    ends = np.where(same_item, np.append(events.ts[1:], 0), now)
+    durations = ends - events.ts
+
+    result = {}
+    for code, name in STATUS_MAP.items():
+        mask = events.status == code
+        if not mask.any():
+            continue
+        result[name.lower()] = {
+            **_distribution(durations[mask & same_item]),
+            "open": _distribution(durations[mask & ~same_item]),
+        }
+    return result
+
+
+def time_to_milestones(events: EventTable) -> dict[str, dict[str, Any]]:
+    """Days from application to the first interview, offer and rejection."""
+    applied = events.first_time(APPLIED_OR_LATER)
+    result = {}
+    for name, code in MILESTONES.items():
+        reached = events.first_time({code})
+        ok = (applied != _MISSING) & (reached != _MISSING)
+        delta = reached[ok] - applied[ok]
+        result[name] = _distribution(delta[delta >= 0])
+    return result
+
+
+def cohorts(events: EventTable) -> list[dict[str, Any]]:
+    """Funnel counts and rates per week the job was first tracked."""
+    known = events.tracked != _MISSING
+    if not known.any():
+        return []
+    week = (events.tracked + _MONDAY_SHIFT) // WEEK
+    first_week = int(week[known].min())
+    slot = np.where(known, week - first_week, -1)
+    n_weeks = int(slot.max()) + 1
+
+    def per_week(flags: np.ndarray) -> np.ndarray:
+        return np.bincount(slot[known & flags], minlength=n_weeks)
+
+    everything = np.ones(events.n_items, dtype=bool)
+    applied = events.first_time(APPLIED_OR_LATER) != _MISSING
+    interviewed = events.first_time({INTERVIEWING, OFFER}) != _MISSING
+    offered = events.first_time({OFFER}) != _MISSING
+    rejected = events.first_time({REJECTED}) != _MISSING
+    counts = {
+        "tracked": per_week(everything),
+        "applied": per_week(applied),
+        "interviewed": per_week(interviewed),
+        "offered": per_week(offered),
+        "rejected": per_week(rejected),
+    }
+
+    rows = []
+    for i in range(n_weeks):
+        if not counts["tracked"][i]:
+            continue
+        start = (first_week + i) * WEEK - _MONDAY_SHIFT
+        row: dict[str, Any] = {
+            "week": datetime.fromtimestamp(start, timezone.utc).date().isoformat(),
+            **{name: int(c[i]) for name, c in counts.items()},
+        }
+        apps = row["applied"]
+        row["interview_rate"] = round(100 * row["interviewed"] / apps, 1) if apps else None
+        row["offer_rate"] = round(100 * row["offered"] / apps, 1) if apps else None
+        rows.append(row)
+    return rows
+
+
+def funnel_report(events: EventTable, now: int | None = None) -> dict[str, Any]:
+    return {
+        "items": events.n_items,
+        "events": len(events),
+        "time_in_stage": time_in_stage(events, now),
+        "time_to": time_to_milestones(events),
+        "cohorts": cohorts(events),
+    }
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import json as _json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from simplify_cli.api.client import SimplifyAPIClient
+from simplify_cli.api.tracker import iter_tracker_pages
+from simplify_cli.config import CONFIG_DIR, ensure_config_dir
+from simplify_cli.decode import decode, loads
+from simplify_cli.models.tracker import STATUS_MAP, TrackerPage
+
+REPLICA_FILE = CONFIG_DIR / "tracker.db"
+
+# Page size used when refreshing; larger pages mean fewer round trips.
+REFRESH_PAGE_SIZE = 100
+
+# tracker list --sort choices mapped to ORDER BY expressions.
+SORT_COLUMNS = {
+    "tracked": "tracked_date",
+    "updated": "last_event",
+    "status": "current_status",
+    "company": "company_name COLLATE NOCASE",
+    "title": "title COLLATE NOCASE",
+}
+
+_STATUS_CODES = {name.lower(): code for code, name in STATUS_MAP.items()}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    job_posting_id TEXT,
+    title TEXT NOT NULL DEFAULT '',
+    company_name TEXT NOT NULL DEFAULT '',
+    tracked_date TEXT NOT NULL DEFAULT '',
+    current_status INTEGER NOT NULL DEFAULT 0,
+    last_event TEXT NOT NULL DEFAULT '',
+    doc TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_status ON items (current_status, tracked_date);
+CREATE INDEX IF NOT EXISTS items_tracked ON items (tracked_date);
+CREATE TABLE IF NOT EXISTS status_events (
+    item_id TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    timestamp TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS status_events_item ON status_events (item_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def _open(path: Path) -> sqlite3.Connection:
+    ensure_config_dir()
+    db = sqlite3.connect(path)
+    db.executescript(_SCHEMA)
+    return db
+
+
+def _latest_event(item: dict[str, Any]) -> tuple[int, str]:
+    events = item.get("status_events") or []
+    if not events:
+        return 0, ""
+    latest = max(events, key=lambda e: e.get("timestamp", ""))
+    return latest.get("status", 0), latest.get("timestamp", "")
+
+
+def _fingerprint(item: dict[str, Any]) -> tuple[str, str, int]:
+    events = item.get("status_events") or []
+    return item.get("tracked_date", ""), _latest_event(item)[1], len(events)
+
+
+def _meta_age(path: Path, key: str) -> float | None:
+    if not path.exists():
+        return None
+    db = sqlite3.connect(path)
+    try:
+        row = db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    finally:
+        db.close()
+    return time.time() - float(row[0]) if row else None
+
+
+def replica_age(path: Path = REPLICA_FILE) -> float | None:
+    """Seconds since the replica was last refreshed, or None if it was never built."""
+    return _meta_age(path, "refreshed_at")
+
+
+def full_refresh_age(path: Path = REPLICA_FILE) -> float | None:
+    """Seconds since the replica last had a full refresh, or None if it never had one."""
+    return _meta_age(path, "full_refreshed_at")
+
+
+def invalidate_replica(path: Path = REPLICA_FILE) -> None:
+    """Mark the replica stale so the next read does a full refresh.
+
+    A change made through the API can touch an item on any page, which an
+    incremental refresh would stop short of, so the full-refresh time goes too.
+    """
+    if not path.exists():
+        return
+    db = sqlite3.connect(path)
+    try:
+        with db:
+            db.execute("DELETE FROM meta WHERE key IN ('refreshed_at', 'full_refreshed_at')")
+    except sqlite3.OperationalError:
+        pass
+    finally:
+        db.close()
+
+
+def refresh_replica(
+    client: SimplifyAPIClient,
+    *,
+    workers: int = 4,
+    full: bool = False,
+    path: Path = REPLICA_FILE,
+) -> dict[str, int]:
+    """Bring the replica in line with the live tracker.
+
+    An item is only rewritten when its tracked date, newest status-event
+    timestamp or event count differs from the stored copy.
+
+    By default the refresh is incremental: the API lists the newest tracked
+    items first, so the crawl stops at the first full page whose items all
+    match the replica. Status changes to older items and items removed on
+    Simplify are only picked up by a ``full`` refresh, which reads every page
+    and drops whatever the API no longer returns; ``invalidate_replica``
+    forces one after the CLI changes an item. If the pages turn out not
+    to be newest-first, the incremental refresh reads every page as well.
+    """
+    db = _open(path)
+    try:
+        known: dict[str, tuple[str, str, int]] = {}
+        counts = dict(db.execute("SELECT item_id, COUNT(*) FROM status_events GROUP BY item_id").fetchall())
+        for item_id, tracked, last_event in db.execute("SELECT id, tracked_date, last_event FROM items"):
+            known[item_id] = (tracked, last_event, counts.get(item_id, 0))
+
+        seen: set[str] = set()
+        added = updated = pages = 0
+        newest_first = True
+        previous_tracked: str | None = None
+        with db:
+            for data in iter_tracker_pages(client, size=REFRESH_PAGE_SIZE, workers=workers):
+                pages += 1
+                items = data.get("items", [])
+                changed = False
+                for item in items:
+                    item_id = item.get("id", "")
+                    seen.add(item_id)
+                    tracked = item.get("tracked_date", "")
+                    if previous_tracked is not None and tracked > previous_tracked:
+                        newest_first = False
+                    previous_tracked = tracked
+                    previous = known.get(item_id)
+                    if previous == _fingerprint(item):
+                        continue
+                    changed = True
+                    if previous is None:
+                        added += 1
+                    else:
+                        updated += 1
+                    _store_item(db, item)
+                if not full and newest_first and not changed and len(items) == REFRESH_PAGE_SIZE:
+                    break
+            else:
+                full = True
+
+            removed = [item_id for item_id in known if item_id not in seen] if full else []
+            db.executemany("DELETE FROM items WHERE id = ?", [(i,) for i in removed])
+            db.executemany("DELETE FROM status_events WHERE item_id = ?", [(i,) for i in removed])
+            now = str(time.time())
+            db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('refreshed_at', ?)", (now,))
+            if full:
+                db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('full_refreshed_at', ?)", (now,))
+            (total,) = db.execute("SELECT COUNT(*) FROM items").fetchone()
+    finally:
+        db.close()
+    return {
+        "added": added,
+        "updated": updated,
+        "removed": len(removed),
+        "total": total,
+        "pages": pages,
+        "full": full,
+    }
+
+
+def _store_item(db: sqlite3.Connection, item: dict[str, Any]) -> None:
+    item_id = item.get("id", "")
+    status, last_event = _latest_event(item)
+    company = item.get("company") or {}
+    db.execute(
+        "INSERT OR REPLACE INTO items (id, job_posting_id, title, company_name, tracked_date, "
+        "current_status, last_event, doc) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            item_id,
+            item.get("job_posting_id"),
+            item.get("job_posting_title", ""),
+            company.get("name", ""),
+            item.get("tracked_date", ""),
+            status,
+            last_event,
+            _json.dumps(item),
+        ),
+    )
+    db.execute("DELETE FROM status_events WHERE item_id = ?", (item_id,))
+    db.executemany(
+        "INSERT INTO status_events (item_id, status, timestamp) VALUES (?, ?, ?)",
+        [(item_id, e.get("status", 0), e.get("timestamp", "")) for e in item.get("status_events") or []],
+    )
+
+
+def _where(
+    status: str | None,
+    company: str | None,
+    since: str | None,
+    until: str | None,
+) -> tuple[str, list[Any]]:
+    clauses: list[str] = []
+    params: list[Any] = []
+    if status:
+        clauses.append("current_status = ?")
+        params.append(_STATUS_CODES.get(status.lower(), -1))
+    if company:
+        clauses.append("company_name LIKE ?")
+        params.append(f"%{company}%")
+    if since:
+        clauses.append("tracked_date >= ?")
+        params.append(since)
+    if until:
+        # Dates compare as ISO strings; pad a bare date to the end of that day.
+        clauses.append("tracked_date <= ?")
+        params.append(until if "T" in until else f"{until}T23:59:59.999999Z")
+    return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+
+def query_replica_json(
+    *,
+    status: str | None = None,
+    company: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    sort: str = "tracked",
+    descending: bool = True,
+    page: int = 1,
+    size: int = 20,
+    path: Path = REPLICA_FILE,
+) -> str:
+    """Return one page of replica items as the JSON text ``list_tracker`` would send.
+
+    The stored item documents are spliced in as-is, so the page can be
+    decoded in a single pass without re-serialising each item.
+    """
+    where, params = _where(status, company, since, until)
+    order = f"{SORT_COLUMNS[sort]} {'DESC' if descending else 'ASC'}, id"
+    db = sqlite3.connect(path)
+    try:
+        (total,) = db.execute(f"SELECT COUNT(*) FROM items {where}", params).fetchone()
+        rows = db.execute(
+            f"SELECT doc FROM items {where} ORDER BY {order} LIMIT ? OFFSET ?",
+            [*params, size, (page - 1) * size],
+        ).fetchall()
+    finally:
+        db.close()
+    pages = max(1, (total + size - 1) // size)
+    items = ",".join(doc for (doc,) in rows)
+    return f'{{"total":{total},"items":[{items}],"page":{page},"size":{size},"pages":{pages}}}'
+
+
+def query_replica(**kwargs: Any) -> dict[str, Any]:
+    """Return one page of replica items in the same shape as ``list_tracker``."""
+    return loads(query_replica_json(**kwargs))
+
+
+def query_replica_page(**kwargs: Any) -> TrackerPage:
+    """Return one page of replica items decoded into a ``TrackerPage``."""
+    return decode(query_replica_json(**kwargs), TrackerPage)
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import sqlite3
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from simplify_cli.api.tracker_replica import REPLICA_FILE, _where
+from simplify_cli.models.tracker import STATUS_MAP
+
+SAVED, APPLIED, INTERVIEWING, OFFER, REJECTED, WITHDRAWN = 1, 2, 3, 4, 5, 6
+
+# Any of these means the application was sent, even without an explicit Applied event.
+APPLIED_OR_LATER = {APPLIED, INTERVIEWING, OFFER, REJECTED}
+# Events that count as the employer responding to an application.
+RESPONSES = {INTERVIEWING, OFFER, REJECTED}
+
+STAGE_NAMES = [name.lower() for name in STATUS_MAP.values()]
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+def _parse_ts(value: str) -> datetime | None:
+    try:
+        ts = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def _week_start(ts: datetime) -> date:
+    day = ts.date()
+    return day - timedelta(days=day.weekday())
+
+
+def _percent(part: int, whole: int) -> float | None:
+    return round(100 * part / whole, 1) if whole else None
+
+
+def _load_events(
+    path: Path,
+    status: str | None,
+    company: str | None,
+    since: str | None,
+    until: str | None,
+) -> dict[str, list[tuple[int, datetime]]]:
+    where, params = _where(status, company, since, until)
+    db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        rows = db.execute(
+            "SELECT items.id, status_events.status, status_events.timestamp FROM items "
+            f"LEFT JOIN status_events ON status_events.item_id = items.id {where}",
+            params,
+        ).fetchall()
+    finally:
+        db.close()
+
+    events: dict[str, list[tuple[int, datetime]]] = {}
+    for item_id, event_status, timestamp in rows:
+        item_events = events.setdefault(item_id, [])
+        ts = _parse_ts(timestamp) if timestamp else None
+        if ts is not None:
+            item_events.append((event_status, ts))
+    for item_events in events.values():
+        item_events.sort(key=lambda e: e[1])
+    return events
+
+
+def compute_stats(
+    *,
+    status: str | None = None,
+    company: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+    ghost_days: int = 30,
+    now: datetime | None = None,
+    path: Path = REPLICA_FILE,
+) -> dict[str, Any]:
+    """Compute tracker statistics from the status events in the local replica.
+
+    Filters select items the same way as ``tracker list``. An item counts
+    as an application from its first Applied (or later) event; it is a ghost
+    when ``ghost_days`` have passed since then without an interview, offer
+    or rejection.
+    """
+    now = now or datetime.now(timezone.utc)
+    events = _load_events(path, status, company, since, until)
+
+    reached: Counter[int] = Counter()
+    interviews = 0
+    weekly: dict[date, Counter[str]] = defaultdict(Counter)
+    applied_at: list[datetime] = []
+    response_days: list[float] = []
+    ghosts = ghost_eligible = 0
+
+    for item_events in events.values():
+        stages = {s for s, _ in item_events}
+        reached.update(stages)
+        # An offer implies an interview even if that step was never recorded.
+        interviews += bool(stages & {INTERVIEWING, OFFER})
+        for event_status, ts in item_events:
+            weekly[_week_start(ts)][STATUS_MAP.get(event_status, "").lower()] += 1
+
+        applied = next((ts for s, ts in item_events if s in APPLIED_OR_LATER), None)
+        if applied is None:
+            continue
+        applied_at.append(applied)
+        response = next((ts for s, ts in item_events if s in RESPONSES and ts >= applied), None)
+        if response is not None:
+            response_days.append((response - applied).total_seconds() / 86400)
+        elif now - applied < timedelta(days=ghost_days):
+            continue
+        ghost_eligible += 1
+        ghosts += response is None
+
+    applications = len(applied_at)
+    offers = reached[OFFER]
+
+    active_weeks = len({_week_start(ts) for ts in applied_at})
+    active_months = len({(ts.year, ts.month) for ts in applied_at})
+    weekdays = Counter(ts.weekday() for ts in applied_at)
+    busiest = weekdays.most_common(1)
+
+    series = []
+    if weekly:
+        week, last = min(weekly), max(weekly)
+        while week <= last:
+            counts = weekly.get(week, Counter())
+            series.append({"week": week.isoformat(), **{name: counts[name] for name in STAGE_NAMES}})
+            week += timedelta(weeks=1)
+
+    return {
+        "items": len(events),
+        "counts": {
+            "saved": reached[SAVED],
+            "applications": applications,
+            "interviews": interviews,
+            "offers": offers,
+            "rejections": reached[REJECTED],
+            "withdrawn": reached[WITHDRAWN],
+        },
+        "conversion_rates": {
+            "application_to_interview": _percent(interviews, applications),
+            "interview_to_offer": _percent(offers, interviews),
+            "application_to_offer": _percent(offers, applications),
+        },
+        "ghost_rate_percent": _percent(ghosts, ghost_eligible),
+        "average_days_to_first_response": (
+            round(sum(response_days) / len(response_days), 1) if response_days else None
+        ),
+        "average_applications": {
+            "weekly": round(applications / active_weeks, 1) if active_weeks else 0,
+            "monthly": round(applications / active_months, 1) if active_months else 0,
+        },
+        "active_weeks": active_weeks,
+        "most_active_weekday": (
+            {"name": WEEKDAYS[busiest[0][0]], "applications": busiest[0][1]} if busiest else None
+        ),
+        "weekly": series,
+    }
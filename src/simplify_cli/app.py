@@ -1,18 +1,81 @@
+"""The ``simplify`` entry point.
+
+Command groups are registered by module path and imported only when one is
+dispatched to, so ``simplify --help`` and shell completion do not pay for
+httpx, pydantic, keyring and the display layer. ``tests/test_importtime.py``
+(budgets in ``benchmarks/importtime.py``) checks that this stays true.
+"""
+
+from __future__ import annotations
+
+import importlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
 import typer
+import typer.main
+from typer.core import TyperGroup
+
+# Group name -> (module:attribute of its Typer app, help shown before it is imported).
+COMMAND_GROUPS = {
+    "auth": ("simplify_cli.commands.auth_cmd:auth_app", "Authentication commands"),
+    "jobs": ("simplify_cli.commands.jobs_cmd:jobs_app", "Job search commands"),
+    "tracker": ("simplify_cli.commands.tracker_cmd:tracker_app", "Application tracker commands"),
+    "profile": ("simplify_cli.commands.profile_cmd:profile_app", "Profile commands"),
+    "cache": ("simplify_cli.commands.cache_cmd:cache_app", "Search response cache commands"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Root group whose command groups are imported on first dispatch.
+
+    Until then each group is a placeholder carrying only its help text,
+    which is all that ``--help`` listings, completion and typo suggestions
+    need.
+    """
+
+    def __init__(self, **attrs: Any) -> None:
+        super().__init__(**attrs)
+        self._listing = False
+        for name, (_, short_help) in COMMAND_GROUPS.items():
+            self.commands.setdefault(name, TyperGroup(name=name, help=short_help))
+        self._unloaded = set(COMMAND_GROUPS)
+
+    @contextmanager
+    def _list_only(self) -> Iterator[None]:
+        self._listing = True
+        try:
+            yield
+        finally:
+            self._listing = False
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        if cmd_name in self._unloaded and not self._listing:
+            module, attr = COMMAND_GROUPS[cmd_name][0].split(":")
+            group = typer.main.get_group(getattr(importlib.import_module(module), attr))
+            group.name = cmd_name
+            self.commands[cmd_name] = group
+            self._unloaded.discard(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_help(self, ctx: Any, formatter: Any) -> None:
+        with self._list_only():
+            super().format_help(ctx, formatter)
+
+    def shell_complete(self, ctx: Any, incomplete: str) -> list[Any]:
+        with self._list_only():
+            return super().shell_complete(ctx, incomplete)
 
-from simplify_cli.commands.auth_cmd import auth_app
-from simplify_cli.commands.jobs_cmd import jobs_app
-from simplify_cli.commands.profile_cmd import profile_app
-from simplify_cli.commands.tracker_cmd import tracker_app
 
 app = typer.Typer(
     name="simplify",
-    help="CLI for Simplify.jobs — browse jobs, manage tracker, view profile.",
+    cls=LazyGroup,
     no_args_is_help=True,
     pretty_exceptions_short=True,
 )
 
-app.add_typer(auth_app, name="auth")
-app.add_typer(jobs_app, name="jobs")
-app.add_typer(tracker_app, name="tracker")
-app.add_typer(profile_app, name="profile")
+
+@app.callback()
+def main() -> None:
+    """CLI for Simplify.jobs — browse jobs, manage tracker, view profile."""
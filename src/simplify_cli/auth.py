@@ -1,39 +1,190 @@
 from __future__ import annotations
 
+import json
 import os
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-import keyring
+from simplify_cli.config import CONFIG_DIR, ensure_config_dir, load_config
+
+# keyring and cryptography are imported where they are used: loading keyring's
+# backends is slow, and credentials from the environment need neither.
 
 SERVICE_NAME = "simplify-cli"
+# Both tokens as one JSON entry, so reading them is a single keyring lookup.
+CREDENTIALS_ACCOUNT = "credentials"
+# Per-token entries written by older versions; still read, and removed on logout.
 CSRF_ACCOUNT = "csrf_token"
 AUTH_ACCOUNT = "authorization_token"
 
+# [auth] store = "file" keeps the tokens here, encrypted, instead of in the keyring.
+TOKEN_FILE = CONFIG_DIR / "credentials.enc"
+TOKEN_KEY_FILE = CONFIG_DIR / "credentials.key"
+TOKEN_KEY_ENV = "SIMPLIFY_TOKEN_KEY"
+STORES = ("keyring", "file")
 
-def store_tokens(csrf: str, authorization: str) -> None:
-    keyring.set_password(SERVICE_NAME, CSRF_ACCOUNT, csrf)
-    keyring.set_password(SERVICE_NAME, AUTH_ACCOUNT, authorization)
+if TYPE_CHECKING:
+    from cryptography.fernet import Fernet
+
+_lock = threading.Lock()
+_cached: tuple[str, str] | None = None
+_loaded = False
+
+
+class CredentialStoreError(RuntimeError):
+    """Raised when the configured token store cannot be read."""
+
+
+def token_store() -> str:
+    store = load_config()["auth"]["store"]
+    if store not in STORES:
+        raise CredentialStoreError(f"[auth] store must be one of {', '.join(STORES)}, not {store!r}")
+    return store
+
+
+def get_credentials() -> tuple[str, str] | None:
+    """Return ``(csrf, authorization)``, or None when not logged in.
+
+    The pair is looked up once per process and then memoized. Either
+    ``SIMPLIFY_CSRF_TOKEN`` or ``SIMPLIFY_AUTH_TOKEN`` overrides the stored
+    value; with both set the store is never touched.
+    """
+    global _cached, _loaded
+    with _lock:
+        if not _loaded:
+            _cached = _read_credentials()
+            _loaded = True
+        return _cached
+
+
+def _read_credentials() -> tuple[str, str] | None:
+    csrf = os.environ.get("SIMPLIFY_CSRF_TOKEN")
+    auth = os.environ.get("SIMPLIFY_AUTH_TOKEN")
+    if csrf and auth:
+        return csrf, auth
+    stored = _read_file() if token_store() == "file" else _read_keyring()
+    if stored is None:
+        return None
+    return csrf or stored[0], auth or stored[1]
+
+
+def _forget() -> None:
+    global _cached, _loaded
+    with _lock:
+        _cached, _loaded = None, False
 
 
 def get_csrf_token() -> str | None:
-    token = os.environ.get("SIMPLIFY_CSRF_TOKEN")
-    if token:
-        return token
-    return keyring.get_password(SERVICE_NAME, CSRF_ACCOUNT)
+    credentials = get_credentials()
+    return credentials[0] if credentials else None
 
 
 def get_auth_token() -> str | None:
-    token = os.environ.get("SIMPLIFY_AUTH_TOKEN")
-    if token:
-        return token
-    return keyring.get_password(SERVICE_NAME, AUTH_ACCOUNT)
+    credentials = get_credentials()
+    return credentials[1] if credentials else None
+
+
+def store_tokens(csrf: str, authorization: str) -> None:
+    """Save the pair to the configured store."""
+    if token_store() == "file":
+        _write_file(csrf, authorization)
+    else:
+        import keyring
+
+        keyring.set_password(SERVICE_NAME, CREDENTIALS_ACCOUNT, json.dumps([csrf, authorization]))
+    _forget()
 
 
 def delete_tokens() -> None:
-    for account in (CSRF_ACCOUNT, AUTH_ACCOUNT):
-        try:
-            keyring.delete_password(SERVICE_NAME, account)
-        except keyring.errors.PasswordDeleteError:
-            pass
+    """Remove stored credentials from the keyring and the token file."""
+    TOKEN_FILE.unlink(missing_ok=True)
+    if token_store() == "keyring":
+        import keyring
+        import keyring.errors
+
+        for account in (CREDENTIALS_ACCOUNT, CSRF_ACCOUNT, AUTH_ACCOUNT):
+            try:
+                keyring.delete_password(SERVICE_NAME, account)
+            except keyring.errors.PasswordDeleteError:
+                pass
+    _forget()
+
+
+def _read_keyring() -> tuple[str, str] | None:
+    import keyring
+
+    value = keyring.get_password(SERVICE_NAME, CREDENTIALS_ACCOUNT)
+    if value:
+        csrf, auth = json.loads(value)
+        return csrf, auth
+    csrf = keyring.get_password(SERVICE_NAME, CSRF_ACCOUNT)
+    auth = keyring.get_password(SERVICE_NAME, AUTH_ACCOUNT) if csrf else None
+    if not csrf or not auth:
+        return None
+    # Move a login from an older version to the single entry so later runs do one lookup.
+    keyring.set_password(SERVICE_NAME, CREDENTIALS_ACCOUNT, json.dumps([csrf, auth]))
+    return csrf, auth
+
+
+def _fernet(create: bool = False) -> Fernet | None:
+    """Build the cipher for the token file.
+
+    The key comes from ``SIMPLIFY_TOKEN_KEY`` when set; otherwise from
+    ``TOKEN_KEY_FILE``, which is generated on first login. Keep the key in
+    the environment (a CI secret, systemd credential, ...) for the file to
+    be safe at rest on its own.
+    """
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError:
+        raise CredentialStoreError(
+            "The file token store needs the cryptography package (pip install 'simplify-cli[file-store]')"
+        ) from None
+
+    key = os.environ.get(TOKEN_KEY_ENV, "").encode()
+    if not key:
+        if not TOKEN_KEY_FILE.exists():
+            if not create:
+                return None
+            ensure_config_dir()
+            _write_private(TOKEN_KEY_FILE, Fernet.generate_key())
+        key = TOKEN_KEY_FILE.read_bytes().strip()
+    try:
+        return Fernet(key)
+    except ValueError:
+        raise CredentialStoreError(f"{TOKEN_KEY_ENV} is not a valid key (32 url-safe base64-encoded bytes)") from None
+
+
+def _read_file() -> tuple[str, str] | None:
+    if not TOKEN_FILE.exists():
+        return None
+    fernet = _fernet()
+    if fernet is None:
+        raise CredentialStoreError(f"No key for {TOKEN_FILE}: set {TOKEN_KEY_ENV} or log in again")
+    from cryptography.fernet import InvalidToken
+
+    try:
+        csrf, auth = json.loads(fernet.decrypt(TOKEN_FILE.read_bytes()))
+    except InvalidToken:
+        raise CredentialStoreError(f"Cannot decrypt {TOKEN_FILE}: wrong key? Log in again to replace it") from None
+    return csrf, auth
+
+
+def _write_file(csrf: str, authorization: str) -> None:
+    ensure_config_dir()
+    fernet = _fernet(create=True)
+    tmp = TOKEN_FILE.with_suffix(".tmp")
+    _write_private(tmp, fernet.encrypt(json.dumps([csrf, authorization]).encode()))
+    os.replace(tmp, TOKEN_FILE)
+
+
+def _write_private(path: Path, data: bytes) -> None:
+    """Write ``data`` to a file only the current user can read."""
+    path.unlink(missing_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
 
 
 def try_browser_cookies() -> tuple[str, str] | None:
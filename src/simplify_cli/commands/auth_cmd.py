@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import typer
 from rich import print as rprint
+from rich.markup import escape
 
 from simplify_cli.auth import (
+    CredentialStoreError,
     delete_tokens,
-    get_auth_token,
-    get_csrf_token,
+    get_credentials,
     store_tokens,
+    token_store,
     try_browser_cookies,
 )
 
@@ -24,7 +26,7 @@ def login(
         result = try_browser_cookies()
         if result:
             csrf, auth = result
-            store_tokens(csrf, auth)
+            _store(csrf, auth)
             rprint("[green]Cookies extracted and stored successfully.[/green]")
             _verify_login()
             return
@@ -45,7 +47,7 @@ def login(
         rprint("[red]Both cookies are required.[/red]")
         raise typer.Exit(1)
 
-    store_tokens(csrf, auth)
+    _store(csrf, auth)
     rprint("[green]Tokens stored successfully.[/green]")
     _verify_login()
 
@@ -53,21 +55,40 @@ def login(
 @auth_app.command()
 def logout() -> None:
     """Clear stored credentials."""
-    delete_tokens()
+    try:
+        delete_tokens()
+    except CredentialStoreError as e:
+        _store_error(e)
     rprint("[green]Logged out. Credentials removed.[/green]")
 
 
 @auth_app.command()
 def status() -> None:
     """Show current authentication status."""
-    csrf = get_csrf_token()
-    auth = get_auth_token()
-    if not csrf or not auth:
+    try:
+        credentials = get_credentials()
+    except CredentialStoreError as e:
+        _store_error(e)
+    if credentials is None:
         rprint("[yellow]Not authenticated.[/yellow] Run [bold]simplify auth login[/bold]")
         raise typer.Exit(1)
     _verify_login()
 
 
+def _store(csrf: str, auth: str) -> None:
+    try:
+        store_tokens(csrf, auth)
+    except CredentialStoreError as e:
+        _store_error(e)
+    if token_store() == "file":
+        rprint("[dim]Saved to the encrypted token file.[/dim]")
+
+
+def _store_error(e: CredentialStoreError) -> None:
+    rprint(f"[red]Error:[/red] {escape(str(e))}")
+    raise typer.Exit(1)
+
+
 def _verify_login() -> None:
     """Try to fetch profile to verify credentials."""
     try:
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import typer
+from rich import print as rprint
+from rich.console import Console
+from rich.table import Table
+
+from simplify_cli.search.cache import ResponseCache
+
+cache_app = typer.Typer(help="Search response cache commands")
+console = Console()
+
+
+def _format_bytes(n: int) -> str:
+    size = float(n)
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{n} B"
+
+
+@cache_app.command()
+def stats(
+    output_json: bool = typer.Option(False, "--json", help="JSON output"),
+) -> None:
+    """Show cache hit ratio and disk usage."""
+    cache = ResponseCache()
+    try:
+        data = cache.stats()
+    finally:
+        cache.close()
+
+    if output_json:
+        # Only the JSON path needs the output helpers and the models they import.
+        from simplify_cli.display.output import write_json
+
+        write_json(data)
+        return
+
+    table = Table(title="Search Cache", show_lines=True)
+    table.add_column("Kind", style="bold")
+    table.add_column("Entries", justify="right")
+    table.add_column("Size", justify="right")
+    table.add_column("TTL", justify="right")
+    table.add_column("Hits", justify="right")
+    table.add_column("Stale", justify="right")
+    table.add_column("Misses", justify="right")
+    table.add_column("Hit ratio", justify="right")
+    for kind, k in data["kinds"].items():
+        table.add_row(
+            kind,
+            str(k["entries"]),
+            _format_bytes(k["bytes"]),
+            f"{k['ttl']}s",
+            str(k["hits"]),
+            str(k["stale_hits"]),
+            str(k["misses"]),
+            f"{k['hit_ratio']:.0%}",
+        )
+    console.print(table)
+    rprint(
+        f"[dim]{data['path']} — {_format_bytes(data['disk_bytes'])} on disk "
+        f"(cap {_format_bytes(data['max_bytes'])})[/dim]"
+    )
+
+
+@cache_app.command()
+def clear() -> None:
+    """Delete all cached responses and reset counters."""
+    cache = ResponseCache()
+    try:
+        removed = cache.clear()
+    finally:
+        cache.close()
+    rprint(f"[green]Cleared {removed} cached responses.[/green]")
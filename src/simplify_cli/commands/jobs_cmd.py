@@ -1,20 +1,69 @@
 from __future__ import annotations
 
-import json
+import sys
+import time
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
 
 import httpx
 import typer
 from rich import print as rprint
 from rich.console import Console
 
-from simplify_cli.display.panels import job_detail_panel
-from simplify_cli.display.tables import job_results_table
-from simplify_cli.models.job import Job
-from simplify_cli.search.client import get_job_by_id, search_jobs
+from simplify_cli.config import load_config
+from simplify_cli.display.output import OUTPUT_FORMATS, TABULAR_FORMATS, write_json, write_rows
+from simplify_cli.display.panels import JOB_DETAIL_FIELDS, job_detail_panel
+from simplify_cli.display.tables import (
+    JOB_TABLE_FIELDS,
+    facet_table,
+    grouped_results_table,
+    job_results_table,
+)
+from simplify_cli.models.job import JobBatch
+from simplify_cli.models.search import SearchResult
+from simplify_cli.search.client import (
+    MAX_PER_PAGE,
+    fetch_jobs_by_ids,
+    fetch_search,
+    fetch_searches,
+    get_facets,
+    get_jobs_by_ids,
+    iter_search_hits,
+    open_client,
+    run_searches,
+    search_jobs,
+)
+
+# The mirror, watch and browse modules are imported by the commands that use them.
+if TYPE_CHECKING:
+    from simplify_cli.search.browse import BrowseSession
 
 jobs_app = typer.Typer(help="Job search commands")
 console = Console()
 
+DEFAULT_FACET_FIELDS = ["experience_level", "functions", "type", "countries"]
+# Keys allowed in a [searches.<name>] table of config.toml.
+SAVED_SEARCH_KEYS = {"query", "location", "experience", "category", "job_type", "min_salary", "page", "per_page"}
+# --group-by choices mapped to the Typesense field to group on.
+GROUP_BY_FIELDS = {"company": "company_id"}
+# Fields poll_new_jobs needs to advance a watch's position.
+WATCH_MARK_FIELDS = ["updated_date", "posting_id"]
+
+# jobs browse keys, as typer.getchar() returns them (arrows are ANSI escape sequences).
+BROWSE_UP = ("k", "\x1b[A")
+BROWSE_DOWN = ("j", "\x1b[B")
+BROWSE_NEXT = ("n", "l", " ", "\x1b[C")
+BROWSE_PREV = ("p", "h", "\x1b[D")
+BROWSE_OPEN = ("\r", "\n", "o")
+BROWSE_BACK = ("b", "\x1b", "\x7f")
+BROWSE_QUIT = ("q", "\x03")
+
+
+def _parse_fields(fields: str | None) -> list[str] | None:
+    if not fields:
+        return None
+    return [f.strip() for f in fields.split(",") if f.strip()] or None
+
 
 @jobs_app.command()
 def search(
@@ -26,55 +75,529 @@ def search(
     min_salary: int | None = typer.Option(None, "-s", "--min-salary", help="Minimum salary"),
     page: int = typer.Option(1, "--page", help="Page number"),
     per_page: int = typer.Option(20, "--per-page", help="Results per page"),
-    output_json: bool = typer.Option(False, "--json", help="JSON output"),
+    output_json: bool = typer.Option(False, "--json", help="JSON output (same as --format json)"),
+    output_format: str | None = typer.Option(
+        None, "--format", help=f"Output format: {', '.join(OUTPUT_FORMATS)} (default: table, ndjson with --all)"
+    ),
+    all_results: bool = typer.Option(False, "--all", help="Stream every matching job (NDJSON unless --format is given)"),
+    max_results: int | None = typer.Option(None, "--max-results", help="Stream at most N jobs (implies --all)"),
+    workers: int = typer.Option(4, "--workers", help="Concurrent page requests for --all"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the local response cache"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached responses and re-fetch"),
+    offline: bool = typer.Option(False, "--offline", help="Search the local mirror built by 'jobs sync'"),
+    fields: str | None = typer.Option(None, "--fields", help="Comma-separated document fields for non-table output"),
+    group_by: str | None = typer.Option(None, "--group-by", help="Group results by company (one row per company)"),
+    group_limit: int = typer.Option(3, "--group-limit", help="Postings shown per group with --group-by"),
 ) -> None:
     """Search for jobs via Typesense."""
+    if output_format is not None and output_format not in OUTPUT_FORMATS:
+        rprint(f"[red]Error:[/red] --format must be one of {', '.join(OUTPUT_FORMATS)}")
+        raise typer.Exit(1)
+    streaming = all_results or max_results is not None
+    fmt = output_format or ("ndjson" if streaming else "json" if output_json else "table")
+    if streaming and fmt == "table":
+        rprint("[red]Error:[/red] --all and --max-results need a plain --format (tsv, csv, ndjson or json)")
+        raise typer.Exit(1)
+
+    if group_by is not None:
+        if group_by not in GROUP_BY_FIELDS:
+            rprint(f"[red]Error:[/red] --group-by must be one of {', '.join(GROUP_BY_FIELDS)}")
+            raise typer.Exit(1)
+        if offline or streaming:
+            rprint("[red]Error:[/red] --group-by cannot be combined with --offline, --all or --max-results")
+            raise typer.Exit(1)
+
+    if offline:
+        from simplify_cli.search.mirror import MIRROR_FILE
+
+        if not MIRROR_FILE.exists():
+            rprint("[red]Error:[/red] No local mirror. Run [bold]simplify jobs sync[/bold] first.", file=sys.stderr)
+            raise typer.Exit(1)
+
+    if streaming:
+        _stream_all(
+            fmt=fmt,
+            no_cache=no_cache,
+            refresh=refresh,
+            offline=offline,
+            query=query,
+            location=location,
+            experience=experience,
+            category=category,
+            job_type=job_type,
+            min_salary=min_salary,
+            max_results=max_results,
+            workers=workers,
+            include_fields=_parse_fields(fields) or (JOB_TABLE_FIELDS if fmt in TABULAR_FORMATS else None),
+        )
+        return
+
+    if fmt == "table":
+        include_fields = JOB_TABLE_FIELDS
+    else:
+        include_fields = _parse_fields(fields) or (JOB_TABLE_FIELDS if fmt in TABULAR_FORMATS else None)
+    grouping = {}
+    if group_by:
+        grouping = {"group_by": GROUP_BY_FIELDS[group_by], "group_limit": group_limit}
+        if include_fields:
+            include_fields = list(dict.fromkeys([*include_fields, GROUP_BY_FIELDS[group_by]]))
+    filters = {
+        "query": query,
+        "location": location,
+        "experience": experience,
+        "category": category,
+        "job_type": job_type,
+        "min_salary": min_salary,
+    }
+    try:
+        if offline:
+            from simplify_cli.search.mirror import fetch_mirror_search, search_mirror
+
+            params = {"page": page, "per_page": per_page, "include_fields": include_fields, **filters}
+            if fmt != "table":
+                data = search_mirror(**params)
+            else:
+                result = fetch_mirror_search(**params)
+        else:
+            with console.status("Searching jobs..."), open_client(use_cache=not no_cache, refresh=refresh) as client:
+                params = {"page": page, "per_page": per_page, "include_fields": include_fields, **grouping, **filters}
+                if fmt != "table":
+                    data = search_jobs(client=client, **params)
+                else:
+                    result = fetch_search(client=client, **params)
+    except httpx.HTTPStatusError as e:
+        rprint(f"[red]Search failed:[/red] {e.response.status_code}")
+        raise typer.Exit(1)
+    except httpx.ConnectError:
+        rprint("[red]Error:[/red] Could not connect to search service.")
+        raise typer.Exit(1)
+
+    if fmt == "json":
+        write_json(data)
+        return
+    if fmt != "table":
+        write_rows(_documents(data), fmt, include_fields)
+        return
+
+    if group_by:
+        _print_groups(result, page=page, per_page=per_page)
+        return
+
+    found = result.found
+    if not result.hits:
+        rprint("[yellow]No jobs found matching your criteria.[/yellow]")
+        return
+
+    table = job_results_table(result.jobs, page=page, total=found)
+    console.print(table)
+    total_pages = (found + per_page - 1) // per_page
+    rprint(f"[dim]Page {page}/{total_pages} ({found} total results)[/dim]")
+
+
+def _documents(data: dict) -> Iterator[dict]:
+    """The job documents of a raw search result, grouped or not."""
+    for hit in data.get("hits", []):
+        yield hit["document"]
+    for group in data.get("grouped_hits", []):
+        for hit in group.get("hits", []):
+            yield hit["document"]
+
+
+def _print_groups(result: SearchResult, *, page: int, per_page: int) -> None:
+    found = result.found
+    if not result.grouped_hits:
+        rprint("[yellow]No jobs found matching your criteria.[/yellow]")
+        return
+
+    groups = []
+    for group in result.grouped_hits:
+        jobs = [hit.document for hit in group.hits]
+        company = jobs[0].company_name if jobs else ", ".join(group.group_key)
+        groups.append((company, group.found or len(jobs), jobs))
+    console.print(grouped_results_table(groups, page=page, total=found))
+    total_pages = (found + per_page - 1) // per_page
+    rprint(f"[dim]Page {page}/{total_pages} ({found} companies, {result.found_docs} jobs)[/dim]")
+
+
+def _stream_all(
+    *,
+    fmt: str,
+    max_results: int | None,
+    workers: int,
+    no_cache: bool,
+    refresh: bool,
+    offline: bool,
+    **filters: str | int | list[str] | None,
+) -> None:
+    columns = filters["include_fields"] if fmt in TABULAR_FORMATS else None
+    if offline:
+        from simplify_cli.search.mirror import iter_mirror_hits
+
+        hits = iter_mirror_hits(max_results=max_results, **filters)
+        write_rows((hit["document"] for hit in hits), fmt, columns)
+        return
+
+    try:
+        with open_client(use_cache=not no_cache, refresh=refresh) as client:
+            hits = iter_search_hits(
+                max_results=max_results,
+                per_page=MAX_PER_PAGE,
+                workers=workers,
+                client=client,
+                **filters,
+            )
+            write_rows((hit["document"] for hit in hits), fmt, columns)
+    except httpx.HTTPStatusError as e:
+        rprint(f"[red]Search failed:[/red] {e.response.status_code}", file=sys.stderr)
+        raise typer.Exit(1)
+    except httpx.ConnectError:
+        rprint("[red]Error:[/red] Could not connect to search service.", file=sys.stderr)
+        raise typer.Exit(1)
+
+
+@jobs_app.command()
+def browse(
+    query: str = typer.Option("*", "-q", "--query", help="Search query"),
+    location: str | None = typer.Option(None, "-l", "--location", help="Country filter (e.g. United States)"),
+    experience: str | None = typer.Option(None, "-e", "--experience", help="Experience level"),
+    category: str | None = typer.Option(None, "-c", "--category", help="Job function/category"),
+    job_type: str | None = typer.Option(None, "-t", "--type", help="Job type (Full-Time, Internship, etc.)"),
+    min_salary: int | None = typer.Option(None, "-s", "--min-salary", help="Minimum salary"),
+    per_page: int = typer.Option(10, "--per-page", help="Results per page"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the local response cache"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached responses and re-fetch"),
+) -> None:
+    """Page through search results interactively; nearby pages and job details load in the background."""
+    if not sys.stdin.isatty() or not console.is_terminal:
+        rprint("[red]Error:[/red] jobs browse needs an interactive terminal; use [bold]jobs search[/bold] instead.")
+        raise typer.Exit(1)
+    from simplify_cli.search.browse import BrowseSession
+
+    filters = {
+        "query": query,
+        "location": location,
+        "experience": experience,
+        "category": category,
+        "job_type": job_type,
+        "min_salary": min_salary,
+    }
+    try:
+        with (
+            open_client(use_cache=not no_cache, refresh=refresh) as client,
+            BrowseSession(
+                client,
+                per_page=per_page,
+                page_fields=JOB_TABLE_FIELDS,
+                detail_fields=JOB_DETAIL_FIELDS,
+                **filters,
+            ) as session,
+        ):
+            _browse(session)
+    except httpx.HTTPStatusError as e:
+        rprint(f"[red]Search failed:[/red] {e.response.status_code}")
+        raise typer.Exit(1)
+    except httpx.ConnectError:
+        rprint("[red]Error:[/red] Could not connect to search service.")
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+def _browse(session: BrowseSession) -> None:
+    page, cursor, detail = 1, 0, False
+    while True:
+        if not session.page_ready(page):
+            with console.status(f"Loading page {page}..."):
+                session.page(page)
+        result = session.page(page)
+        session.prefetch_around(page)
+        jobs = result.jobs
+        if not jobs:
+            rprint("[yellow]No jobs found matching your criteria.[/yellow]")
+            return
+        last = session.pages(result)
+        cursor = min(cursor, len(jobs) - 1)
+
+        if detail and not session.detail_ready(jobs[cursor].id):
+            with console.status("Loading job..."):
+                session.detail(jobs[cursor].id)
+        console.clear()
+        if detail:
+            job = session.detail(jobs[cursor].id)
+            console.print(job_detail_panel(job) if job else "[yellow]This job is no longer listed.[/yellow]")
+            rprint(f"[dim]Job {cursor + 1}/{len(jobs)} on page {page}/{last} · ↑/↓ previous/next · b back · q quit[/dim]")
+        else:
+            console.print(job_results_table(jobs, page=page, total=result.found, selected=cursor))
+            rprint(f"[dim]Page {page}/{last} · ↑/↓ select · enter details · ←/→ page · q quit[/dim]")
+
+        key = typer.getchar()
+        if key in BROWSE_QUIT:
+            return
+        if key in BROWSE_OPEN:
+            detail = True
+        elif key in BROWSE_BACK:
+            detail = False
+        elif key in BROWSE_DOWN:
+            if cursor < len(jobs) - 1:
+                cursor += 1
+            elif page < last:
+                page, cursor = page + 1, 0
+        elif key in BROWSE_UP:
+            if cursor > 0:
+                cursor -= 1
+            elif page > 1:
+                # The previous page is always full, so its last row is per_page - 1.
+                page, cursor = page - 1, session.per_page - 1
+        elif key in BROWSE_NEXT and page < last:
+            page, cursor = page + 1, 0
+        elif key in BROWSE_PREV and page > 1:
+            page, cursor = page - 1, 0
+
+
+@jobs_app.command("run-saved")
+def run_saved(
+    names: list[str] | None = typer.Argument(None, help="Saved search names (default: all)"),
+    output_json: bool = typer.Option(False, "--json", help="JSON output"),
+    fields: str | None = typer.Option(None, "--fields", help="Comma-separated document fields for JSON output"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the local response cache"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached responses and re-fetch"),
+) -> None:
+    """Run saved searches from config.toml in a single request."""
+    saved = load_config()["searches"]
+    if not saved:
+        rprint("[yellow]No saved searches.[/yellow] Add [bold]\\[searches.<name>][/bold] tables to config.toml.")
+        raise typer.Exit(1)
+
+    names = names or list(saved)
+    unknown = [n for n in names if n not in saved]
+    if unknown:
+        rprint(f"[red]Unknown saved search:[/red] {', '.join(unknown)} [dim](available: {', '.join(saved)})[/dim]")
+        raise typer.Exit(1)
+    for n in names:
+        bad = set(saved[n]) - SAVED_SEARCH_KEYS
+        if bad:
+            rprint(f"[red]Invalid keys in saved search {n}:[/red] {', '.join(sorted(bad))}")
+            raise typer.Exit(1)
+
+    include_fields = _parse_fields(fields) if output_json else JOB_TABLE_FIELDS
     try:
-        with console.status("Searching jobs..."):
-            data = search_jobs(
+        with console.status("Running saved searches..."), open_client(use_cache=not no_cache, refresh=refresh) as client:
+            selected = {n: saved[n] for n in names}
+            if output_json:
+                results = run_searches(selected, client, include_fields)
+            else:
+                decoded = fetch_searches(selected, client, include_fields)
+    except httpx.HTTPStatusError as e:
+        rprint(f"[red]Search failed:[/red] {e.response.status_code}")
+        raise typer.Exit(1)
+    except httpx.ConnectError:
+        rprint("[red]Error:[/red] Could not connect to search service.")
+        raise typer.Exit(1)
+
+    if output_json:
+        write_json(results)
+        return
+
+    for name, result in decoded.items():
+        if result.error:
+            rprint(f"[bold]{name}[/bold]: [red]{result.error}[/red]")
+            continue
+        if not result.hits:
+            rprint(f"[bold]{name}[/bold]: [yellow]no jobs found[/yellow]")
+            continue
+        table = job_results_table(result.jobs, page=result.page, total=result.found)
+        table.title = f"{name} — {table.title}"
+        console.print(table)
+
+
+@jobs_app.command()
+def facets(
+    fields: list[str] | None = typer.Option(
+        None, "-f", "--field", help=f"Facet field (repeatable; default: {', '.join(DEFAULT_FACET_FIELDS)})"
+    ),
+    query: str = typer.Option("*", "-q", "--query", help="Search query"),
+    location: str | None = typer.Option(None, "-l", "--location", help="Country filter (e.g. United States)"),
+    experience: str | None = typer.Option(None, "-e", "--experience", help="Experience level"),
+    category: str | None = typer.Option(None, "-c", "--category", help="Job function/category"),
+    job_type: str | None = typer.Option(None, "-t", "--type", help="Job type (Full-Time, Internship, etc.)"),
+    min_salary: int | None = typer.Option(None, "-s", "--min-salary", help="Minimum salary"),
+    limit: int = typer.Option(30, "--limit", help="Maximum values per field"),
+    output_json: bool = typer.Option(False, "--json", help="JSON output"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the local response cache"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached responses and re-fetch"),
+) -> None:
+    """Count matching jobs per experience level, function, type or country."""
+    fields = fields or DEFAULT_FACET_FIELDS
+    try:
+        with console.status("Counting jobs..."), open_client(use_cache=not no_cache, refresh=refresh) as client:
+            found, counts = get_facets(
+                fields,
                 query=query,
                 location=location,
                 experience=experience,
                 category=category,
                 job_type=job_type,
                 min_salary=min_salary,
-                page=page,
-                per_page=per_page,
+                max_values=limit,
+                client=client,
             )
     except httpx.HTTPStatusError as e:
-        rprint(f"[red]Search failed:[/red] {e.response.status_code}")
+        rprint(f"[red]Facet lookup failed:[/red] {e.response.status_code}")
         raise typer.Exit(1)
     except httpx.ConnectError:
         rprint("[red]Error:[/red] Could not connect to search service.")
         raise typer.Exit(1)
 
     if output_json:
-        print(json.dumps(data, indent=2))
+        write_json({"found": found, "facets": {f: dict(c) for f, c in counts.items()}})
         return
 
-    hits = data.get("hits", [])
-    found = data.get("found", 0)
+    for field, values in counts.items():
+        console.print(facet_table(field, values, total=found))
 
-    if not hits:
-        rprint("[yellow]No jobs found matching your criteria.[/yellow]")
-        return
 
-    jobs = [Job.model_validate(hit["document"]) for hit in hits]
-    table = job_results_table(jobs, page=page, total=found)
-    console.print(table)
-    total_pages = (found + per_page - 1) // per_page
-    rprint(f"[dim]Page {page}/{total_pages} ({found} total results)[/dim]")
+@jobs_app.command()
+def sync(
+    partition_by: str = typer.Option(
+        "type", "--partition-by", help="Facet to split the crawl by (type, functions or experience_level)"
+    ),
+    workers: int = typer.Option(4, "--workers", help="Partitions crawled in parallel"),
+) -> None:
+    """Mirror the whole jobs collection locally for offline search."""
+    from simplify_cli.search.mirror import MIRROR_FILE, PARTITION_FIELDS, sync_mirror
+
+    if partition_by not in PARTITION_FIELDS:
+        rprint(f"[red]Error:[/red] --partition-by must be one of {', '.join(PARTITION_FIELDS)}")
+        raise typer.Exit(1)
+
+    try:
+        with console.status("Syncing jobs...") as status, open_client(use_cache=False) as client:
+            result = sync_mirror(
+                client,
+                partition_by=partition_by,
+                workers=workers,
+                progress=lambda n: status.update(f"Syncing jobs... {n:,} stored"),
+            )
+    except httpx.HTTPStatusError as e:
+        rprint(f"[red]Sync failed:[/red] {e.response.status_code}")
+        raise typer.Exit(1)
+    except httpx.ConnectError:
+        rprint("[red]Error:[/red] Could not connect to search service.")
+        raise typer.Exit(1)
+
+    rprint(
+        f"[green]Synced {result['count']:,} jobs[/green] "
+        f"[dim]({result['partitions']} {partition_by} partitions, {result['countries']} countries) to {MIRROR_FILE}[/dim]"
+    )
+    if result["missing"]:
+        rprint(
+            f"[yellow]Warning:[/yellow] the search reported {result['found']:,} jobs but "
+            f"{result['missing']:,} were not stored; the collection may have changed during the sync."
+        )
+
+
+@jobs_app.command()
+def watch(
+    query: str = typer.Option("*", "-q", "--query", help="Search query"),
+    location: str | None = typer.Option(None, "-l", "--location", help="Country filter (e.g. United States)"),
+    experience: str | None = typer.Option(None, "-e", "--experience", help="Experience level"),
+    category: str | None = typer.Option(None, "-c", "--category", help="Job function/category"),
+    job_type: str | None = typer.Option(None, "-t", "--type", help="Job type (Full-Time, Internship, etc.)"),
+    min_salary: int | None = typer.Option(None, "-s", "--min-salary", help="Minimum salary"),
+    interval: int | None = typer.Option(None, "--interval", help="Seconds between polls (default from config)"),
+    once: bool = typer.Option(False, "--once", help="Poll once and exit"),
+    name: str | None = typer.Option(None, "--name", help="Name for this watch's saved position"),
+    reset: bool = typer.Option(False, "--reset", help="Forget the saved position and start from now"),
+    output_json: bool = typer.Option(False, "--json", help="NDJSON output"),
+    fields: str | None = typer.Option(None, "--fields", help="Comma-separated document fields for NDJSON output"),
+) -> None:
+    """Poll for new or updated jobs matching a query."""
+    from simplify_cli.search.watch import load_watch_state, poll_new_jobs, save_watch_state, watch_key
+
+    include_fields = _parse_fields(fields) if output_json else JOB_TABLE_FIELDS
+    if include_fields:
+        include_fields = list(dict.fromkeys([*include_fields, *WATCH_MARK_FIELDS]))
+    filters = {
+        "query": query,
+        "location": location,
+        "experience": experience,
+        "category": category,
+        "job_type": job_type,
+        "min_salary": min_salary,
+    }
+    key = name or watch_key(filters)
+    if interval is None:
+        interval = load_config()["watch"]["interval"]
+
+    state = load_watch_state()
+    if reset:
+        state.pop(key, None)
+
+    try:
+        with open_client(use_cache=False) as client:
+            while True:
+                try:
+                    new, mark = poll_new_jobs(client, state.get(key), include_fields=include_fields, **filters)
+                except httpx.HTTPStatusError as e:
+                    rprint(f"[red]Poll failed:[/red] {e.response.status_code}", file=sys.stderr)
+                    new, mark = [], state.get(key)
+                except httpx.TransportError:
+                    rprint("[red]Error:[/red] Could not connect to search service.", file=sys.stderr)
+                    new, mark = [], state.get(key)
+
+                if mark is not None and mark != state.get(key):
+                    state[key] = mark
+                    save_watch_state(state)
+                _emit_new(new, output_json)
+
+                if once:
+                    return
+                time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def _emit_new(docs: list[dict], output_json: bool) -> None:
+    if output_json:
+        write_rows(docs, "ndjson")
+        return
+    stamp = time.strftime("%H:%M:%S")
+    if not docs:
+        rprint(f"[dim]{stamp} no new jobs[/dim]")
+        return
+    jobs = JobBatch.from_documents(docs)
+    console.print(job_results_table(jobs, total=len(jobs)))
+    rprint(f"[dim]{stamp} {len(jobs)} new jobs[/dim]")
 
 
 @jobs_app.command()
 def view(
-    job_id: str = typer.Argument(help="Job ID to view details"),
+    job_ids: list[str] | None = typer.Argument(None, help="Job IDs to view ('-' or piped input reads them from stdin)"),
     output_json: bool = typer.Option(False, "--json", help="JSON output"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the local response cache"),
+    refresh: bool = typer.Option(False, "--refresh", help="Ignore cached responses and re-fetch"),
+    fields: str | None = typer.Option(None, "--fields", help="Comma-separated document fields for JSON output"),
 ) -> None:
-    """View details for a specific job."""
+    """View details for one or more jobs."""
+    if job_ids == ["-"] or (not job_ids and not sys.stdin.isatty()):
+        job_ids = [line.strip() for line in sys.stdin if line.strip()]
+    elif not job_ids:
+        raise typer.BadParameter("give one or more job IDs, or '-' to read them from stdin", param_hint="'JOB_IDS...'")
+    if not job_ids:
+        rprint("[red]Error:[/red] No job IDs given.")
+        raise typer.Exit(1)
+
+    if output_json:
+        include_fields = _parse_fields(fields)
+    else:
+        include_fields = JOB_DETAIL_FIELDS if len(job_ids) == 1 else JOB_TABLE_FIELDS
+
     try:
-        with console.status("Fetching job details..."):
-            doc = get_job_by_id(job_id)
+        with console.status("Fetching job details..."), open_client(use_cache=not no_cache, refresh=refresh) as client:
+            if output_json:
+                docs, missing = get_jobs_by_ids(job_ids, client, include_fields)
+            else:
+                jobs, missing = fetch_jobs_by_ids(job_ids, client, include_fields)
     except httpx.HTTPStatusError as e:
         rprint(f"[red]Lookup failed:[/red] {e.response.status_code}")
         raise typer.Exit(1)
@@ -82,13 +605,21 @@ def view(
         rprint("[red]Error:[/red] Could not connect to search service.")
         raise typer.Exit(1)
 
-    if not doc:
-        rprint(f"[red]Job {job_id} not found.[/red]")
+    if len(job_ids) == 1 and missing:
+        rprint(f"[red]Job {job_ids[0]} not found.[/red]")
         raise typer.Exit(1)
 
     if output_json:
-        print(json.dumps(doc, indent=2))
+        write_json(docs[0] if len(job_ids) == 1 else {"jobs": docs, "not_found": missing})
+        return
+
+    if len(job_ids) == 1:
+        console.print(job_detail_panel(jobs[0]))
         return
 
-    job = Job.model_validate(doc)
-    console.print(job_detail_panel(job))
+    if jobs:
+        console.print(job_results_table(jobs, total=len(jobs)))
+    if missing:
+        rprint(f"[yellow]Not found ({len(missing)}):[/yellow] {', '.join(missing)}")
+    if not jobs:
+        raise typer.Exit(1)
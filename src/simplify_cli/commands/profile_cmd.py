@@ -1,14 +1,13 @@
 from __future__ import annotations
 
-import json
-
 import httpx
 import typer
 from rich import print as rprint
 from rich.console import Console
 
 from simplify_cli.api.client import SimplifyAPIClient
-from simplify_cli.api.profile import get_preferences, get_profile, get_resumes
+from simplify_cli.api.profile import fetch_profile, fetch_resumes, get_preferences, get_profile, get_resumes
+from simplify_cli.display.output import OUTPUT_FORMATS, TABULAR_FORMATS, preferences_row, write_json, write_rows
 from simplify_cli.display.panels import (
     education_table,
     experience_table,
@@ -16,11 +15,15 @@ from simplify_cli.display.panels import (
     profile_panel,
     resumes_table,
 )
-from simplify_cli.models.profile import Profile, Resume
 
 profile_app = typer.Typer(help="Profile commands")
 console = Console()
 
+PROFILE_COLUMNS = ["first_name", "last_name", "email", "phone", "location", "linkedin", "github", "website", "skills"]
+RESUME_COLUMNS = ["id", "name", "file_name", "date_generated", "date_last_edited", "default"]
+
+_FORMAT_OPT = typer.Option(None, "--format", help=f"Output format: {', '.join(OUTPUT_FORMATS)}")
+
 
 def _handle_api_error(e: httpx.HTTPStatusError) -> None:
     if e.response.status_code == 401:
@@ -30,22 +33,36 @@ def _handle_api_error(e: httpx.HTTPStatusError) -> None:
     raise typer.Exit(1)
 
 
+def _output_format(output_format: str | None, output_json: bool) -> str:
+    if output_format is not None and output_format not in OUTPUT_FORMATS:
+        rprint(f"[red]Error:[/red] --format must be one of {', '.join(OUTPUT_FORMATS)}")
+        raise typer.Exit(1)
+    return output_format or ("json" if output_json else "table")
+
+
+def _write(data: dict | list, fmt: str, columns: list[str] | None = None) -> None:
+    if fmt == "json":
+        write_json(data)
+    else:
+        write_rows(data if isinstance(data, list) else [data], fmt, columns)
+
+
 @profile_app.command()
 def show(
     output_json: bool = typer.Option(False, "--json", help="JSON output"),
+    output_format: str | None = _FORMAT_OPT,
 ) -> None:
     """Display your profile."""
+    fmt = _output_format(output_format, output_json)
     try:
         with SimplifyAPIClient() as client:
-            data = get_profile(client)
+            if fmt != "table":
+                _write(get_profile(client), fmt, PROFILE_COLUMNS if fmt in TABULAR_FORMATS else None)
+                return
+            profile = fetch_profile(client)
     except httpx.HTTPStatusError as e:
         _handle_api_error(e)
 
-    if output_json:
-        print(json.dumps(data, indent=2))
-        return
-
-    profile = Profile.model_validate(data)
     console.print(profile_panel(profile))
     if profile.education:
         console.print(education_table(profile.education))
@@ -56,16 +73,18 @@ def show(
 @profile_app.command()
 def preferences(
     output_json: bool = typer.Option(False, "--json", help="JSON output"),
+    output_format: str | None = _FORMAT_OPT,
 ) -> None:
     """Show your job preferences."""
+    fmt = _output_format(output_format, output_json)
     try:
         with SimplifyAPIClient() as client:
             data = get_preferences(client)
     except httpx.HTTPStatusError as e:
         _handle_api_error(e)
 
-    if output_json:
-        print(json.dumps(data, indent=2))
+    if fmt != "table":
+        _write(preferences_row(data) if fmt in TABULAR_FORMATS else data, fmt)
         return
 
     console.print(preferences_panel(data))
@@ -74,22 +93,26 @@ def preferences(
 @profile_app.command()
 def resumes(
     output_json: bool = typer.Option(False, "--json", help="JSON output"),
+    output_format: str | None = _FORMAT_OPT,
 ) -> None:
     """List your resumes."""
+    fmt = _output_format(output_format, output_json)
     try:
         with SimplifyAPIClient() as client:
-            data = get_resumes(client)
+            if fmt == "json":
+                write_json(get_resumes(client))
+                return
+            if fmt != "table":
+                data = get_resumes(client)
+                resume_rows = data.get("items", []) if isinstance(data, dict) else data
+                write_rows(resume_rows, fmt, RESUME_COLUMNS if fmt in TABULAR_FORMATS else None)
+                return
+            resume_list = fetch_resumes(client)
     except httpx.HTTPStatusError as e:
         _handle_api_error(e)
 
-    if output_json:
-        print(json.dumps(data, indent=2))
-        return
-
-    items = data.get("items", []) if isinstance(data, dict) else (data if isinstance(data, list) else [])
-    if not items:
+    if not resume_list:
         rprint("[yellow]No resumes found.[/yellow]")
         return
 
-    resume_list = [Resume.model_validate(r) for r in items]
     console.print(resumes_table(resume_list))
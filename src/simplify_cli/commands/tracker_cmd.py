@@ -1,28 +1,68 @@
 from __future__ import annotations
 
-import json
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import nullcontext
+from itertools import chain
 from pathlib import Path
 
 import httpx
 import typer
 from rich import print as rprint
 from rich.console import Console
+from rich.markup import escape
+from rich.progress import BarColumn, DownloadColumn, Progress, TextColumn, TransferSpeedColumn
 
 from simplify_cli.api.client import SimplifyAPIClient
 from simplify_cli.api.tracker import (
-    export_csv,
+    COMPRESSIONS,
+    compression_for,
+    download_csv,
+    enrich_items,
+    fetch_enrichment,
+    fetch_tracker_page,
+    fetch_tracker_pages,
     get_stats,
+    iter_tracker_pages,
     list_tracker,
     mark_applied,
+    part_path,
+    run_bulk,
     save_job,
     update_status,
 )
-from simplify_cli.display.tables import tracker_table
+from simplify_cli.api.tracker_replica import (
+    SORT_COLUMNS,
+    full_refresh_age,
+    invalidate_replica,
+    query_replica,
+    query_replica_page,
+    refresh_replica,
+    replica_age,
+)
+from simplify_cli.api.tracker_stats import compute_stats
+from simplify_cli.config import load_config
+from simplify_cli.display.output import (
+    OUTPUT_FORMATS,
+    TABULAR_FORMATS,
+    TRACKER_COLUMNS,
+    TRACKER_ENRICHED_COLUMNS,
+    tracker_row,
+    write_json,
+    write_rows,
+)
+from simplify_cli.display.tables import cohort_table, distribution_table, tracker_table
+from simplify_cli.models.job import Job
 from simplify_cli.models.tracker import TrackerPage, TrackerStatus
+from simplify_cli.search.client import TypesenseClient, open_client
 
 tracker_app = typer.Typer(help="Application tracker commands")
+bulk_app = typer.Typer(help="Apply tracker changes to many jobs at once")
+tracker_app.add_typer(bulk_app, name="bulk")
 console = Console()
 
+STATUS_VALUES = {s.value for s in TrackerStatus}
+
 
 def _handle_api_error(e: httpx.HTTPStatusError) -> None:
     if e.response.status_code == 401:
@@ -34,32 +74,234 @@ def _handle_api_error(e: httpx.HTTPStatusError) -> None:
 
 @tracker_app.command("list")
 def list_cmd(
-    status: str | None = typer.Option(None, "-s", "--status", help="Filter by status"),
+    status: str | None = typer.Option(
+        None, "-s", "--status", help="Only items currently in this status (filtered locally; by the API with --fresh)"
+    ),
     page: int = typer.Option(1, "-p", "--page", help="Page number"),
     size: int = typer.Option(20, "--size", help="Items per page"),
-    output_json: bool = typer.Option(False, "--json", help="JSON output"),
+    output_json: bool = typer.Option(False, "--json", help="JSON output (NDJSON with --all)"),
+    output_format: str | None = typer.Option(None, "--format", help=f"Output format: {', '.join(OUTPUT_FORMATS)}"),
+    all_pages: bool = typer.Option(False, "--all", help="List every tracked job"),
+    workers: int = typer.Option(4, "--workers", help="Concurrent page requests when fetching from the API"),
+    company: str | None = typer.Option(None, "--company", help="Filter by company name (substring)"),
+    since: str | None = typer.Option(None, "--since", help="Tracked on or after this date (YYYY-MM-DD)"),
+    until: str | None = typer.Option(None, "--until", help="Tracked on or before this date (YYYY-MM-DD)"),
+    sort: str = typer.Option("tracked", "--sort", help=f"Sort by {', '.join(SORT_COLUMNS)}"),
+    ascending: bool = typer.Option(False, "--asc", help="Sort ascending (default: descending)"),
+    fresh: bool = typer.Option(False, "--fresh", help="Read live from the API instead of the local replica"),
+    enrich: bool = typer.Option(False, "--enrich", help="Join salary, experience and sponsorship from each job posting"),
 ) -> None:
-    """List tracked jobs."""
+    """List tracked jobs.
+
+    Reads a local replica of the tracker, refreshed from the API once it is
+    older than tracker.replica_ttl (five minutes by default). The first run
+    downloads the whole tracker. --fresh reads the API directly instead.
+    """
+    if sort not in SORT_COLUMNS:
+        rprint(f"[red]Error:[/red] --sort must be one of {', '.join(SORT_COLUMNS)}")
+        raise typer.Exit(1)
+    if output_format is not None and output_format not in OUTPUT_FORMATS:
+        rprint(f"[red]Error:[/red] --format must be one of {', '.join(OUTPUT_FORMATS)}")
+        raise typer.Exit(1)
+    fmt = output_format or (("ndjson" if all_pages else "json") if output_json else "table")
+
+    with open_client() if enrich else nullcontext() as search_client:
+        _list(
+            status=status,
+            page=page,
+            size=size,
+            fmt=fmt,
+            all_pages=all_pages,
+            workers=workers,
+            company=company,
+            since=since,
+            until=until,
+            sort=sort,
+            ascending=ascending,
+            fresh=fresh,
+            search_client=search_client,
+        )
+
+
+def _list(
+    *,
+    status: str | None,
+    page: int,
+    size: int,
+    fmt: str,
+    all_pages: bool,
+    workers: int,
+    company: str | None,
+    since: str | None,
+    until: str | None,
+    sort: str,
+    ascending: bool,
+    fresh: bool,
+    search_client: TypesenseClient | None,
+) -> None:
+    if fresh:
+        if company or since or until or sort != "tracked" or ascending:
+            rprint("[red]Error:[/red] --company, --since, --until and --sort need the local replica (drop --fresh).")
+            raise typer.Exit(1)
+        if all_pages:
+            _list_all(status=status, size=size, workers=workers, fmt=fmt, search_client=search_client)
+            return
+        try:
+            with SimplifyAPIClient() as client:
+                if fmt in ("json", "ndjson"):
+                    data = list_tracker(client, page=page, size=size, status=status)
+                else:
+                    data = fetch_tracker_page(client, page=page, size=size, status=status)
+        except httpx.HTTPStatusError as e:
+            _handle_api_error(e)
+        _print_page(data, fmt, search_client)
+        return
+
+    _ensure_replica(workers=workers)
+    query = {
+        "status": status,
+        "company": company,
+        "since": since,
+        "until": until,
+        "sort": sort,
+        "descending": not ascending,
+    }
+    read_page = query_replica if fmt in ("json", "ndjson") else query_replica_page
+    if not all_pages:
+        _print_page(read_page(page=page, size=size, **query), fmt, search_client)
+        return
+
+    first = read_page(page=1, size=size, **query)
+    count = first.pages if isinstance(first, TrackerPage) else first["pages"]
+    rest = (read_page(page=p, size=size, **query) for p in range(2, count + 1))
+    _print_pages(chain([first], rest), fmt, search_client)
+
+
+def _ensure_replica(*, workers: int) -> None:
+    settings = load_config()["tracker"]
+    age = replica_age()
+    if age is not None and age < settings["replica_ttl"]:
+        return
+    full_age = full_refresh_age()
+    full = full_age is None or full_age >= settings["full_refresh_ttl"]
     try:
-        with SimplifyAPIClient() as client:
-            data = list_tracker(client, page=page, size=size, status=status)
+        with console.status("Refreshing tracker replica..."), SimplifyAPIClient() as client:
+            refresh_replica(client, workers=workers, full=full)
     except httpx.HTTPStatusError as e:
         _handle_api_error(e)
 
-    if output_json:
-        print(json.dumps(data, indent=2))
+
+def _enrich(data: dict | TrackerPage, search_client: TypesenseClient) -> dict[str, Job]:
+    """Look up the jobs behind a page's items, keyed by item ID.
+
+    Raw pages are only ever written out as JSON, so they get each job
+    document joined onto its item as ``job`` instead and nothing is returned.
+    """
+    try:
+        if isinstance(data, TrackerPage):
+            return fetch_enrichment(data, search_client)
+        enrich_items(data.get("items", []), search_client)
+    except httpx.HTTPStatusError as e:
+        rprint(f"[red]Job lookup failed:[/red] {e.response.status_code}")
+        raise typer.Exit(1)
+    except httpx.ConnectError:
+        rprint("[red]Error:[/red] Could not connect to search service.")
+        raise typer.Exit(1)
+    return {}
+
+
+def _print_page(data: dict | TrackerPage, fmt: str, search_client: TypesenseClient | None = None) -> None:
+    """Print one page: a raw page as JSON, a decoded ``TrackerPage`` as a table, or its rows."""
+    if fmt not in ("table", "json"):
+        _print_pages([data], fmt, search_client)
+        return
+    jobs = _enrich(data, search_client) if search_client else None
+    if fmt == "json":
+        write_json(data)
         return
 
-    tp = TrackerPage.model_validate(data)
+    tp = data
     if not tp.items:
         rprint("[yellow]No tracked jobs found.[/yellow]")
         return
 
-    table = tracker_table(tp.items, page=tp.page, total=tp.total)
+    table = tracker_table(tp.items, page=tp.page, total=tp.total, jobs=jobs)
     console.print(table)
     rprint(f"[dim]Page {tp.page}/{tp.pages}[/dim]")
 
 
+def _print_pages(
+    pages: Iterable[dict | TrackerPage],
+    fmt: str,
+    search_client: TypesenseClient | None = None,
+) -> None:
+    """Print pages: raw ones for the JSON formats, decoded ``TrackerPage``s otherwise."""
+    if fmt != "table":
+        columns = [*TRACKER_COLUMNS, *(TRACKER_ENRICHED_COLUMNS if search_client else [])]
+        write_rows(_rows(pages, fmt, search_client), fmt, columns if fmt in TABULAR_FORMATS else None)
+        return
+
+    total = 0
+    for tp in pages:
+        jobs = _enrich(tp, search_client) if search_client else None
+        total = tp.total
+        if tp.items:
+            console.print(tracker_table(tp.items, page=tp.page, total=tp.total, jobs=jobs))
+
+    if total:
+        rprint(f"[dim]{total} tracked jobs[/dim]")
+    else:
+        rprint("[yellow]No tracked jobs found.[/yellow]")
+
+
+def _rows(pages: Iterable[dict | TrackerPage], fmt: str, search_client: TypesenseClient | None) -> Iterator[dict]:
+    """Raw items for JSON formats, flattened ``tracker_row``s for tsv/csv, a page at a time."""
+    for data in pages:
+        if fmt not in TABULAR_FORMATS:
+            if search_client:
+                _enrich(data, search_client)
+            yield from data.get("items", [])
+            continue
+        jobs = _enrich(data, search_client) if search_client else None
+        for item in data.items:
+            yield tracker_row(item, jobs)
+
+
+def _list_all(
+    *,
+    status: str | None,
+    size: int,
+    workers: int,
+    fmt: str,
+    search_client: TypesenseClient | None,
+) -> None:
+    try:
+        with SimplifyAPIClient() as client:
+            read_pages = iter_tracker_pages if fmt in ("json", "ndjson") else fetch_tracker_pages
+            _print_pages(read_pages(client, size=size, status=status, workers=workers), fmt, search_client)
+    except httpx.HTTPStatusError as e:
+        _handle_api_error(e)
+
+
+@tracker_app.command()
+def sync(
+    workers: int = typer.Option(4, "--workers", help="Concurrent page requests"),
+    full: bool = typer.Option(False, "--full", help="Read every page, picking up older status changes and removed items"),
+) -> None:
+    """Refresh the local tracker replica now."""
+    try:
+        with console.status("Refreshing tracker replica..."), SimplifyAPIClient() as client:
+            result = refresh_replica(client, workers=workers, full=full)
+    except httpx.HTTPStatusError as e:
+        _handle_api_error(e)
+    rprint(
+        f"[green]Tracker replica up to date:[/green] {result['total']} items "
+        f"[dim]({result['added']} added, {result['updated']} updated, {result['removed']} removed; "
+        f"{'full' if result['full'] else 'incremental'} refresh, "
+        f"{result['pages']} page{'s' if result['pages'] != 1 else ''} read)[/dim]"
+    )
+
+
 @tracker_app.command()
 def save(
     job_id: str = typer.Argument(help="Job posting ID to save"),
@@ -68,6 +310,7 @@ def save(
     try:
         with SimplifyAPIClient() as client:
             save_job(client, job_id)
+        invalidate_replica()
     except httpx.HTTPStatusError as e:
         _handle_api_error(e)
     rprint(f"[green]Job {job_id[:8]}… saved to tracker.[/green]")
@@ -81,6 +324,7 @@ def applied(
     try:
         with SimplifyAPIClient() as client:
             mark_applied(client, job_id)
+        invalidate_replica()
     except httpx.HTTPStatusError as e:
         _handle_api_error(e)
     rprint(f"[green]Job {job_id[:8]}… marked as applied.[/green]")
@@ -95,30 +339,288 @@ def status_update(
     try:
         with SimplifyAPIClient() as client:
             update_status(client, tracker_id, new_status.value)
+        invalidate_replica()
     except httpx.HTTPStatusError as e:
         _handle_api_error(e)
     rprint(f"[green]Status updated to {new_status.value}.[/green]")
 
 
+def _read_rows(source: str, columns: int) -> list[tuple[str, ...]]:
+    """Read one row per line from a file or stdin (``-``).
+
+    Fields are separated by commas or whitespace; blank lines and ``#``
+    comments are skipped.
+    """
+    text = sys.stdin.read() if source == "-" else Path(source).read_text()
+    rows = []
+    for line in text.splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            rows.append(tuple(line.replace(",", " ").split()[:columns]))
+    return rows
+
+
+def _describe_error(error: httpx.HTTPError) -> str:
+    if isinstance(error, httpx.HTTPStatusError):
+        return f"API error {error.response.status_code}"
+    return type(error).__name__
+
+
+def _run_bulk(
+    action: Callable[..., dict],
+    rows: list[tuple[str, ...]],
+    *,
+    rejected: list[tuple[tuple[str, ...], str]],
+    source: str,
+    workers: int,
+    retry_file: Path,
+    output_json: bool,
+) -> None:
+    if not rows and not rejected:
+        rprint("[yellow]No IDs given.[/yellow]")
+        return
+
+    # Only requests that failed are worth retrying; rejected rows need fixing first.
+    failed: list[tuple[tuple[str, ...], str]] = []
+    succeeded = 0
+    with SimplifyAPIClient() as client:
+        for row, outcome in run_bulk(client, action, rows, workers=workers):
+            if isinstance(outcome, httpx.HTTPError):
+                failed.append((row, _describe_error(outcome)))
+                if not output_json:
+                    rprint(f"[red]✗[/red] {' '.join(row)}  [dim]{_describe_error(outcome)}[/dim]")
+            else:
+                succeeded += 1
+                if not output_json:
+                    rprint(f"[green]✓[/green] {' '.join(row)}")
+            if output_json:
+                error = _describe_error(outcome) if isinstance(outcome, httpx.HTTPError) else None
+                write_rows([{"row": list(row), "ok": error is None, "error": error, "rejected": False}], "ndjson")
+    if succeeded:
+        invalidate_replica()
+
+    for row, reason in rejected:
+        if output_json:
+            write_rows([{"row": list(row), "ok": False, "error": reason, "rejected": True}], "ndjson")
+        else:
+            rprint(f"[red]✗[/red] {escape(','.join(row))}  [dim]rejected: {reason}[/dim]")
+
+    summary = f"{succeeded} succeeded, {len(failed)} failed"
+    if rejected:
+        summary += f", {len(rejected)} rejected as malformed"
+    if failed:
+        retry_file.write_text("".join(",".join(row) + "\n" for row, _ in failed))
+        summary += f"; failures written to {retry_file}"
+    elif source != "-" and Path(source).resolve() == retry_file.resolve():
+        # This run was the retry and it went through, so the file is done with.
+        retry_file.unlink(missing_ok=True)
+    Console(stderr=True).print(f"[dim]{summary}[/dim]")
+    if failed or rejected:
+        raise typer.Exit(1)
+
+
+_SOURCE_ARG = typer.Argument("-", help="File with one entry per line, or - for stdin")
+_WORKERS_OPT = typer.Option(8, "--workers", help="Requests in flight at once")
+
+# Each command gets its own default so one command's run never touches another's failures.
+_SAVE_RETRY_OPT = typer.Option(
+    Path("tracker-save-retry.txt"), "--retry-file", help="Where to write entries that failed"
+)
+_APPLIED_RETRY_OPT = typer.Option(
+    Path("tracker-applied-retry.txt"), "--retry-file", help="Where to write entries that failed"
+)
+_STATUS_RETRY_OPT = typer.Option(
+    Path("tracker-status-retry.txt"), "--retry-file", help="Where to write entries that failed"
+)
+_JSON_OPT = typer.Option(False, "--json", help="NDJSON report, one line per entry")
+
+
+@bulk_app.command("save")
+def bulk_save(
+    source: str = _SOURCE_ARG,
+    workers: int = _WORKERS_OPT,
+    retry_file: Path = _SAVE_RETRY_OPT,
+    output_json: bool = _JSON_OPT,
+) -> None:
+    """Save many job postings to your tracker."""
+    rows = _read_rows(source, 1)
+    _run_bulk(
+        save_job, rows, rejected=[], source=source, workers=workers, retry_file=retry_file, output_json=output_json
+    )
+
+
+@bulk_app.command("applied")
+def bulk_applied(
+    source: str = _SOURCE_ARG,
+    workers: int = _WORKERS_OPT,
+    retry_file: Path = _APPLIED_RETRY_OPT,
+    output_json: bool = _JSON_OPT,
+) -> None:
+    """Mark many job postings as applied."""
+    rows = _read_rows(source, 1)
+    _run_bulk(
+        mark_applied, rows, rejected=[], source=source, workers=workers, retry_file=retry_file, output_json=output_json
+    )
+
+
+@bulk_app.command("status-update")
+def bulk_status_update(
+    source: str = typer.Argument("-", help="File of 'tracker-id,status' lines, or - for stdin"),
+    workers: int = _WORKERS_OPT,
+    retry_file: Path = _STATUS_RETRY_OPT,
+    output_json: bool = _JSON_OPT,
+) -> None:
+    """Update the status of many tracked jobs."""
+    rows: list[tuple[str, ...]] = []
+    rejected: list[tuple[tuple[str, ...], str]] = []
+    for row in _read_rows(source, 2):
+        if len(row) < 2 or row[1].lower() not in STATUS_VALUES:
+            rejected.append((row, f"expected 'tracker-id,status' with status one of {', '.join(sorted(STATUS_VALUES))}"))
+        else:
+            rows.append((row[0], row[1].lower()))
+    _run_bulk(
+        update_status, rows, rejected=rejected, source=source, workers=workers, retry_file=retry_file, output_json=output_json
+    )
+
+
 @tracker_app.command()
 def export(
     output: Path = typer.Option("tracker.csv", "-o", "--output", help="Output CSV file"),
+    compress: str | None = typer.Option(
+        None, "--compress", help="gzip or zstd (default: from the .gz/.zst suffix of --output)"
+    ),
 ) -> None:
     """Export tracker to CSV."""
-    try:
-        with SimplifyAPIClient() as client:
-            csv_bytes = export_csv(client)
-    except httpx.HTTPStatusError as e:
-        _handle_api_error(e)
-    output.write_bytes(csv_bytes)
-    rprint(f"[green]Exported tracker to {output}[/green]")
+    compression = compress or compression_for(output)
+    if compression not in (None, "none", *COMPRESSIONS):
+        rprint(f"[red]Error:[/red] --compress must be one of none, {', '.join(COMPRESSIONS)}")
+        raise typer.Exit(1)
+    if compression == "none":
+        compression = None
+
+    with Progress(
+        TextColumn("Exporting"),
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        console=Console(stderr=True),
+        transient=True,
+    ) as progress:
+        task = progress.add_task("export", total=None)
+
+        def update(received: int, total: int | None) -> None:
+            progress.update(task, completed=received, total=total)
+
+        try:
+            with SimplifyAPIClient() as client:
+                size = download_csv(client, output, compression=compression, progress=update)
+        except httpx.HTTPStatusError as e:
+            _handle_api_error(e)
+        except (httpx.TransportError, RuntimeError) as e:
+            rprint(f"[red]Error:[/red] Export failed: {escape(str(e))}")
+            if part_path(output).exists():
+                rprint("[dim]Run the same command again to resume the download.[/dim]")
+            raise typer.Exit(1)
+    rprint(f"[green]Exported tracker to {output}[/green] [dim]({size:,} bytes of CSV)[/dim]")
 
 
 @tracker_app.command()
 def stats(
+    output_json: bool = typer.Option(False, "--json", help="JSON output, including a weekly time series"),
+    status: str | None = typer.Option(None, "-s", "--status", help="Only items currently in this status"),
+    company: str | None = typer.Option(None, "--company", help="Filter by company name (substring)"),
+    since: str | None = typer.Option(None, "--since", help="Tracked on or after this date (YYYY-MM-DD)"),
+    until: str | None = typer.Option(None, "--until", help="Tracked on or before this date (YYYY-MM-DD)"),
+    ghost_days: int = typer.Option(
+        30, "--ghost-days", help="Days without a response before an application counts as ghosted (local stats)"
+    ),
+    local: bool = typer.Option(False, "--local", help="Compute from your tracker's status history (implied by filters)"),
+) -> None:
+    """Show tracker statistics.
+
+    By default these are the statistics Simplify computes. --local, or any
+    filter, computes them from the status history in the local tracker
+    replica instead; with --json that includes a weekly time series.
+    """
+    if not (local or status or company or since or until):
+        _sankey_stats(output_json)
+        return
+
+    _ensure_replica(workers=4)
+    stats_data = compute_stats(status=status, company=company, since=since, until=until, ghost_days=ghost_days)
+    if output_json:
+        write_json(stats_data)
+        return
+
+    if not stats_data["items"]:
+        rprint("[yellow]No tracked jobs match.[/yellow]")
+        return
+
+    rprint("[bold]Tracker Statistics[/bold]\n")
+
+    counts = stats_data["counts"]
+    rates = stats_data["conversion_rates"]
+    rprint(f"  Saved:         [bold]{counts['saved']}[/bold]")
+    rprint(f"  Applications:  [bold]{counts['applications']}[/bold]")
+    rprint(f"  Interviews:    [bold]{counts['interviews']}[/bold]{_rate(rates['application_to_interview'])}")
+    rprint(f"  Offers:        [bold]{counts['offers']}[/bold]{_rate(rates['interview_to_offer'])}")
+    rprint(f"  Rejections:    [bold]{counts['rejections']}[/bold]")
+    rprint()
+
+    ghost = stats_data["ghost_rate_percent"]
+    if ghost is not None:
+        rprint(f"  Ghost rate:    [bold]{ghost}%[/bold]")
+    avg_days = stats_data["average_days_to_first_response"]
+    if avg_days is not None:
+        rprint(f"  Avg response:  [bold]{avg_days} days[/bold]")
+
+    avg_apps = stats_data["average_applications"]
+    if stats_data["active_weeks"]:
+        rprint(f"\n  Apps/week:     [bold]{avg_apps['weekly']}[/bold]")
+        rprint(f"  Apps/month:    [bold]{avg_apps['monthly']}[/bold]")
+        rprint(f"  Active weeks:  [bold]{stats_data['active_weeks']}[/bold]")
+
+    busiest = stats_data["most_active_weekday"]
+    if busiest:
+        rprint(f"  Busiest day:   [bold]{busiest['name']}[/bold] ({busiest['applications']} apps)")
+
+
+@tracker_app.command()
+def funnel(
     output_json: bool = typer.Option(False, "--json", help="JSON output"),
+    status: str | None = typer.Option(None, "-s", "--status", help="Only items currently in this status"),
+    company: str | None = typer.Option(None, "--company", help="Filter by company name (substring)"),
+    since: str | None = typer.Option(None, "--since", help="Tracked on or after this date (YYYY-MM-DD)"),
+    until: str | None = typer.Option(None, "--until", help="Tracked on or before this date (YYYY-MM-DD)"),
 ) -> None:
-    """Show tracker statistics."""
+    """Show time-in-stage, time-to-outcome percentiles and weekly cohorts."""
+    try:
+        from simplify_cli.api.tracker_analytics import funnel_report, load_events
+    except ImportError:
+        rprint("[red]Error:[/red] tracker funnel needs NumPy: pip install 'simplify-cli[analytics]'")
+        raise typer.Exit(1)
+
+    _ensure_replica(workers=4)
+    report = funnel_report(load_events(status=status, company=company, since=since, until=until))
+    if output_json:
+        write_json(report)
+        return
+
+    if not report["items"]:
+        rprint("[yellow]No tracked jobs match.[/yellow]")
+        return
+
+    console.print(distribution_table("Days in stage (completed stays)", report["time_in_stage"]))
+    console.print(distribution_table("Days from application to first…", report["time_to"]))
+    console.print(cohort_table(report["cohorts"]))
+    rprint(f"[dim]{report['items']:,} tracked jobs, {report['events']:,} status events[/dim]")
+
+
+def _rate(percent: float | None) -> str:
+    return f" [dim]({percent}% of previous stage)[/dim]" if percent is not None else ""
+
+
+def _sankey_stats(output_json: bool) -> None:
     try:
         with SimplifyAPIClient() as client:
             data = get_stats(client)
@@ -126,7 +628,7 @@ def stats(
         _handle_api_error(e)
 
     if output_json:
-        print(json.dumps(data, indent=2))
+        write_json(data)
         return
 
     # Extract statistics from sankey data
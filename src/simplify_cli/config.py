@@ -2,14 +2,52 @@ from __future__ import annotations
 
 import tomllib
 from pathlib import Path
+from typing import Any
 
 from platformdirs import user_config_dir
 
 CONFIG_DIR = Path(user_config_dir("simplify-cli"))
 CONFIG_FILE = CONFIG_DIR / "config.toml"
 
-DEFAULT_CONFIG = {
+DEFAULT_CONFIG: dict[str, Any] = {
     "page_size": 20,
+    "auth": {
+        "store": "keyring",
+    },
+    "search": {
+        "timeout": 15.0,
+        "max_connections": 10,
+        "max_keepalive_connections": 10,
+        "keepalive_expiry": 30.0,
+        "http2": False,
+    },
+    "cache": {
+        "enabled": True,
+        "max_bytes": 50_000_000,
+        "stale_while_revalidate": 3600,
+        "ttl": {
+            "search": 300,
+            "view": 3600,
+            "facets": 900,
+        },
+    },
+    "watch": {
+        "interval": 300,
+    },
+    "searches": {},
+    "tracker": {
+        "replica_ttl": 300,
+        "full_refresh_ttl": 86400,
+    },
+    "rate_limit": {
+        "initial_concurrency": 8,
+        "min_concurrency": 1,
+        "max_concurrency": 64,
+        "latency_tolerance": 2.0,
+        "max_retries": 4,
+        "backoff_base": 0.5,
+        "backoff_max": 30.0,
+    },
 }
 
 
@@ -17,9 +55,19 @@ def ensure_config_dir() -> None:
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _merge(defaults: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any]:
+    merged = {k: _merge(v, {}) if isinstance(v, dict) else v for k, v in defaults.items()}
+    for key, value in overrides.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
 def load_config() -> dict:
     ensure_config_dir()
     if CONFIG_FILE.exists():
         with open(CONFIG_FILE, "rb") as f:
-            return {**DEFAULT_CONFIG, **tomllib.load(f)}
-    return dict(DEFAULT_CONFIG)
+            return _merge(DEFAULT_CONFIG, tomllib.load(f))
+    return _merge(DEFAULT_CONFIG, {})
@@ -0,0 +1,46 @@
+"""Turn response bodies into Python objects in a single pass.
+
+Bodies that end up as models are validated straight from the raw bytes
+with pydantic's JSON parser, so no intermediate dicts are built and fields
+a model does not declare are skipped. Bodies that are needed as plain data
+(``--json`` output, caches) go through ``loads``, which uses orjson when it
+is installed (``pip install 'simplify-cli[speedups]'``).
+"""
+
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from pydantic import TypeAdapter
+
+from simplify_cli.models.search import MultiSearchResponse, SearchResult
+
+T = TypeVar("T")
+
+try:
+    import orjson
+
+    def loads(body: bytes | str) -> Any:
+        return orjson.loads(body)
+
+except ImportError:
+
+    def loads(body: bytes | str) -> Any:
+        return json.loads(body)
+
+
+@lru_cache(maxsize=None)
+def _adapter(tp: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(tp)
+
+
+def decode(body: bytes | str, tp: type[T]) -> T:
+    """Validate a JSON body directly into ``tp`` (a model, or e.g. ``list[Model]``)."""
+    return _adapter(tp).validate_json(body)
+
+
+def decode_results(body: bytes | str) -> list[SearchResult]:
+    """Decode a Typesense multi_search response body."""
+    return decode(body, MultiSearchResponse).results
@@ -0,0 +1,175 @@
+"""Plain output formats written to stdout one row at a time.
+
+``table`` output builds a whole Rich table before anything is printed. The
+other formats stream: each row is serialised and written as soon as it is
+produced, so ``| head`` sees output straight away and memory stays flat
+however many rows there are. JSON goes through orjson when it is installed
+(``pip install 'simplify-cli[speedups]'``).
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+import sys
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from typing import Any
+
+from simplify_cli.models.job import Job
+from simplify_cli.models.tracker import TrackerItem
+
+OUTPUT_FORMATS = ("table", "tsv", "csv", "ndjson", "json")
+# Formats that write selected columns rather than whole documents.
+TABULAR_FORMATS = ("tsv", "csv")
+
+TRACKER_COLUMNS = ["id", "job_posting_id", "title", "company", "status", "location", "tracked_date"]
+# Extra tracker columns when items are joined with their job postings.
+TRACKER_ENRICHED_COLUMNS = ["salary", "experience", "h1b"]
+
+try:
+    import orjson
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+
+except ImportError:
+
+    def _dumps(obj: Any, indent: bool = False) -> bytes:
+        if indent:
+            return json.dumps(obj, indent=2, ensure_ascii=False).encode()
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+@contextmanager
+def pipe_guard() -> Iterator[None]:
+    """Exit quietly when the reader of stdout goes away (``| head``)."""
+    try:
+        yield
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Point stdout at /dev/null so the flush at interpreter exit cannot fail again.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+        raise SystemExit(0)
+
+
+def write_json(data: Any) -> None:
+    """Write one document as indented JSON."""
+    with pipe_guard():
+        sys.stdout.flush()
+        sys.stdout.buffer.write(_dumps(data, indent=True) + b"\n")
+
+
+def write_rows(rows: Iterable[Mapping[str, Any]], fmt: str, columns: list[str] | None = None) -> int:
+    """Write ``rows`` to stdout in ``fmt`` and return how many were written.
+
+    ``ndjson`` writes each row whole on its own line and ``json`` writes them
+    as one array. ``tsv`` and ``csv`` write a header and then the values of
+    ``columns`` (default: the keys of the first row); lists are joined with
+    ``"; "`` and nested objects written as JSON.
+    """
+    with pipe_guard():
+        if fmt in TABULAR_FORMATS:
+            return _write_tabular(rows, fmt, columns)
+        return _write_json_rows(rows, array=fmt == "json")
+
+
+def _write_json_rows(rows: Iterable[Mapping[str, Any]], *, array: bool) -> int:
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    count = 0
+    for row in rows:
+        if array:
+            out.write(b"[\n" if not count else b",\n")
+        out.write(_dumps(row))
+        if not array:
+            out.write(b"\n")
+        # Rows usually arrive a page at a time over the network; pass each one on now.
+        out.flush()
+        count += 1
+    if array:
+        out.write(b"\n]\n" if count else b"[]\n")
+    return count
+
+
+_TSV_ESCAPES = str.maketrans({"\t": " ", "\n": " ", "\r": " "})
+
+
+def _write_tabular(rows: Iterable[Mapping[str, Any]], fmt: str, columns: list[str] | None) -> int:
+    out = sys.stdout
+    writer = csv.writer(out, lineterminator="\n") if fmt == "csv" else None
+
+    def emit(values: list[str]) -> None:
+        if writer is not None:
+            writer.writerow(values)
+        else:
+            out.write("\t".join(v.translate(_TSV_ESCAPES) for v in values) + "\n")
+
+    count = 0
+    if columns is not None:
+        emit(columns)
+    for row in rows:
+        if columns is None:
+            columns = list(row)
+            emit(columns)
+        emit([_cell(row.get(c)) for c in columns])
+        out.flush()
+        count += 1
+    return count
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, (list, tuple)):
+        return "; ".join(_cell(v) if not isinstance(v, (dict, list)) else json.dumps(v) for v in value)
+    if isinstance(value, dict):
+        return json.dumps(value)
+    return str(value)
+
+
+def tracker_row(item: TrackerItem, jobs: dict[str, Job] | None = None) -> dict[str, Any]:
+    """The ``TRACKER_COLUMNS`` of one item, plus the enriched ones when ``jobs`` is given."""
+    row: dict[str, Any] = {
+        "id": item.id,
+        "job_posting_id": item.job_posting_id,
+        "title": item.job_posting_title,
+        "company": item.company_name,
+        "status": item.current_status,
+        "location": item.job_posting_location,
+        "tracked_date": item.tracked_date,
+    }
+    if jobs is not None:
+        job = jobs.get(item.id)
+        row["salary"] = job.salary_str if job else ""
+        row["experience"] = job.experience_str if job else ""
+        row["h1b"] = job.sponsorship_str if job else ""
+    return row
+
+
+def preferences_row(raw_data: dict[str, Any]) -> dict[str, Any]:
+    """Flatten job preferences into the fields ``preferences_panel`` shows."""
+    levels = [
+        label
+        for key, label in [("prefers_intern", "Intern"), ("prefers_entry", "Entry"), ("prefers_junior", "Junior"),
+                           ("prefers_mid", "Mid"), ("prefers_senior", "Senior"), ("prefers_staff", "Staff")]
+        if raw_data.get(key)
+    ]
+    auths = [label for key, label in [("work_auth_us", "US"), ("work_auth_ca", "Canada"), ("work_auth_uk", "UK")]
+             if raw_data.get(key)]
+    return {
+        "locations": [r.get("name", "") for r in raw_data.get("region", [])],
+        "roles": [f.get("title", "") for f in raw_data.get("function", [])],
+        "industries": [i.get("name", "") for i in raw_data.get("industry", [])],
+        "experience": levels,
+        "skills": [s.get("skill", {}).get("name", "") for s in raw_data.get("skill", [])],
+        "work_auth": auths,
+        "min_salary_k": raw_data.get("prefers_salary"),
+    }
@@ -9,6 +9,23 @@ from rich.text import Text
 from simplify_cli.models.job import Job
 from simplify_cli.models.profile import Education, Experience, Profile, Resume
 
+# Job document fields read by job_detail_panel.
+JOB_DETAIL_FIELDS = [
+    "id",
+    "title",
+    "company_name",
+    "locations",
+    "type",
+    "experience_level",
+    "min_salary",
+    "max_salary",
+    "currency_type",
+    "functions",
+    "sponsors_h1b",
+    "start_date",
+    "updated_date",
+]
+
 
 def job_detail_panel(job: Job) -> Panel:
     lines = Text()
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from datetime import datetime, timezone
+from typing import Any
 
+from rich.markup import escape
 from rich.table import Table
 
 from simplify_cli.models.job import Job
 from simplify_cli.models.tracker import TrackerItem
 
+# Job document fields read by job_results_table.
+JOB_TABLE_FIELDS = ["id", "title", "company_name", "locations", "type", "min_salary", "max_salary", "currency_type"]
 
-def job_results_table(jobs: list[Job], page: int = 1, total: int = 0) -> Table:
+
+def job_results_table(jobs: Sequence[Job], page: int = 1, total: int = 0, selected: int | None = None) -> Table:
+    """One row per job; a ``JobBatch`` only materialises the rows as they are added.
+
+    ``selected`` highlights that row, for the ``jobs browse`` cursor.
+    """
     table = Table(
         title=f"Job Results (page {page}, {total} total)",
         show_lines=True,
@@ -20,7 +30,7 @@ def job_results_table(jobs: list[Job], page: int = 1, total: int = 0) -> Table:
     table.add_column("Type", max_width=12)
     table.add_column("Salary", max_width=20)
 
-    for job in jobs:
+    for i, job in enumerate(jobs):
         table.add_row(
             job.id[:8] if len(job.id) > 8 else job.id,
             job.title,
@@ -28,11 +38,84 @@ def job_results_table(jobs: list[Job], page: int = 1, total: int = 0) -> Table:
             job.location_str,
             job.type,
             job.salary_str,
+            style="reverse" if i == selected else None,
         )
     return table
 
 
-def tracker_table(items: list[TrackerItem], page: int = 1, total: int = 0) -> Table:
+def grouped_results_table(groups: list[tuple[str, int, list[Job]]], page: int = 1, total: int = 0) -> Table:
+    table = Table(
+        title=f"Jobs by Company (page {page}, {total} companies)",
+        show_lines=True,
+    )
+    table.add_column("Company", style="green", max_width=24)
+    table.add_column("Jobs", justify="right", style="bold")
+    table.add_column("Top Postings", style="cyan", max_width=60)
+
+    for company, count, jobs in groups:
+        postings = "\n".join(
+            f"{escape(job.title)} [dim]({escape(job.location_str)}{', ' + job.salary_str if job.salary_str else ''})[/dim]"
+            for job in jobs
+        )
+        table.add_row(escape(company), f"{count:,}", postings)
+    return table
+
+
+def facet_table(field: str, counts: list[tuple[str, int]], total: int = 0) -> Table:
+    table = Table(title=f"{field} ({total} matching jobs)", show_lines=False)
+    table.add_column("Value", style="bold")
+    table.add_column("Jobs", justify="right", style="green")
+    table.add_column("Share", justify="right", style="dim")
+    for value, count in counts:
+        share = f"{count / total:.0%}" if total else ""
+        table.add_row(value, f"{count:,}", share)
+    return table
+
+
+def distribution_table(title: str, rows: dict[str, dict[str, Any]]) -> Table:
+    """Days-based distributions keyed by stage or milestone, as built by tracker_analytics."""
+    table = Table(title=title, show_lines=False)
+    table.add_column("Stage", style="bold")
+    table.add_column("N", justify="right", style="green")
+    table.add_column("Mean", justify="right")
+    for key in ("p25", "p50", "p75", "p90"):
+        table.add_column(key, justify="right", style="dim" if key != "p50" else "")
+    for name, dist in rows.items():
+        table.add_row(
+            name.capitalize(),
+            f"{dist['count']:,}",
+            *(_days(dist[k]) for k in ("mean", "p25", "p50", "p75", "p90")),
+        )
+    return table
+
+
+def cohort_table(rows: list[dict[str, Any]]) -> Table:
+    table = Table(title="Cohorts by week tracked", show_lines=False)
+    table.add_column("Week of", style="bold", no_wrap=True)
+    for name in ("Tracked", "Applied", "Interviewed", "Offered", "Rejected"):
+        table.add_column(name, justify="right")
+    table.add_column("Interview %", justify="right", style="green")
+    table.add_column("Offer %", justify="right", style="green")
+    for row in rows:
+        table.add_row(
+            row["week"],
+            *(f"{row[k]:,}" for k in ("tracked", "applied", "interviewed", "offered", "rejected")),
+            *(f"{row[k]}%" if row[k] is not None else "" for k in ("interview_rate", "offer_rate")),
+        )
+    return table
+
+
+def _days(value: float | None) -> str:
+    return f"{value}d" if value is not None else ""
+
+
+def tracker_table(
+    items: list[TrackerItem],
+    page: int = 1,
+    total: int = 0,
+    jobs: dict[str, Job] | None = None,
+) -> Table:
+    """Tracker rows; ``jobs`` (keyed by tracker item ID) adds columns from the job documents."""
     table = Table(
         title=f"Tracker (page {page}, {total} total)",
         show_lines=True,
@@ -42,6 +125,10 @@ def tracker_table(items: list[TrackerItem], page: int = 1, total: int = 0) -> Ta
     table.add_column("Company", style="green", max_width=20)
     table.add_column("Status", max_width=14)
     table.add_column("Location", max_width=20)
+    if jobs is not None:
+        table.add_column("Salary", style="yellow", max_width=20)
+        table.add_column("Experience", max_width=18)
+        table.add_column("H1B", max_width=5)
     table.add_column("Saved", max_width=12)
 
     status_colors = {
@@ -57,12 +144,17 @@ def tracker_table(items: list[TrackerItem], page: int = 1, total: int = 0) -> Ta
         status = item.current_status
         color = status_colors.get(status.lower(), "white")
         saved = _format_date(item.tracked_date)
+        enriched = []
+        if jobs is not None:
+            job = jobs.get(item.id)
+            enriched = [job.salary_str, job.experience_str, job.sponsorship_str] if job else ["", "", ""]
         table.add_row(
             item.id[:8] if len(item.id) > 8 else item.id,
             item.job_posting_title,
             item.company_name,
             f"[{color}]{status}[/{color}]",
             item.job_posting_location,
+            *enriched,
             saved,
         )
     return table
@@ -1,5 +1,10 @@
 from __future__ import annotations
 
+import math
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, overload
+
 from pydantic import BaseModel, Field
 
 from simplify_cli.models.util import format_salary
@@ -45,3 +50,194 @@ class Job(BaseModel):
         if isinstance(self.sponsors_h1b, bool):
             return "Yes" if self.sponsors_h1b else "No"
         return str(self.sponsors_h1b) if self.sponsors_h1b else ""
+
+
+# JobBatch column layout. IDs are packed into one UTF-8 buffer per column;
+# every other column holds 4-byte codes into a table of distinct values
+# shared by all rows, except salaries and dates, which live in typed arrays.
+# Each row also keeps a code for the tuple of keys its document had, and any
+# fields ``Job`` does not declare are kept per row as they came.
+_ID_COLUMNS = ("id", "posting_id")
+_CODED_COLUMNS = (
+    "title",
+    "company_name",
+    "company_id",
+    "company_logo",
+    "type",
+    "currency_type",
+    "locations",
+    "experience_level",
+    "functions",
+    "seasons",
+    "majors",
+    "salary_period",
+    "sponsors_h1b",
+    "start_date",
+)
+_LIST_COLUMNS = {"locations", "experience_level", "functions", "seasons", "majors"}
+_FLOAT_COLUMNS = ("min_salary", "max_salary")
+_INT_COLUMNS = ("updated_date",)
+_FIELD_ORDER = tuple(Job.model_fields)
+_FIELD_SET = frozenset(_FIELD_ORDER)
+# Coded fields kept as-is (they may be None, int, bool or str) rather than coerced to str.
+_UNCOERCED_COLUMNS = {"salary_period", "sponsors_h1b", "start_date"}
+
+
+class JobBatch(Sequence[Job]):
+    """Job documents stored column-wise, materialised as ``Job`` only on access.
+
+    Salaries and dates live in typed arrays and every repeated value (company,
+    type, location lists, ...) is stored once per batch. Indexing or iterating
+    yields ``Job`` models one at a time; ``column`` exposes whole columns for
+    sorting and counting without building any, and ``document`` gives a row
+    back as the dict it was built from.
+    """
+
+    def __init__(self) -> None:
+        self._id_data: dict[str, bytearray] = {name: bytearray() for name in _ID_COLUMNS}
+        self._id_ends: dict[str, array[int]] = {name: array("I") for name in _ID_COLUMNS}
+        self._codes: dict[str, array[int]] = {name: array("I") for name in _CODED_COLUMNS}
+        self._numbers: dict[str, array[Any]] = {
+            **{name: array("d") for name in _FLOAT_COLUMNS},
+            **{name: array("q") for name in _INT_COLUMNS},
+        }
+        self._values: list[Any] = []
+        self._value_codes: dict[tuple[type, Any], int] = {}
+        self._keys = array("I")
+        self._extras: list[dict[str, Any] | None] = []
+
+    @classmethod
+    def from_documents(cls, docs: Iterable[dict[str, Any]]) -> JobBatch:
+        batch = cls()
+        for doc in docs:
+            batch.append(doc)
+        return batch
+
+    def append(self, doc: dict[str, Any]) -> None:
+        """Add one Typesense job document."""
+        self._keys.append(self._code(tuple(doc)))
+        self._extras.append({k: v for k, v in doc.items() if k not in _FIELD_SET} or None)
+        for name in _ID_COLUMNS:
+            data = self._id_data[name]
+            data += str(doc.get(name) or "").encode()
+            self._id_ends[name].append(len(data))
+        for name, column in self._codes.items():
+            value = doc.get(name)
+            if name in _LIST_COLUMNS:
+                value = tuple(value or ())
+            elif name not in _UNCOERCED_COLUMNS:
+                value = str(value or "")
+            column.append(self._code(value))
+        for name in _FLOAT_COLUMNS:
+            value = doc.get(name)
+            self._numbers[name].append(math.nan if value is None else float(value))
+        for name in _INT_COLUMNS:
+            self._numbers[name].append(int(doc.get(name) or 0))
+
+    def _code(self, value: Any) -> int:
+        # Keyed by type too, so that True and 1 stay distinct.
+        key = (type(value), value)
+        code = self._value_codes.get(key)
+        if code is None:
+            code = self._value_codes[key] = len(self._values)
+            self._values.append(value)
+        return code
+
+    def __len__(self) -> int:
+        return len(self._id_ends["id"])
+
+    @overload
+    def __getitem__(self, index: int) -> Job: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> JobBatch: ...
+
+    def __getitem__(self, index: int | slice) -> Job | JobBatch:
+        if isinstance(index, slice):
+            return self.take(range(*index.indices(len(self))))
+        return Job.model_validate(self.document(index, all_fields=True))
+
+    def __iter__(self) -> Iterator[Job]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def column(self, name: str) -> Sequence[Any]:
+        """Every row's value of one field; missing salaries are NaN and lists are tuples."""
+        if name in self._id_data:
+            return [self._id(name, i) for i in range(len(self))]
+        if name in self._numbers:
+            return self._numbers[name]
+        if name in self._codes:
+            values = self._values
+            return [values[code] for code in self._codes[name]]
+        raise KeyError(name)
+
+    def _id(self, name: str, index: int) -> str:
+        ends = self._id_ends[name]
+        start = ends[index - 1] if index else 0
+        return self._id_data[name][start:ends[index]].decode()
+
+    def _value(self, name: str, index: int) -> Any:
+        if name in self._id_data:
+            return self._id(name, index)
+        if name in self._numbers:
+            value = self._numbers[name][index]
+            if name in _FLOAT_COLUMNS:
+                if math.isnan(value):
+                    return None
+                # Salaries arrive as JSON integers; give them back the same way.
+                return int(value) if value.is_integer() else value
+            return value
+        value = self._values[self._codes[name][index]]
+        return list(value) if name in _LIST_COLUMNS else value
+
+    def document(self, index: int, *, all_fields: bool = False) -> dict[str, Any]:
+        """Row ``index`` as a plain document with the keys, in the order, it was added with.
+
+        Values come back as stored: a missing string field is ``""`` and a
+        missing list is ``[]``. ``all_fields`` gives every ``Job`` field instead.
+        """
+        if index < 0:
+            index += len(self)
+        if all_fields:
+            return {name: self._value(name, index) for name in _FIELD_ORDER}
+        extras = self._extras[index] or {}
+        return {
+            key: self._value(key, index) if key in _FIELD_SET else extras[key]
+            for key in self._values[self._keys[index]]
+        }
+
+    def iter_documents(self) -> Iterator[dict[str, Any]]:
+        for i in range(len(self)):
+            yield self.document(i)
+
+    def take(self, indices: Iterable[int]) -> JobBatch:
+        """A new batch holding the given rows, in the given order.
+
+        The new batch gets its own copy of the value table, so appending to
+        either batch afterwards leaves the other untouched.
+        """
+        indices = list(indices)
+        batch = JobBatch()
+        batch._values = list(self._values)
+        batch._value_codes = dict(self._value_codes)
+        batch._keys = array("I", (self._keys[i] for i in indices))
+        batch._extras = [self._extras[i] for i in indices]
+        for name in _ID_COLUMNS:
+            data, ends = batch._id_data[name], batch._id_ends[name]
+            for i in indices:
+                data += self._id(name, i).encode()
+                ends.append(len(data))
+        for columns, target in ((self._codes, batch._codes), (self._numbers, batch._numbers)):
+            for name, column in columns.items():
+                target[name] = array(column.typecode, (column[i] for i in indices))
+        return batch
+
+    def sort_by(self, name: str, *, descending: bool = False) -> JobBatch:
+        """Rows ordered by one column; missing salaries sort last either way."""
+        column = self.column(name)
+        rows = range(len(self))
+        if name in _FLOAT_COLUMNS:
+            present = sorted((i for i in rows if not math.isnan(column[i])), key=column.__getitem__, reverse=descending)
+            return self.take(present + [i for i in rows if math.isnan(column[i])])
+        return self.take(sorted(rows, key=column.__getitem__, reverse=descending))
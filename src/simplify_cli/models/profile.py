@@ -98,3 +98,9 @@ class Resume(BaseModel):
     default: bool = False
 
     model_config = {"extra": "ignore"}
+
+
+class ResumePage(BaseModel):
+    items: list[Resume] = Field(default_factory=list)
+
+    model_config = {"extra": "ignore"}
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+from simplify_cli.models.job import Job
+
+
+class SearchHit(BaseModel):
+    document: Job = Field(default_factory=Job)
+    model_config = {"extra": "ignore"}
+
+
+class SearchGroup(BaseModel):
+    group_key: list[str] = Field(default_factory=list)
+    found: int = 0
+    hits: list[SearchHit] = Field(default_factory=list)
+    model_config = {"extra": "ignore"}
+
+
+class SearchResult(BaseModel):
+    """One Typesense search result, decoded only as far as the CLI renders it."""
+
+    found: int = 0
+    found_docs: int = 0
+    page: int = 1
+    hits: list[SearchHit] = Field(default_factory=list)
+    grouped_hits: list[SearchGroup] = Field(default_factory=list)
+    error: str | None = None
+    model_config = {"extra": "ignore"}
+
+    @property
+    def jobs(self) -> list[Job]:
+        return [hit.document for hit in self.hits]
+
+
+class MultiSearchResponse(BaseModel):
+    results: list[SearchResult] = Field(default_factory=list)
+    model_config = {"extra": "ignore"}
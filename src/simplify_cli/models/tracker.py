@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
+from functools import cached_property
 
 from pydantic import BaseModel, Field
 
@@ -57,7 +58,7 @@ class TrackerItem(BaseModel):
     def company_name(self) -> str:
         return self.company.name if self.company else ""
 
-    @property
+    @cached_property
     def current_status(self) -> str:
         if not self.status_events:
             return ""
@@ -0,0 +1,264 @@
+"""Async Python API for Simplify.jobs.
+
+    import asyncio
+    from simplify_cli.sdk import AsyncSimplify
+
+    async def main():
+        async with AsyncSimplify(concurrency=20) as simplify:
+            docs, missing = await simplify.get_jobs_by_ids(ids)
+            results = await simplify.search_many([{"query": "backend"}, {"query": "data"}])
+
+    asyncio.run(main())
+
+Search calls need no credentials. Profile and tracker calls use the same
+credentials as the CLI (``simplify auth login`` or the ``SIMPLIFY_*``
+environment variables) unless they are passed in explicitly.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json as _json
+from collections.abc import Awaitable, Iterable
+from types import TracebackType
+from typing import Any, TypeVar
+
+import httpx
+
+from simplify_cli.api.endpoints import (
+    ME,
+    PREFERENCES,
+    RESUMES,
+    TRACKER,
+    TRACKER_APPLIED,
+    TRACKER_EXPORT_CSV,
+    TRACKER_SANKEY,
+    TRACKER_SAVE,
+    TRACKER_STATUS_UPDATE,
+    TYPESENSE_API_KEY,
+    TYPESENSE_SEARCH,
+)
+from simplify_cli.api.ratelimit import async_adaptive_transports
+from simplify_cli.auth import get_credentials
+from simplify_cli.config import load_config
+from simplify_cli.decode import loads
+from simplify_cli.search.client import (
+    MAX_MULTI_SEARCHES,
+    _search_params,
+    collect_id_lookup,
+    facet_search_params,
+    id_lookup_payloads,
+    parse_facet_counts,
+)
+
+T = TypeVar("T")
+
+
+class NotAuthenticatedError(RuntimeError):
+    """Raised when an authenticated endpoint is called without credentials."""
+
+
+class AsyncSimplify:
+    """Pooled async client for the Typesense search cluster and the Simplify API.
+
+    ``concurrency`` bounds how many requests the bulk helpers keep in flight
+    and sizes both connection pools to match. Below that, each host's
+    adaptive limiter lowers the effective concurrency when the server
+    throttles, and throttled or failed idempotent calls are retried.
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int = 10,
+        csrf: str | None = None,
+        authorization: str | None = None,
+    ) -> None:
+        self.concurrency = max(1, concurrency)
+        self._csrf = csrf
+        self._authorization = authorization
+        settings = load_config()["search"]
+        limits = httpx.Limits(
+            max_connections=max(self.concurrency, settings["max_connections"]),
+            max_keepalive_connections=max(self.concurrency, settings["max_keepalive_connections"]),
+            keepalive_expiry=settings["keepalive_expiry"],
+        )
+        self._search = httpx.AsyncClient(
+            params={"x-typesense-api-key": TYPESENSE_API_KEY},
+            headers={"Content-Type": "text/plain"},
+            timeout=settings["timeout"],
+            **async_adaptive_transports(retry_posts=True, limits=limits),
+        )
+        self._limits = limits
+        self._api_client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> AsyncSimplify:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        await self._search.aclose()
+        if self._api_client is not None:
+            await self._api_client.aclose()
+
+    # -- bulk helpers ---------------------------------------------------------
+
+    async def gather(
+        self,
+        calls: Iterable[Awaitable[T]],
+        *,
+        limit: int | None = None,
+        return_exceptions: bool = False,
+    ) -> list[T | BaseException]:
+        """Await ``calls`` with at most ``limit`` running at once, preserving order."""
+        semaphore = asyncio.Semaphore(limit or self.concurrency)
+
+        async def run(call: Awaitable[T]) -> T:
+            async with semaphore:
+                return await call
+
+        return await asyncio.gather(*(run(c) for c in calls), return_exceptions=return_exceptions)
+
+    async def search_many(
+        self,
+        searches: list[dict[str, Any]],
+        *,
+        include_fields: list[str] | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Run many searches, packed into multi_search requests sent concurrently.
+
+        Each entry holds ``search_jobs`` keyword arguments. Results come back
+        in the same order.
+        """
+        compiled = [_search_params(include_fields=include_fields, **s) for s in searches]
+        batches = [compiled[i:i + MAX_MULTI_SEARCHES] for i in range(0, len(compiled), MAX_MULTI_SEARCHES)]
+        responses = await self.gather((self.multi_search({"searches": b}) for b in batches), limit=limit)
+        return [result for response in responses for result in response]
+
+    # -- Typesense ------------------------------------------------------------
+
+    async def multi_search(self, payload: dict[str, Any]) -> list[dict[str, Any]]:
+        resp = await self._search.post(TYPESENSE_SEARCH, content=_json.dumps(payload))
+        resp.raise_for_status()
+        return loads(resp.content)["results"]
+
+    async def search_jobs(self, **kwargs: Any) -> dict[str, Any]:
+        """Fetch one page of results; takes the same arguments as ``search_jobs``."""
+        return (await self.multi_search({"searches": [_search_params(**kwargs)]}))[0]
+
+    async def get_jobs_by_ids(
+        self,
+        job_ids: list[str],
+        *,
+        include_fields: list[str] | None = None,
+        limit: int | None = None,
+    ) -> tuple[list[dict[str, Any]], list[str]]:
+        """Look up jobs by ID; returns documents in input order and the IDs not found."""
+        unique = list(dict.fromkeys(job_ids))
+        payloads = id_lookup_payloads(unique, include_fields)
+        responses = await self.gather((self.multi_search(p) for p in payloads), limit=limit)
+        return collect_id_lookup(unique, [result for response in responses for result in response])
+
+    async def get_job(self, job_id: str, *, include_fields: list[str] | None = None) -> dict[str, Any] | None:
+        docs, _ = await self.get_jobs_by_ids([job_id], include_fields=include_fields)
+        return docs[0] if docs else None
+
+    async def get_facets(
+        self,
+        fields: list[str],
+        *,
+        max_values: int = 100,
+        **filters: Any,
+    ) -> tuple[int, dict[str, list[tuple[str, int]]]]:
+        search = facet_search_params(fields, max_values=max_values, **filters)
+        result = (await self.multi_search({"searches": [search]}))[0]
+        return result.get("found", 0), parse_facet_counts(result, fields)
+
+    # -- Simplify API ---------------------------------------------------------
+
+    def _api(self) -> httpx.AsyncClient:
+        if self._api_client is None:
+            stored = (None, None) if self._csrf and self._authorization else get_credentials() or (None, None)
+            csrf = self._csrf or stored[0]
+            auth = self._authorization or stored[1]
+            if not csrf or not auth:
+                raise NotAuthenticatedError("Not authenticated. Run 'simplify auth login' first.")
+            self._api_client = httpx.AsyncClient(
+                headers={
+                    "X-CSRF-TOKEN": csrf,
+                    "Content-Type": "application/json",
+                },
+                cookies={"csrf": csrf, "authorization": auth},
+                timeout=30.0,
+                follow_redirects=True,
+                **async_adaptive_transports(limits=self._limits),
+            )
+        return self._api_client
+
+    async def get(self, url: str, **params: Any) -> Any:
+        resp = await self._api().get(url, params=params)
+        resp.raise_for_status()
+        return loads(resp.content)
+
+    async def post(self, url: str, json: Any = None) -> Any:
+        resp = await self._api().post(url, json=json)
+        resp.raise_for_status()
+        return loads(resp.content)
+
+    async def get_profile(self) -> dict[str, Any]:
+        return await self.get(ME)
+
+    async def get_preferences(self) -> dict[str, Any]:
+        return await self.get(PREFERENCES)
+
+    async def get_resumes(self) -> list[dict[str, Any]]:
+        return await self.get(RESUMES)
+
+    async def list_tracker(self, page: int = 1, size: int = 20, status: str | None = None) -> dict[str, Any]:
+        params: dict[str, Any] = {"page": page, "size": size}
+        if status:
+            params["status"] = status
+        return await self.get(TRACKER, **params)
+
+    async def save_job(self, job_posting_id: str) -> dict[str, Any]:
+        return await self.post(TRACKER_SAVE, json={"job_posting_id": job_posting_id})
+
+    async def mark_applied(self, job_posting_id: str) -> dict[str, Any]:
+        return await self.post(TRACKER_APPLIED, json={"job_posting_id": job_posting_id})
+
+    async def update_status(self, tracker_id: str, status: str) -> dict[str, Any]:
+        return await self.post(TRACKER_STATUS_UPDATE, json={"id": tracker_id, "status": status})
+
+    async def export_csv(self) -> bytes:
+        resp = await self._api().get(TRACKER_EXPORT_CSV)
+        resp.raise_for_status()
+        return resp.content
+
+    async def get_stats(self) -> dict[str, Any]:
+        return await self.get(TRACKER_SANKEY)
+
+    async def save_jobs(
+        self,
+        job_posting_ids: list[str],
+        *,
+        limit: int | None = None,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Save many jobs; failures are returned in place rather than raised."""
+        return await self.gather((self.save_job(i) for i in job_posting_ids), limit=limit, return_exceptions=True)
+
+    async def mark_applied_many(
+        self,
+        job_posting_ids: list[str],
+        *,
+        limit: int | None = None,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Mark many jobs as applied; failures are returned in place rather than raised."""
+        return await self.gather((self.mark_applied(i) for i in job_posting_ids), limit=limit, return_exceptions=True)
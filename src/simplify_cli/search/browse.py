@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from simplify_cli.models.job import Job
+from simplify_cli.models.search import SearchResult
+from simplify_cli.search.client import TypesenseClient, fetch_jobs_by_ids, fetch_search
+
+
+class BrowseSession:
+    """One search paged interactively over a single pooled client.
+
+    Pages and job details are fetched on a small thread pool. Every page
+    fetched queues one lookup for the detail documents of its hits, and
+    ``prefetch_around`` queues the neighbours of the page being shown, so
+    flipping pages or opening a job usually finds the answer already there.
+    """
+
+    def __init__(
+        self,
+        client: TypesenseClient,
+        *,
+        per_page: int = 10,
+        page_fields: list[str] | None = None,
+        detail_fields: list[str] | None = None,
+        workers: int = 3,
+        **filters: Any,
+    ) -> None:
+        self.client = client
+        self.per_page = per_page
+        self.page_fields = page_fields
+        self.detail_fields = detail_fields
+        self.filters = filters
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="browse")
+        self._lock = threading.Lock()
+        self._pages: dict[int, Future[SearchResult]] = {}
+        # Each ID maps to the future of the batched lookup that covers it.
+        self._details: dict[str, Future[dict[str, Job]]] = {}
+
+    def __enter__(self) -> BrowseSession:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # Queued lookups are dropped, but one already running still holds the
+        # client, so wait for it before the caller closes the client and cache.
+        self._pool.shutdown(wait=True, cancel_futures=True)
+
+    def _page_future(self, page: int) -> Future[SearchResult]:
+        with self._lock:
+            future = self._pages.get(page)
+            if future is None or (future.done() and future.exception() is not None):
+                future = self._pool.submit(self._load_page, page)
+                self._pages[page] = future
+            return future
+
+    def _load_page(self, page: int) -> SearchResult:
+        result = fetch_search(
+            client=self.client,
+            page=page,
+            per_page=self.per_page,
+            include_fields=self.page_fields,
+            **self.filters,
+        )
+        # Still on the worker thread: queue the details so they race the user's first keypress.
+        self.prefetch_details([job.id for job in result.jobs])
+        return result
+
+    def _load_details(self, job_ids: list[str]) -> dict[str, Job]:
+        jobs, _ = fetch_jobs_by_ids(job_ids, self.client, self.detail_fields)
+        return {job.id: job for job in jobs}
+
+    def page_ready(self, page: int) -> bool:
+        return self._page_future(page).done()
+
+    def detail_ready(self, job_id: str) -> bool:
+        self.prefetch_details([job_id])
+        return self._details[job_id].done()
+
+    def page(self, page: int) -> SearchResult:
+        """Return ``page``, waiting for it if it is not fetched yet."""
+        return self._page_future(page).result()
+
+    def pages(self, result: SearchResult) -> int:
+        return max(1, (result.found + self.per_page - 1) // self.per_page)
+
+    def prefetch_details(self, job_ids: list[str]) -> None:
+        """Queue one batched lookup for the IDs whose details are not cached or in flight."""
+        with self._lock:
+            missing = [i for i in job_ids if i not in self._details]
+            if not missing:
+                return
+            future = self._pool.submit(self._load_details, missing)
+            for job_id in missing:
+                self._details[job_id] = future
+
+    def prefetch_around(self, page: int) -> None:
+        """Queue the pages either side of ``page``."""
+        last = self.pages(self.page(page))
+        for neighbour in (page + 1, page - 1):
+            if 1 <= neighbour <= last:
+                self._page_future(neighbour)
+
+    def detail(self, job_id: str) -> Job | None:
+        """The full document for ``job_id``, or None if it no longer exists."""
+        self.prefetch_details([job_id])
+        future = self._details[job_id]
+        try:
+            return future.result().get(job_id)
+        except Exception:
+            # Let a failed lookup be retried on the next request.
+            with self._lock:
+                if self._details.get(job_id) is future:
+                    del self._details[job_id]
+            raise
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import hashlib
+import json as _json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from simplify_cli.config import CONFIG_DIR, ensure_config_dir, load_config
+
+CACHE_FILE = CONFIG_DIR / "search-cache.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+CREATE TABLE IF NOT EXISTS counters (
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (kind, name)
+);
+"""
+
+
+def cache_key(payload: dict[str, Any]) -> str:
+    """Hash a multi_search payload independent of key order and whitespace."""
+    normalized = _json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(normalized.encode()).hexdigest()
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    age: float
+    fresh: bool
+
+
+class ResponseCache:
+    """SQLite-backed TTL/LRU cache for Typesense responses.
+
+    Entries younger than the TTL for their kind are fresh. Older entries are
+    still returned (``fresh=False``) for ``stale_while_revalidate`` seconds so
+    the caller can serve them while refreshing in the background. The total
+    body size is capped at ``max_bytes`` by evicting least recently used rows.
+    """
+
+    def __init__(self, path: Path = CACHE_FILE, settings: dict[str, Any] | None = None) -> None:
+        if settings is None:
+            settings = load_config()["cache"]
+        self.ttl: dict[str, float] = settings["ttl"]
+        self.max_bytes: int = settings["max_bytes"]
+        self.stale_while_revalidate: float = settings["stale_while_revalidate"]
+        self.path = path
+        ensure_config_dir()
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def _bump(self, kind: str, name: str) -> None:
+        self._db.execute(
+            "INSERT INTO counters (kind, name, value) VALUES (?, ?, 1) "
+            "ON CONFLICT (kind, name) DO UPDATE SET value = value + 1",
+            (kind, name),
+        )
+
+    def get(self, key: str, kind: str) -> CacheEntry | None:
+        now = time.time()
+        ttl = self.ttl.get(kind, 0)
+        with self._lock:
+            row = self._db.execute("SELECT body, stored_at FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._bump(kind, "misses")
+                return None
+            body, stored_at = row
+            age = now - stored_at
+            if age > ttl + self.stale_while_revalidate:
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._bump(kind, "misses")
+                return None
+            fresh = age <= ttl
+            self._db.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._bump(kind, "hits" if fresh else "stale")
+        return CacheEntry(body=body, age=age, fresh=fresh)
+
+    def put(self, key: str, kind: str, body: bytes) -> None:
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (key, kind, body, size, stored_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, kind, body, len(body), now, now),
+            )
+            self._evict()
+
+    def _evict(self) -> None:
+        (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_bytes:
+            return
+        freed = 0
+        victims: list[str] = []
+        for key, size in self._db.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            victims.append(key)
+            freed += size
+            if total - freed <= self.max_bytes:
+                break
+        self._db.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k in victims])
+
+    def clear(self) -> int:
+        with self._lock:
+            (count,) = self._db.execute("SELECT COUNT(*) FROM entries").fetchone()
+            self._db.execute("DELETE FROM entries")
+            self._db.execute("DELETE FROM counters")
+            self._db.execute("VACUUM")
+        return count
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries = {
+                kind: {"entries": count, "bytes": size}
+                for kind, count, size in self._db.execute(
+                    "SELECT kind, COUNT(*), COALESCE(SUM(size), 0) FROM entries GROUP BY kind"
+                )
+            }
+            counters: dict[str, dict[str, int]] = {}
+            for kind, name, value in self._db.execute("SELECT kind, name, value FROM counters"):
+                counters.setdefault(kind, {})[name] = value
+
+        kinds: dict[str, Any] = {}
+        for kind in sorted(set(entries) | set(counters) | set(self.ttl)):
+            c = counters.get(kind, {})
+            hits, stale, misses = c.get("hits", 0), c.get("stale", 0), c.get("misses", 0)
+            lookups = hits + stale + misses
+            kinds[kind] = {
+                **entries.get(kind, {"entries": 0, "bytes": 0}),
+                "ttl": self.ttl.get(kind, 0),
+                "hits": hits,
+                "stale_hits": stale,
+                "misses": misses,
+                "hit_ratio": round((hits + stale) / lookups, 3) if lookups else 0.0,
+            }
+        return {
+            "path": str(self.path),
+            "disk_bytes": self.path.stat().st_size if self.path.exists() else 0,
+            "max_bytes": self.max_bytes,
+            "kinds": kinds,
+        }
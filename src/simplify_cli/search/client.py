@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import atexit
+import importlib.util
 import json as _json
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from types import TracebackType
 from typing import Any
 
 import httpx
@@ -10,22 +16,164 @@ from simplify_cli.api.endpoints import (
     TYPESENSE_COLLECTION,
     TYPESENSE_SEARCH,
 )
+from simplify_cli.api.ratelimit import adaptive_transports
+from simplify_cli.config import load_config
+from simplify_cli.decode import decode_results, loads
+from simplify_cli.models.job import Job, JobBatch
+from simplify_cli.models.search import SearchResult
+from simplify_cli.search.cache import ResponseCache, cache_key
 from simplify_cli.search.filters import build_filter_by
 
+# Typesense rejects per_page values above this.
+MAX_PER_PAGE = 250
+DEFAULT_SORT = "_text_match:desc,shuffle_key:asc,posting_id:desc"
+# Default server-side cap on the number of searches in one multi_search request.
+MAX_MULTI_SEARCHES = 50
 
-def _typesense_post(payload: dict[str, Any]) -> dict[str, Any]:
-    resp = httpx.post(
-        TYPESENSE_SEARCH,
-        params={"x-typesense-api-key": TYPESENSE_API_KEY},
-        content=_json.dumps(payload),
-        headers={"Content-Type": "text/plain"},
-        timeout=15.0,
-    )
-    resp.raise_for_status()
-    return resp.json()["results"][0]
 
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
 
-def search_jobs(
+
+class TypesenseClient:
+    """Pooled keep-alive connection to the Typesense search cluster.
+
+    Pool limits and HTTP/2 are read from the ``[search]`` table of
+    ``config.toml``. HTTP/2 is only enabled when the ``h2`` package is
+    installed (``pip install 'simplify-cli[http2]'``).
+
+    When a ``ResponseCache`` is given, responses are served from it while
+    fresh; stale entries are returned immediately and refreshed on a
+    background thread. ``refresh=True`` skips cache reads but still stores
+    the new responses.
+    """
+
+    def __init__(
+        self,
+        settings: dict[str, Any] | None = None,
+        cache: ResponseCache | None = None,
+        refresh: bool = False,
+    ) -> None:
+        if settings is None:
+            settings = load_config()["search"]
+        limits = httpx.Limits(
+            max_connections=settings["max_connections"],
+            max_keepalive_connections=settings["max_keepalive_connections"],
+            keepalive_expiry=settings["keepalive_expiry"],
+        )
+        self._client = httpx.Client(
+            params={"x-typesense-api-key": TYPESENSE_API_KEY},
+            headers={"Content-Type": "text/plain"},
+            timeout=settings["timeout"],
+            **adaptive_transports(
+                retry_posts=True,
+                limits=limits,
+                http2=bool(settings["http2"]) and _http2_available(),
+            ),
+        )
+        self._cache = cache
+        self._refresh = refresh
+        self._revalidating: dict[str, threading.Thread] = {}
+        self._revalidate_lock = threading.Lock()
+
+    def __enter__(self) -> TypesenseClient:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for thread in list(self._revalidating.values()):
+            thread.join()
+        self._client.close()
+        if self._cache is not None:
+            self._cache.close()
+
+    def post(self, payload: dict[str, Any], kind: str = "search") -> dict[str, Any]:
+        return self.multi_search(payload, kind)[0]
+
+    def multi_search(self, payload: dict[str, Any], kind: str = "search") -> list[dict[str, Any]]:
+        """Send a multi_search payload and return one result per entry in ``searches``."""
+        return loads(self._fetch_cached(payload, kind))["results"]
+
+    def multi_search_results(self, payload: dict[str, Any], kind: str = "search") -> list[SearchResult]:
+        """Like ``multi_search``, but decoded straight from the response bytes into models."""
+        return decode_results(self._fetch_cached(payload, kind))
+
+    def _fetch(self, payload: dict[str, Any]) -> bytes:
+        resp = self._client.post(TYPESENSE_SEARCH, content=_json.dumps(payload))
+        resp.raise_for_status()
+        return resp.content
+
+    def _fetch_cached(self, payload: dict[str, Any], kind: str) -> bytes:
+        if self._cache is None:
+            return self._fetch(payload)
+        key = cache_key(payload)
+        if not self._refresh:
+            entry = self._cache.get(key, kind)
+            if entry is not None:
+                if not entry.fresh:
+                    self._revalidate(key, kind, payload)
+                return entry.body
+        body = self._fetch(payload)
+        self._cache.put(key, kind, body)
+        return body
+
+    def _revalidate(self, key: str, kind: str, payload: dict[str, Any]) -> None:
+        with self._revalidate_lock:
+            if key in self._revalidating:
+                return
+            thread = threading.Thread(target=self._refresh_entry, args=(key, kind, payload), daemon=True)
+            self._revalidating[key] = thread
+        thread.start()
+
+    def _refresh_entry(self, key: str, kind: str, payload: dict[str, Any]) -> None:
+        try:
+            body = self._fetch(payload)
+            if self._cache is not None:
+                self._cache.put(key, kind, body)
+        except httpx.HTTPError:
+            return
+        finally:
+            with self._revalidate_lock:
+                self._revalidating.pop(key, None)
+
+
+def open_client(*, use_cache: bool = True, refresh: bool = False) -> TypesenseClient:
+    """Build a client for CLI commands, wired to the on-disk response cache."""
+    config = load_config()
+    cache = ResponseCache(settings=config["cache"]) if use_cache and config["cache"]["enabled"] else None
+    return TypesenseClient(config["search"], cache=cache, refresh=refresh)
+
+
+_default_client: TypesenseClient | None = None
+_default_lock = threading.Lock()
+
+
+def get_default_client() -> TypesenseClient:
+    """Return the process-wide client, creating it on first use."""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = TypesenseClient()
+            atexit.register(_default_client.close)
+        return _default_client
+
+
+def _typesense_post(
+    payload: dict[str, Any],
+    client: TypesenseClient | None = None,
+    kind: str = "search",
+) -> dict[str, Any]:
+    return (client or get_default_client()).post(payload, kind)
+
+
+def _search_params(
     *,
     query: str = "*",
     location: str | None = None,
@@ -33,6 +181,12 @@ def search_jobs(
     category: str | None = None,
     job_type: str | None = None,
     min_salary: int | None = None,
+    updated_since: int | None = None,
+    exclude: dict[str, list[str]] | None = None,
+    sort_by: str = DEFAULT_SORT,
+    include_fields: list[str] | None = None,
+    group_by: str | None = None,
+    group_limit: int = 3,
     page: int = 1,
     per_page: int = 20,
 ) -> dict[str, Any]:
@@ -42,29 +196,319 @@ def search_jobs(
         category=category,
         job_type=job_type,
         min_salary=min_salary,
+        updated_since=updated_since,
+        exclude=exclude,
     )
 
     search_params: dict[str, Any] = {
+        "collection": TYPESENSE_COLLECTION,
         "q": query,
         "query_by": "title,company_name,functions,locations",
-        "sort_by": "_text_match:desc,shuffle_key:asc,posting_id:desc",
+        "sort_by": sort_by,
         "page": page,
         "per_page": per_page,
     }
     if filter_by:
         search_params["filter_by"] = filter_by
+    if include_fields:
+        search_params["include_fields"] = ",".join(include_fields)
+    if group_by:
+        search_params["group_by"] = group_by
+        search_params["group_limit"] = group_limit
+    return search_params
+
+
+def search_jobs(
+    *,
+    query: str = "*",
+    location: str | None = None,
+    experience: str | None = None,
+    category: str | None = None,
+    job_type: str | None = None,
+    min_salary: int | None = None,
+    updated_since: int | None = None,
+    exclude: dict[str, list[str]] | None = None,
+    sort_by: str = DEFAULT_SORT,
+    include_fields: list[str] | None = None,
+    group_by: str | None = None,
+    group_limit: int = 3,
+    page: int = 1,
+    per_page: int = 20,
+    client: TypesenseClient | None = None,
+) -> dict[str, Any]:
+    """Fetch one page of search results.
+
+    ``include_fields`` limits the document fields Typesense sends back. With
+    ``group_by``, the result holds ``grouped_hits`` (up to ``group_limit``
+    hits per group, ``per_page`` groups per page) and ``found`` counts groups.
+    """
+    search_params = _search_params(
+        query=query,
+        location=location,
+        experience=experience,
+        category=category,
+        job_type=job_type,
+        min_salary=min_salary,
+        updated_since=updated_since,
+        exclude=exclude,
+        sort_by=sort_by,
+        include_fields=include_fields,
+        group_by=group_by,
+        group_limit=group_limit,
+        page=page,
+        per_page=per_page,
+    )
+    return _typesense_post({"searches": [search_params]}, client)
+
+
+def fetch_search(client: TypesenseClient | None = None, **kwargs: Any) -> SearchResult:
+    """``search_jobs`` decoded into models, for callers that only render the result."""
+    client = client or get_default_client()
+    return client.multi_search_results({"searches": [_search_params(**kwargs)]})[0]
+
+
+def run_searches(
+    searches: dict[str, dict[str, Any]],
+    client: TypesenseClient | None = None,
+    include_fields: list[str] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Run several named searches in as few multi_search requests as possible.
+
+    Each value holds ``search_jobs`` keyword arguments (query, filters,
+    page, per_page). Results are returned under the same names.
+    """
+    client = client or get_default_client()
+    return _run_batched(searches, include_fields, client.multi_search)
+
+
+def fetch_searches(
+    searches: dict[str, dict[str, Any]],
+    client: TypesenseClient | None = None,
+    include_fields: list[str] | None = None,
+) -> dict[str, SearchResult]:
+    """``run_searches`` decoded into models."""
+    client = client or get_default_client()
+    return _run_batched(searches, include_fields, client.multi_search_results)
+
+
+def _run_batched(
+    searches: dict[str, dict[str, Any]],
+    include_fields: list[str] | None,
+    multi_search: Callable[[dict[str, Any]], list[Any]],
+) -> dict[str, Any]:
+    names = list(searches)
+    compiled = [_search_params(include_fields=include_fields, **searches[name]) for name in names]
+
+    results: dict[str, Any] = {}
+    for start in range(0, len(compiled), MAX_MULTI_SEARCHES):
+        batch = compiled[start:start + MAX_MULTI_SEARCHES]
+        for name, result in zip(names[start:start + MAX_MULTI_SEARCHES], multi_search({"searches": batch})):
+            results[name] = result
+    return results
+
+
+def facet_search_params(fields: list[str], *, max_values: int = 100, **filters: Any) -> dict[str, Any]:
+    """Build a search that returns facet counts for ``fields`` and no documents."""
+    search_params = _search_params(per_page=0, **filters)
+    search_params["facet_by"] = ",".join(fields)
+    search_params["max_facet_values"] = max_values
+    return search_params
+
+
+def parse_facet_counts(result: dict[str, Any], fields: list[str]) -> dict[str, list[tuple[str, int]]]:
+    counts: dict[str, list[tuple[str, int]]] = {field: [] for field in fields}
+    for facet in result.get("facet_counts", []):
+        counts[facet.get("field_name", "")] = [(c["value"], c["count"]) for c in facet.get("counts", [])]
+    return counts
+
+
+def get_facets(
+    fields: list[str],
+    *,
+    query: str = "*",
+    location: str | None = None,
+    experience: str | None = None,
+    category: str | None = None,
+    job_type: str | None = None,
+    min_salary: int | None = None,
+    max_values: int = 100,
+    client: TypesenseClient | None = None,
+) -> tuple[int, dict[str, list[tuple[str, int]]]]:
+    """Count matching jobs per facet value without fetching any documents.
+
+    Takes the same filters as ``search_jobs`` and returns the total number of
+    matches and, for each field, ``(value, count)`` pairs by descending count.
+    """
+    search_params = facet_search_params(
+        fields,
+        max_values=max_values,
+        query=query,
+        location=location,
+        experience=experience,
+        category=category,
+        job_type=job_type,
+        min_salary=min_salary,
+    )
+    result = _typesense_post({"searches": [search_params]}, client, kind="facets")
+    return result.get("found", 0), parse_facet_counts(result, fields)
+
+
+def iter_search_hits(
+    *,
+    max_results: int | None = None,
+    per_page: int = MAX_PER_PAGE,
+    workers: int = 4,
+    client: TypesenseClient | None = None,
+    **filters: Any,
+) -> Iterator[dict[str, Any]]:
+    """Yield every hit for a search, fetching pages concurrently.
+
+    The first page is fetched on its own to learn ``found``; the remaining
+    pages are requested with at most ``workers`` in flight and their hits are
+    yielded as each page completes, so pages may arrive out of order.
+    """
+    client = client or get_default_client()
+    per_page = max(1, min(per_page, MAX_PER_PAGE))
+    if max_results is not None:
+        per_page = min(per_page, max(max_results, 1))
+
+    first = search_jobs(page=1, per_page=per_page, client=client, **filters)
+    found = first.get("found", 0)
+    limit = found if max_results is None else min(found, max_results)
+
+    emitted = 0
+    for hit in first.get("hits", []):
+        if emitted >= limit:
+            return
+        yield hit
+        emitted += 1
+
+    last_page = (limit + per_page - 1) // per_page
+    pages = iter(range(2, last_page + 1))
+
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        pending: set[Future[dict[str, Any]]] = set()
+
+        def submit_next() -> None:
+            page = next(pages, None)
+            if page is not None:
+                pending.add(pool.submit(search_jobs, page=page, per_page=per_page, client=client, **filters))
+
+        for _ in range(max(1, workers)):
+            submit_next()
+
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    pending.discard(fut)
+                    data = fut.result()
+                    submit_next()
+                    for hit in data.get("hits", []):
+                        if emitted >= limit:
+                            return
+                        yield hit
+                        emitted += 1
+        finally:
+            for fut in pending:
+                fut.cancel()
+
+
+def collect_jobs(
+    *,
+    max_results: int | None = None,
+    per_page: int = MAX_PER_PAGE,
+    workers: int = 4,
+    client: TypesenseClient | None = None,
+    **filters: Any,
+) -> JobBatch:
+    """Gather every matching job into a compact ``JobBatch``.
+
+    Hits are appended as they stream in, so only one page of documents is
+    held as dicts at a time.
+    """
+    hits = iter_search_hits(max_results=max_results, per_page=per_page, workers=workers, client=client, **filters)
+    return JobBatch.from_documents(hit["document"] for hit in hits)
+
+
+def get_job_by_id(
+    job_id: str,
+    client: TypesenseClient | None = None,
+    include_fields: list[str] | None = None,
+) -> dict[str, Any] | None:
+    docs, _ = get_jobs_by_ids([job_id], client, include_fields)
+    return docs[0] if docs else None
+
+
+def id_lookup_payloads(job_ids: list[str], include_fields: list[str] | None = None) -> list[dict[str, Any]]:
+    """Build the multi_search payloads that fetch ``job_ids``.
+
+    IDs are packed ``MAX_PER_PAGE`` at a time into ``id:[...]`` filters, and up
+    to ``MAX_MULTI_SEARCHES`` of those go in each payload.
+    """
+    chunks = [job_ids[i:i + MAX_PER_PAGE] for i in range(0, len(job_ids), MAX_PER_PAGE)]
+    projection: dict[str, str] = {}
+    if include_fields:
+        projection["include_fields"] = ",".join(dict.fromkeys(["id", *include_fields]))
+    return [
+        {
+            "searches": [
+                {
+                    "collection": TYPESENSE_COLLECTION,
+                    "q": "*",
+                    "filter_by": "id:[" + ",".join(f"`{job_id}`" for job_id in chunk) + "]",
+                    "per_page": len(chunk),
+                    **projection,
+                }
+                for chunk in chunks[start:start + MAX_MULTI_SEARCHES]
+            ]
+        }
+        for start in range(0, len(chunks), MAX_MULTI_SEARCHES)
+    ]
+
+
+def collect_id_lookup(
+    job_ids: list[str],
+    results: list[dict[str, Any]],
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Order the documents from id lookup results by ``job_ids`` and list the misses."""
+    found: dict[str, dict[str, Any]] = {}
+    for result in results:
+        for hit in result.get("hits", []):
+            doc = hit["document"]
+            found[doc.get("id", "")] = doc
+    docs = [found[job_id] for job_id in job_ids if job_id in found]
+    missing = [job_id for job_id in job_ids if job_id not in found]
+    return docs, missing
+
+
+def get_jobs_by_ids(
+    job_ids: list[str],
+    client: TypesenseClient | None = None,
+    include_fields: list[str] | None = None,
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Look up many jobs with as few round trips as possible.
 
-    return _typesense_post({"searches": [{"collection": TYPESENSE_COLLECTION, **search_params}]})
+    Returns the documents found, in input order, and the IDs that were not.
+    """
+    client = client or get_default_client()
+    unique = list(dict.fromkeys(job_ids))
+    results: list[dict[str, Any]] = []
+    for payload in id_lookup_payloads(unique, include_fields):
+        results.extend(client.multi_search(payload, kind="view"))
+    return collect_id_lookup(unique, results)
 
 
-def get_job_by_id(job_id: str) -> dict[str, Any] | None:
-    result = _typesense_post({
-        "searches": [{
-            "collection": TYPESENSE_COLLECTION,
-            "q": "*",
-            "filter_by": f"id:={job_id}",
-            "per_page": 1,
-        }]
-    })
-    hits = result.get("hits", [])
-    return hits[0]["document"] if hits else None
+def fetch_jobs_by_ids(
+    job_ids: list[str],
+    client: TypesenseClient | None = None,
+    include_fields: list[str] | None = None,
+) -> tuple[list[Job], list[str]]:
+    """``get_jobs_by_ids`` decoded into ``Job`` models."""
+    client = client or get_default_client()
+    unique = list(dict.fromkeys(job_ids))
+    found: dict[str, Job] = {}
+    for payload in id_lookup_payloads(unique, include_fields):
+        for result in client.multi_search_results(payload, kind="view"):
+            found.update((job.id, job) for job in result.jobs)
+    return [found[i] for i in unique if i in found], [i for i in unique if i not in found]
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from simplify_cli.models.job import JobBatch
+
 
 def build_filter_by(
     *,
@@ -8,7 +10,10 @@ def build_filter_by(
     category: str | None = None,
     job_type: str | None = None,
     min_salary: int | None = None,
+    updated_since: int | None = None,
+    exclude: dict[str, list[str]] | None = None,
 ) -> str:
+    """Build a Typesense ``filter_by``; ``exclude`` drops documents having any of a field's values."""
     parts: list[str] = []
 
     if location:
@@ -21,5 +26,73 @@ def build_filter_by(
         parts.append(f"type:=[`{job_type}`]")
     if min_salary is not None:
         parts.append(f"max_salary:>={min_salary}")
+    if updated_since is not None:
+        parts.append(f"updated_date:>={updated_since}")
+    for field, values in (exclude or {}).items():
+        if values:
+            parts.append(f"{field}:!=[{','.join(f'`{v}`' for v in values)}]")
 
     return " && ".join(parts) if parts else ""
+
+
+def build_sql_where(
+    *,
+    location: str | None = None,
+    experience: str | None = None,
+    category: str | None = None,
+    job_type: str | None = None,
+    min_salary: int | None = None,
+    updated_since: int | None = None,
+) -> tuple[list[str], list[object]]:
+    """SQL counterpart of ``build_filter_by`` for the local jobs mirror."""
+    clauses: list[str] = []
+    params: list[object] = []
+
+    for field, value in (("countries", location), ("experience_level", experience), ("functions", category)):
+        if value:
+            clauses.append(
+                "EXISTS (SELECT 1 FROM job_values v WHERE v.job_id = jobs.id AND v.field = ? AND v.value = ?)"
+            )
+            params.extend([field, value])
+    if job_type:
+        clauses.append("jobs.type = ?")
+        params.append(job_type)
+    if min_salary is not None:
+        clauses.append("jobs.max_salary >= ?")
+        params.append(min_salary)
+    if updated_since is not None:
+        clauses.append("jobs.updated_date >= ?")
+        params.append(updated_since)
+
+    return clauses, params
+
+
+def filter_jobs(
+    jobs: JobBatch,
+    *,
+    experience: str | None = None,
+    category: str | None = None,
+    job_type: str | None = None,
+    min_salary: int | None = None,
+    updated_since: int | None = None,
+) -> JobBatch:
+    """In-memory counterpart of ``build_filter_by``, applied column-wise to a batch.
+
+    There is no ``location`` filter: the public API key strips ``countries``
+    from documents, so a batch never has it.
+    """
+    rows: list[int] | range = range(len(jobs))
+    for field, value in (("experience_level", experience), ("functions", category)):
+        if value:
+            column = jobs.column(field)
+            rows = [i for i in rows if value in column[i]]
+    if job_type:
+        column = jobs.column("type")
+        rows = [i for i in rows if column[i] == job_type]
+    if min_salary is not None:
+        column = jobs.column("max_salary")
+        rows = [i for i in rows if column[i] >= min_salary]  # NaN (no salary) never matches
+    if updated_since is not None:
+        column = jobs.column("updated_date")
+        rows = [i for i in rows if column[i] >= updated_since]
+    return jobs.take(rows)
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import json as _json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from simplify_cli.api.endpoints import TYPESENSE_COLLECTION
+from simplify_cli.config import CONFIG_DIR, ensure_config_dir
+from simplify_cli.decode import decode, loads
+from simplify_cli.models.search import SearchResult
+from simplify_cli.search.client import MAX_PER_PAGE, TypesenseClient, get_facets, iter_search_hits
+from simplify_cli.search.filters import build_sql_where
+
+MIRROR_FILE = CONFIG_DIR / "jobs.db"
+
+# Facet fields a sync can be partitioned by, mapped to the search_jobs filter
+# argument that selects one value of that facet.
+PARTITION_FIELDS = {
+    "type": "job_type",
+    "functions": "category",
+    "experience_level": "experience",
+}
+
+# Multi-valued document fields stored in job_values for filtering.
+VALUE_FIELDS = ("experience_level", "functions")
+
+_SCHEMA = """
+CREATE TABLE jobs (
+    id TEXT PRIMARY KEY,
+    posting_id TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    company_name TEXT NOT NULL DEFAULT '',
+    company_id TEXT NOT NULL DEFAULT '',
+    type TEXT NOT NULL DEFAULT '',
+    min_salary REAL,
+    max_salary REAL,
+    updated_date INTEGER NOT NULL DEFAULT 0,
+    doc TEXT NOT NULL
+);
+CREATE TABLE job_values (
+    job_id TEXT NOT NULL,
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (field, value, job_id)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE jobs_fts USING fts5(
+    title, company_name, functions, locations,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_SENTINEL = object()
+
+
+def _country_ids(client: TypesenseClient, country: str) -> list[str]:
+    """Return the IDs of every job in a country.
+
+    ``countries`` is excluded from documents by the public API key, so it is
+    recovered by filtering on it and fetching IDs only.
+    """
+    ids: list[str] = []
+    page = 1
+    while True:
+        result = client.post({
+            "searches": [{
+                "collection": TYPESENSE_COLLECTION,
+                "q": "*",
+                "filter_by": f"countries:=[`{country}`]",
+                "include_fields": "id",
+                "page": page,
+                "per_page": MAX_PER_PAGE,
+            }]
+        })
+        hits = result.get("hits", [])
+        ids.extend(hit["document"]["id"] for hit in hits)
+        if len(hits) < MAX_PER_PAGE:
+            return ids
+        page += 1
+
+
+def _insert_job(db: sqlite3.Connection, doc: dict[str, Any]) -> bool:
+    job_id = doc.get("id", "")
+    if not job_id:
+        return False
+    if db.execute("SELECT 1 FROM jobs WHERE id = ?", (job_id,)).fetchone():
+        return False
+    cur = db.execute(
+        "INSERT INTO jobs (id, posting_id, title, company_name, company_id, type, "
+        "min_salary, max_salary, updated_date, doc) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            job_id,
+            doc.get("posting_id", ""),
+            doc.get("title", ""),
+            doc.get("company_name", ""),
+            doc.get("company_id", ""),
+            doc.get("type", ""),
+            doc.get("min_salary"),
+            doc.get("max_salary"),
+            doc.get("updated_date") or 0,
+            _json.dumps(doc),
+        ),
+    )
+    db.execute(
+        "INSERT INTO jobs_fts (rowid, title, company_name, functions, locations) VALUES (?, ?, ?, ?, ?)",
+        (
+            cur.lastrowid,
+            doc.get("title", ""),
+            doc.get("company_name", ""),
+            " ".join(doc.get("functions") or []),
+            " ".join(doc.get("locations") or []),
+        ),
+    )
+    for field in VALUE_FIELDS:
+        db.executemany(
+            "INSERT OR IGNORE INTO job_values (job_id, field, value) VALUES (?, ?, ?)",
+            [(job_id, field, v) for v in doc.get(field) or []],
+        )
+    return True
+
+
+def sync_mirror(
+    client: TypesenseClient,
+    *,
+    partition_by: str = "type",
+    workers: int = 4,
+    path: Path = MIRROR_FILE,
+    progress: Callable[[int], None] | None = None,
+) -> dict[str, Any]:
+    """Crawl the whole jobs collection into a fresh SQLite mirror.
+
+    The collection is split into one partition per value of ``partition_by``,
+    plus a catch-all for jobs with none of those values, and partitions are
+    crawled in parallel. Pages are handed to a single
+    writer through a bounded queue, and the new database replaces the old
+    one atomically when the crawl finishes.
+    """
+    if partition_by not in PARTITION_FIELDS:
+        raise ValueError(f"Cannot partition by {partition_by!r}; choose from {', '.join(PARTITION_FIELDS)}")
+    arg = PARTITION_FIELDS[partition_by]
+    found, facets = get_facets([partition_by, "countries"], max_values=1000, client=client)
+    values = [value for value, _ in facets[partition_by]]
+    # Each partition is a set of search_jobs filters; the last one catches jobs
+    # with no value for the field, or a value beyond the facet limit.
+    partitions = [{arg: value} for value in values]
+    partitions.append({"exclude": {partition_by: values}})
+    countries = [value for value, _ in facets["countries"]]
+
+    ensure_config_dir()
+    tmp_path = path.with_suffix(".db.tmp")
+    tmp_path.unlink(missing_ok=True)
+    db = sqlite3.connect(tmp_path)
+    db.executescript(_SCHEMA)
+
+    pages: queue.Queue[Any] = queue.Queue(maxsize=workers * 4)
+    errors: list[BaseException] = []
+
+    def crawl(partition: dict[str, Any]) -> None:
+        try:
+            batch: list[dict[str, Any]] = []
+            for hit in iter_search_hits(per_page=MAX_PER_PAGE, workers=1, client=client, **partition):
+                batch.append(hit["document"])
+                if len(batch) == MAX_PER_PAGE:
+                    pages.put(batch)
+                    batch = []
+            if batch:
+                pages.put(batch)
+        except BaseException as e:  # surfaced to the caller after the crawl
+            errors.append(e)
+
+    def tag_country(country: str) -> None:
+        try:
+            pages.put((country, _country_ids(client, country)))
+        except BaseException as e:
+            errors.append(e)
+
+    def run_all() -> None:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            list(pool.map(crawl, partitions))
+            list(pool.map(tag_country, countries))
+        pages.put(_SENTINEL)
+
+    producer = threading.Thread(target=run_all, daemon=True)
+    producer.start()
+
+    total = 0
+    try:
+        with db:
+            while (item := pages.get()) is not _SENTINEL:
+                if isinstance(item, tuple):
+                    country, ids = item
+                    db.executemany(
+                        "INSERT OR IGNORE INTO job_values (job_id, field, value) VALUES (?, 'countries', ?)",
+                        [(job_id, country) for job_id in ids],
+                    )
+                    continue
+                total += sum(_insert_job(db, doc) for doc in item)
+                if progress:
+                    progress(total)
+        producer.join()
+        if errors:
+            raise errors[0]
+        with db:
+            db.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [("synced_at", str(int(time.time()))), ("partition_by", partition_by), ("count", str(total))],
+            )
+        db.close()
+    except BaseException:
+        db.close()
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    os.replace(tmp_path, path)
+    # Jobs can still slip through if the collection changes mid-crawl; callers warn on a shortfall.
+    return {
+        "count": total,
+        "found": found,
+        "missing": max(0, found - total),
+        "partitions": len(partitions),
+        "countries": len(countries),
+    }
+
+
+def _fts_query(query: str) -> str:
+    terms = [t.replace('"', '""') for t in query.split()]
+    return " ".join(f'"{t}"*' for t in terms)
+
+
+def mirror_info(path: Path = MIRROR_FILE) -> dict[str, str] | None:
+    if not path.exists():
+        return None
+    db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        return dict(db.execute("SELECT key, value FROM meta").fetchall())
+    finally:
+        db.close()
+
+
+def search_mirror_json(
+    *,
+    query: str = "*",
+    location: str | None = None,
+    experience: str | None = None,
+    category: str | None = None,
+    job_type: str | None = None,
+    min_salary: int | None = None,
+    include_fields: list[str] | None = None,
+    page: int = 1,
+    per_page: int = 20,
+    path: Path = MIRROR_FILE,
+) -> str:
+    """Answer a search from the local mirror as the JSON text ``search_jobs`` would return.
+
+    Stored documents are spliced in as-is unless ``include_fields`` asks for
+    a subset of their fields.
+    """
+    if not path.exists():
+        raise FileNotFoundError(path)
+    where, params = build_sql_where(
+        location=location,
+        experience=experience,
+        category=category,
+        job_type=job_type,
+        min_salary=min_salary,
+    )
+
+    if query.strip() and query.strip() != "*":
+        source = "jobs JOIN jobs_fts ON jobs_fts.rowid = jobs.rowid"
+        clauses = ["jobs_fts MATCH ?", *where]
+        params = [_fts_query(query), *params]
+        order = "bm25(jobs_fts), jobs.posting_id DESC"
+    else:
+        source = "jobs"
+        clauses = where
+        order = "jobs.posting_id DESC"
+    where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+    db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        (found,) = db.execute(f"SELECT COUNT(*) FROM {source} {where_sql}", params).fetchone()
+        rows = db.execute(
+            f"SELECT jobs.doc FROM {source} {where_sql} ORDER BY {order} LIMIT ? OFFSET ?",
+            [*params, per_page, (page - 1) * per_page],
+        ).fetchall()
+    finally:
+        db.close()
+
+    docs = [doc for (doc,) in rows]
+    if include_fields:
+        docs = [_json.dumps({k: d[k] for k in include_fields if k in d}) for d in map(loads, docs)]
+    hits = ",".join(f'{{"document":{doc}}}' for doc in docs)
+    return f'{{"found":{found},"page":{page},"hits":[{hits}]}}'
+
+
+def search_mirror(**kwargs: Any) -> dict[str, Any]:
+    """Answer a search from the local mirror in the same shape as ``search_jobs``."""
+    return loads(search_mirror_json(**kwargs))
+
+
+def fetch_mirror_search(**kwargs: Any) -> SearchResult:
+    """Answer a search from the local mirror decoded into a ``SearchResult``."""
+    return decode(search_mirror_json(**kwargs), SearchResult)
+
+
+def iter_mirror_hits(
+    *,
+    max_results: int | None = None,
+    per_page: int = MAX_PER_PAGE,
+    path: Path = MIRROR_FILE,
+    **filters: Any,
+) -> Iterator[dict[str, Any]]:
+    """Yield every matching hit from the local mirror, a page at a time."""
+    emitted = 0
+    page = 1
+    while True:
+        hits = search_mirror(page=page, per_page=per_page, path=path, **filters)["hits"]
+        for hit in hits:
+            if max_results is not None and emitted >= max_results:
+                return
+            yield hit
+            emitted += 1
+        if len(hits) < per_page:
+            return
+        page += 1
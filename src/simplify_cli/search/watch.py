@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import hashlib
+import json as _json
+import os
+from typing import Any
+
+from simplify_cli.config import CONFIG_DIR, ensure_config_dir
+from simplify_cli.search.client import TypesenseClient, iter_search_hits, search_jobs
+
+WATCH_STATE_FILE = CONFIG_DIR / "watch-state.json"
+
+
+def watch_key(filters: dict[str, Any]) -> str:
+    """Derive a stable state key from the filters of a watched query."""
+    normalized = _json.dumps({k: v for k, v in filters.items() if v is not None}, sort_keys=True)
+    return hashlib.sha256(normalized.encode()).hexdigest()[:16]
+
+
+def load_watch_state() -> dict[str, Any]:
+    if not WATCH_STATE_FILE.exists():
+        return {}
+    with open(WATCH_STATE_FILE) as f:
+        return _json.load(f)
+
+
+def save_watch_state(state: dict[str, Any]) -> None:
+    ensure_config_dir()
+    tmp = WATCH_STATE_FILE.with_suffix(".tmp")
+    tmp.write_text(_json.dumps(state, indent=2))
+    os.replace(tmp, WATCH_STATE_FILE)
+
+
+def poll_new_jobs(
+    client: TypesenseClient,
+    mark: dict[str, Any] | None,
+    **filters: Any,
+) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+    """Return jobs posted or updated since ``mark`` and the advanced mark.
+
+    A mark records the highest ``updated_date`` seen and the posting IDs at
+    that exact timestamp. Each poll asks Typesense only for documents at or
+    after that timestamp and drops the ones already seen, so ties on the
+    boundary are neither lost nor repeated. Without a mark, the newest
+    matching job is used as the starting point and nothing is returned.
+    """
+    if mark is None:
+        newest = search_jobs(client=client, sort_by="updated_date:desc", per_page=1, **filters).get("hits", [])
+        if not newest:
+            return [], {"updated_date": 0, "posting_ids": []}
+        doc = newest[0]["document"]
+        return [], {"updated_date": doc.get("updated_date", 0), "posting_ids": [doc.get("posting_id", "")]}
+
+    since = mark["updated_date"]
+    seen = set(mark["posting_ids"])
+    new: list[dict[str, Any]] = []
+    for hit in iter_search_hits(client=client, updated_since=since, sort_by="updated_date:asc", **filters):
+        doc = hit["document"]
+        if doc.get("updated_date", 0) == since and doc.get("posting_id", "") in seen:
+            continue
+        new.append(doc)
+
+    if not new:
+        return [], mark
+    new.sort(key=lambda d: d.get("updated_date", 0))
+    top = new[-1].get("updated_date", 0)
+    at_top = {d.get("posting_id", "") for d in new if d.get("updated_date", 0) == top}
+    if top == since:
+        at_top |= seen
+    return new, {"updated_date": top, "posting_ids": sorted(at_top)}
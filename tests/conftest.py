@@ -0,0 +1,162 @@
+"""Shared fixtures.
+
+``CONFIG_DIR`` is resolved when ``simplify_cli.config`` is first imported, so
+the config directory is pointed at a throwaway location here, at collection
+time, and ``simplify_cli`` is only imported inside fixtures. Credentials come
+from the environment so no keyring is touched.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import httpx
+import pytest
+
+os.environ["XDG_CONFIG_HOME"] = tempfile.mkdtemp(prefix="simplify-cli-tests-")
+os.environ["SIMPLIFY_CSRF_TOKEN"] = "test-csrf"
+os.environ["SIMPLIFY_AUTH_TOKEN"] = "test-auth"
+
+STATUS_CODES = {"saved": 1, "applied": 2, "interviewing": 3, "offer": 4, "rejected": 5, "withdrawn": 6}
+
+
+def tracker_item(n: int, status: int = 1) -> dict[str, Any]:
+    """Tracker item ``n``; higher numbers were tracked earlier."""
+    tracked = (datetime(2026, 1, 1, tzinfo=timezone.utc) - timedelta(hours=n)).strftime("%Y-%m-%dT%H:%M:%SZ")
+    return {
+        "id": f"item-{n:04d}",
+        "job_posting_id": f"job-{n:04d}",
+        "job_posting_title": f"Engineer {n}",
+        "company": {"name": f"Company {n % 7}"},
+        "tracked_date": tracked,
+        "status_events": [{"status": status, "timestamp": tracked}],
+    }
+
+
+class _DroppingStream(httpx.SyncByteStream):
+    def __init__(self, body: bytes, cut: int | None) -> None:
+        self.body = body
+        self.cut = cut
+
+    def __iter__(self) -> Iterator[bytes]:
+        if self.cut is None:
+            yield self.body
+            return
+        yield self.body[: self.cut]
+        raise httpx.ReadError("connection dropped")
+
+
+def current_status(item: dict[str, Any]) -> int:
+    return max(item["status_events"], key=lambda e: e["timestamp"])["status"]
+
+
+class FakeTracker:
+    """Just enough of the Simplify tracker API, served through ``httpx.MockTransport``.
+
+    Items are kept newest-tracked first, as the real list endpoint returns
+    them. Job posting IDs in ``fail`` get a 500 from the write endpoints.
+    """
+
+    def __init__(self) -> None:
+        self.items: list[dict[str, Any]] = []
+        self.fail: set[str] = set()
+        self.requests: list[httpx.Request] = []
+        self.sankey: Any = []
+        self.export = b""
+        self.etag = '"v1"'
+        self.export_status = 200
+        # Each export response is cut off with a ReadError after the next number of bytes in here.
+        self.drops: list[int] = []
+
+    def seed(self, count: int) -> None:
+        self.items = [tracker_item(n) for n in range(count)]
+
+    def set_status(self, item_id: str, status: str, timestamp: str = "2026-10-01T00:00:00Z") -> None:
+        for item in self.items:
+            if item["id"] == item_id:
+                item["status_events"].append({"status": STATUS_CODES[status], "timestamp": timestamp})
+                return
+        raise KeyError(item_id)
+
+    def pages_read(self) -> int:
+        from simplify_cli.api.endpoints import TRACKER
+
+        return sum(1 for r in self.requests if r.method == "GET" and r.url.path == httpx.URL(TRACKER).path)
+
+    def export_requests(self) -> list[httpx.Request]:
+        from simplify_cli.api.endpoints import TRACKER_EXPORT_CSV
+
+        return [r for r in self.requests if r.url.path == httpx.URL(TRACKER_EXPORT_CSV).path]
+
+    def _export(self, request: httpx.Request) -> httpx.Response:
+        if self.export_status != 200:
+            return httpx.Response(self.export_status)
+        total = len(self.export)
+        start = 0
+        headers = {"ETag": self.etag}
+        ranged = request.headers.get("Range")
+        if ranged and request.headers.get("If-Range", self.etag) == self.etag:
+            start = int(ranged.removeprefix("bytes=").rstrip("-"))
+            if start >= total:
+                return httpx.Response(416)
+            headers["Content-Range"] = f"bytes {start}-{total - 1}/{total}"
+        body = self.export[start:]
+        headers["Content-Length"] = str(len(body))
+        cut = self.drops.pop(0) if self.drops else None
+        return httpx.Response(206 if start else 200, headers=headers, stream=_DroppingStream(body, cut))
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        from simplify_cli.api.endpoints import (
+            TRACKER,
+            TRACKER_APPLIED,
+            TRACKER_EXPORT_CSV,
+            TRACKER_SANKEY,
+            TRACKER_SAVE,
+            TRACKER_STATUS_UPDATE,
+        )
+
+        self.requests.append(request)
+        path = request.url.path
+        if request.method == "GET" and path == httpx.URL(TRACKER_EXPORT_CSV).path:
+            return self._export(request)
+        if request.method == "GET" and path == httpx.URL(TRACKER_SANKEY).path:
+            return httpx.Response(200, json=self.sankey)
+        if request.method == "GET" and path == httpx.URL(TRACKER).path:
+            page = int(request.url.params.get("page", 1))
+            size = int(request.url.params.get("size", 20))
+            items = self.items
+            status = request.url.params.get("status")
+            if status:
+                items = [i for i in items if current_status(i) == STATUS_CODES[status]]
+            chunk = items[(page - 1) * size : page * size]
+            pages = max(1, (len(items) + size - 1) // size)
+            return httpx.Response(200, json={"total": len(items), "items": chunk, "page": page, "size": size, "pages": pages})
+        if request.method == "POST":
+            body = json.loads(request.content)
+            key = body.get("job_posting_id") or body.get("id")
+            if key in self.fail:
+                return httpx.Response(500)
+            if path in (httpx.URL(TRACKER_SAVE).path, httpx.URL(TRACKER_APPLIED).path):
+                return httpx.Response(200, json={"ok": True})
+            if path == httpx.URL(TRACKER_STATUS_UPDATE).path:
+                self.set_status(key, body["status"])
+                return httpx.Response(200, json={"ok": True})
+        return httpx.Response(404)
+
+
+@pytest.fixture
+def tracker_api(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeTracker]:
+    """Route every ``SimplifyAPIClient`` to a fresh ``FakeTracker`` and start without a replica."""
+    from simplify_cli.api import client as api_client
+    from simplify_cli.api.tracker_replica import REPLICA_FILE
+
+    fake = FakeTracker()
+    monkeypatch.setattr(api_client, "adaptive_transports", lambda: {"transport": httpx.MockTransport(fake.handle)})
+    REPLICA_FILE.unlink(missing_ok=True)
+    yield fake
+    REPLICA_FILE.unlink(missing_ok=True)
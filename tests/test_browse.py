@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from simplify_cli.models.search import SearchResult
+from simplify_cli.search import browse
+from simplify_cli.search.browse import BrowseSession
+
+
+def test_close_waits_for_running_fetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    started = threading.Event()
+    finished = threading.Event()
+
+    def slow_search(**kwargs: Any) -> SearchResult:
+        started.set()
+        time.sleep(0.2)
+        finished.set()
+        return SearchResult()
+
+    monkeypatch.setattr(browse, "fetch_search", slow_search)
+    session = BrowseSession(client=None, workers=1)  # the stub never touches the client
+    session._page_future(1)
+    queued = session._page_future(2)
+    assert started.wait(5)
+    session.close()
+    assert finished.is_set()
+    assert queued.cancelled()
+
+
+def test_pages_rounds_up() -> None:
+    session = BrowseSession(client=None, per_page=10)
+    assert session.pages(SearchResult(found=0)) == 1
+    assert session.pages(SearchResult(found=21)) == 3
+    session.close()
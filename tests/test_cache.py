@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+
+from simplify_cli.config import DEFAULT_CONFIG
+from simplify_cli.search.cache import ResponseCache, cache_key
+from simplify_cli.search.client import TypesenseClient
+
+
+def make_cache(tmp_path: Path, ttl: float, swr: float = 3600, max_bytes: int = 1_000_000) -> ResponseCache:
+    settings = {"ttl": {"search": ttl}, "max_bytes": max_bytes, "stale_while_revalidate": swr}
+    return ResponseCache(path=tmp_path / "cache.db", settings=settings)
+
+
+def test_cache_key_ignores_key_order() -> None:
+    assert cache_key({"a": 1, "b": [1, 2]}) == cache_key({"b": [1, 2], "a": 1})
+    assert cache_key({"a": 1}) != cache_key({"a": 2})
+
+
+def test_fresh_stale_and_expired(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = make_cache(tmp_path, ttl=10, swr=20)
+    now = 1_000.0
+    monkeypatch.setattr("simplify_cli.search.cache.time.time", lambda: now)
+    cache.put("k", "search", b"body")
+
+    now = 1_005.0
+    entry = cache.get("k", "search")
+    assert entry is not None and entry.fresh and entry.body == b"body"
+
+    now = 1_025.0
+    entry = cache.get("k", "search")
+    assert entry is not None and not entry.fresh
+
+    now = 1_031.0
+    assert cache.get("k", "search") is None
+    counts = cache.stats()["kinds"]["search"]
+    assert (counts["hits"], counts["stale_hits"], counts["misses"]) == (1, 1, 1)
+    assert counts["entries"] == 0
+    cache.close()
+
+
+def test_evicts_least_recently_used(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = make_cache(tmp_path, ttl=60, max_bytes=10)
+    now = 1_000.0
+    monkeypatch.setattr("simplify_cli.search.cache.time.time", lambda: now)
+    cache.put("a", "search", b"aaaa")
+    now += 1
+    cache.put("b", "search", b"bbbb")
+    now += 1
+    assert cache.get("a", "search") is not None
+    now += 1
+    cache.put("c", "search", b"cccc")
+    assert cache.get("b", "search") is None
+    assert cache.get("a", "search") is not None
+    assert cache.get("c", "search") is not None
+    cache.close()
+
+
+class CountingClient(TypesenseClient):
+    def __init__(self, cache: ResponseCache) -> None:
+        super().__init__(dict(DEFAULT_CONFIG["search"]), cache=cache)
+        self.fetches = 0
+
+    def _fetch(self, payload: dict[str, Any]) -> bytes:
+        self.fetches += 1
+        return b'{"results": [{"n": %d}]}' % self.fetches
+
+    def wait_revalidated(self) -> None:
+        for thread in list(self._revalidating.values()):
+            thread.join()
+
+
+def test_stale_entries_are_served_then_revalidated_every_time(tmp_path: Path) -> None:
+    # A zero TTL makes every cached entry stale on the next read.
+    with CountingClient(make_cache(tmp_path, ttl=0)) as client:
+        payload = {"searches": [{"q": "x"}]}
+        assert client.post(payload) == {"n": 1}
+        for expected in (1, 2, 3):
+            assert client.post(payload) == {"n": expected}
+            client.wait_revalidated()
+            assert client.fetches == expected + 1
+        assert client._revalidating == {}
+
+
+def test_failed_revalidation_releases_the_key(tmp_path: Path) -> None:
+    class FlakyClient(CountingClient):
+        def _fetch(self, payload: dict[str, Any]) -> bytes:
+            if self.fetches:
+                self.fetches += 1
+                raise httpx.ConnectError("down")
+            return super()._fetch(payload)
+
+    with FlakyClient(make_cache(tmp_path, ttl=0)) as client:
+        payload = {"searches": [{"q": "x"}]}
+        client.post(payload)
+        for _ in range(2):
+            assert client.post(payload) == {"n": 1}
+            client.wait_revalidated()
+        assert client.fetches == 3
+        assert client._revalidating == {}
+
+
+def test_concurrent_stale_reads_share_one_refresh(tmp_path: Path) -> None:
+    release = threading.Event()
+
+    class SlowClient(CountingClient):
+        def _fetch(self, payload: dict[str, Any]) -> bytes:
+            if self.fetches:
+                release.wait(5)
+            return super()._fetch(payload)
+
+    with SlowClient(make_cache(tmp_path, ttl=0)) as client:
+        payload = {"searches": [{"q": "x"}]}
+        client.post(payload)
+        for _ in range(5):
+            client.post(payload)
+        assert len(client._revalidating) == 1
+        release.set()
+        client.wait_revalidated()
+        assert client.fetches == 2
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+
+from simplify_cli.api.client import SimplifyAPIClient
+from simplify_cli.api.tracker import fetch_tracker_pages, iter_tracker_pages
+from simplify_cli.decode import decode, decode_results, loads
+from simplify_cli.models.job import Job
+from simplify_cli.models.search import SearchResult
+from simplify_cli.models.tracker import TrackerPage
+from simplify_cli.search.mirror import _SCHEMA, _insert_job, fetch_mirror_search, search_mirror
+
+DOCS = [
+    {"id": "1", "posting_id": "p1", "title": "Backend Engineer", "company_name": "Acme", "type": "Full-Time",
+     "functions": ["Software Engineering"], "locations": ["Remote"], "min_salary": 100000, "max_salary": 150000,
+     "updated_date": 10, "unknown_field": {"nested": [1, 2]}},
+    {"id": "2", "posting_id": "p2", "title": "Data Analyst", "company_name": "Globex", "type": "Internship",
+     "functions": ["Data"], "locations": ["New York"], "updated_date": 20},
+]
+
+
+def test_decode_results_from_bytes_ignores_unknown_fields() -> None:
+    body = json.dumps({
+        "results": [
+            {"found": 2, "page": 1, "search_time_ms": 3, "hits": [{"document": d, "highlight": {}} for d in DOCS]},
+            {"error": "bad filter", "code": 400},
+        ]
+    }).encode()
+    first, second = decode_results(body)
+    assert first.found == 2 and [job.title for job in first.jobs] == ["Backend Engineer", "Data Analyst"]
+    assert first.jobs[0].max_salary == 150000 and first.jobs[1].min_salary is None
+    assert second.error == "bad filter" and second.hits == []
+    assert decode_results(body.decode()) == [first, second]
+
+
+def test_decode_generic_types() -> None:
+    jobs = decode(json.dumps(DOCS), list[Job])
+    assert [job.id for job in jobs] == ["1", "2"]
+    assert loads(b'{"a": [1, 2.5, null]}') == {"a": [1, 2.5, None]}
+
+
+def test_tracker_pages_decode_like_the_raw_pages(tracker_api) -> None:
+    tracker_api.seed(45)
+    with SimplifyAPIClient() as client:
+        raw = list(iter_tracker_pages(client, size=20, workers=2))
+        pages = list(fetch_tracker_pages(client, size=20, workers=2))
+    assert [p.page for p in pages] == [1, 2, 3]
+    assert pages == [TrackerPage.model_validate(data) for data in raw]
+    assert pages[2].items[-1].company_name == "Company 2"
+    assert pages[0].items[0].current_status == "Saved"
+
+
+def make_mirror(path: Path) -> Path:
+    db = sqlite3.connect(path)
+    db.executescript(_SCHEMA)
+    with db:
+        for doc in DOCS:
+            _insert_job(db, doc)
+    db.close()
+    return path
+
+
+def test_mirror_search_decodes_spliced_documents(tmp_path: Path) -> None:
+    path = make_mirror(tmp_path / "jobs.db")
+    result = fetch_mirror_search(path=path)
+    assert result == SearchResult.model_validate(search_mirror(path=path))
+    assert result.found == 2 and [job.id for job in result.jobs] == ["2", "1"]
+
+    matched = fetch_mirror_search(query="backend", path=path)
+    assert [job.id for job in matched.jobs] == ["1"]
+
+    subset = search_mirror(job_type="Internship", include_fields=["id", "title"], path=path)
+    assert subset["hits"] == [{"document": {"id": "2", "title": "Data Analyst"}}]
@@ -0,0 +1,29 @@
+"""Fail the suite when CLI startup goes over the budgets in benchmarks/importtime.py.
+
+Set ``SIMPLIFY_IMPORT_BUDGET_SCALE`` to loosen the time budgets on slow
+machines; the forbidden-module checks always apply.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+
+import pytest
+
+from benchmarks.importtime import BUDGETS, baseline, check
+
+RUNS = 3
+SCALE = float(os.environ.get("SIMPLIFY_IMPORT_BUDGET_SCALE", "1.0"))
+
+
+@pytest.fixture(scope="module")
+def base() -> float:
+    return statistics.median(baseline() for _ in range(RUNS))
+
+
+@pytest.mark.parametrize("path", list(BUDGETS), ids=lambda path: " ".join(path) or "--help")
+def test_import_budget(path: tuple[str, ...], base: float) -> None:
+    ms, limit, leaked = check(path, base, runs=RUNS, scale=SCALE)
+    assert not leaked, f"imports {', '.join(leaked)}"
+    assert ms <= limit, f"{ms:.1f} ms of imports, budget {limit:.0f} ms"
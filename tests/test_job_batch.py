@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+from simplify_cli.models.job import Job, JobBatch
+from simplify_cli.search.filters import filter_jobs
+
+DOCS = [
+    {"id": "a", "title": "Backend", "company_name": "Acme", "type": "Full-Time", "experience_level": ["Senior"],
+     "functions": ["Software Engineering"], "max_salary": 200000, "updated_date": 30},
+    {"id": "b", "title": "Intern", "company_name": "Acme", "type": "Internship", "experience_level": ["Intern"],
+     "functions": ["Software Engineering"], "updated_date": 10},
+    {"title": "Analyst", "id": "c", "company_name": "Globex", "type": "Full-Time", "experience_level": ["Senior"],
+     "functions": ["Data"], "max_salary": 120000.5, "updated_date": 20, "highlight": {"title": "Analyst"}},
+]
+
+
+@pytest.fixture
+def batch() -> JobBatch:
+    return JobBatch.from_documents(DOCS)
+
+
+def test_documents_round_trip_with_their_own_keys(batch: JobBatch) -> None:
+    assert list(batch.iter_documents()) == DOCS
+    assert list(batch.document(2)) == list(DOCS[2])
+    assert batch.document(-1)["highlight"] == {"title": "Analyst"}
+    assert batch.document(1, all_fields=True)["max_salary"] is None
+
+
+def test_models_are_built_on_access(batch: JobBatch) -> None:
+    assert isinstance(batch[0], Job) and batch[0].experience_level == ["Senior"]
+    assert [job.id for job in batch[1:]] == ["b", "c"]
+    assert len(batch) == 3
+
+
+def test_columns(batch: JobBatch) -> None:
+    assert batch.column("company_name") == ["Acme", "Acme", "Globex"]
+    assert batch.column("functions")[2] == ("Data",)
+    assert math.isnan(batch.column("max_salary")[1])
+    with pytest.raises(KeyError):
+        batch.column("nope")
+
+
+def test_take_copies_the_value_table(batch: JobBatch) -> None:
+    subset = batch.take([2, 0])
+    subset.append({"id": "d", "company_name": "Initech"})
+    assert [doc["id"] for doc in subset.iter_documents()] == ["c", "a", "d"]
+    assert "Initech" not in batch._values
+    assert list(batch.iter_documents()) == DOCS
+
+
+def test_sort_puts_missing_salaries_last(batch: JobBatch) -> None:
+    assert [job.id for job in batch.sort_by("max_salary", descending=True)] == ["a", "c", "b"]
+    assert [job.id for job in batch.sort_by("max_salary")] == ["c", "a", "b"]
+    assert [job.id for job in batch.sort_by("updated_date")] == ["b", "c", "a"]
+
+
+def test_filter_jobs_works_on_columns(batch: JobBatch, monkeypatch: pytest.MonkeyPatch) -> None:
+    def no_models(*args: object, **kwargs: object) -> Job:
+        raise AssertionError("filter_jobs built a Job")
+
+    monkeypatch.setattr(Job, "model_validate", no_models)
+
+    def ids(**filters: object) -> list[str]:
+        return [doc["id"] for doc in filter_jobs(batch, **filters).iter_documents()]
+
+    assert ids(experience="Senior") == ["a", "c"]
+    assert ids(category="Software Engineering", job_type="Internship") == ["b"]
+    assert ids(min_salary=150000) == ["a"]
+    assert ids(updated_since=20) == ["a", "c"]
+    assert ids(experience="Staff") == []
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import json
+import os
+import select
+import subprocess
+import sys
+
+import pytest
+
+from simplify_cli.display.output import write_json, write_rows
+
+ROWS = [
+    {"id": "1", "title": "Engineer, Backend", "locations": ["Remote", "NYC"], "max_salary": 150000.0, "h1b": True},
+    {"id": "2", "title": "Tab\there", "locations": [], "max_salary": None, "h1b": False, "extra": {"a": 1}},
+]
+
+
+class Stdout:
+    def __init__(self, capture: pytest.CaptureFixture[bytes]) -> None:
+        self.capture = capture
+
+    def text(self) -> str:
+        return self.capture.readouterr().out.decode()
+
+
+@pytest.fixture
+def stdout(capsysbinary: pytest.CaptureFixture[bytes]) -> Stdout:
+    return Stdout(capsysbinary)
+
+
+def test_ndjson(stdout: Stdout) -> None:
+    assert write_rows(ROWS, "ndjson") == 2
+    assert [json.loads(line) for line in stdout.text().splitlines()] == ROWS
+
+
+def test_json_array(stdout: Stdout) -> None:
+    write_rows(ROWS, "json")
+    assert json.loads(stdout.text()) == ROWS
+
+
+def test_empty_json_array(stdout: Stdout) -> None:
+    assert write_rows([], "json") == 0
+    assert json.loads(stdout.text()) == []
+
+
+def test_csv(stdout: Stdout) -> None:
+    write_rows(ROWS, "csv", ["id", "title", "locations", "max_salary", "h1b"])
+    assert stdout.text().splitlines() == [
+        "id,title,locations,max_salary,h1b",
+        '1,"Engineer, Backend",Remote; NYC,150000,true',
+        "2,Tab\there,,,false",
+    ]
+
+
+def test_tsv_defaults_to_first_row_keys(stdout: Stdout) -> None:
+    write_rows(ROWS, "tsv")
+    lines = stdout.text().splitlines()
+    assert lines[0] == "id\ttitle\tlocations\tmax_salary\th1b"
+    assert lines[2] == "2\tTab here\t\t\tfalse"
+
+
+def test_write_json(stdout: Stdout) -> None:
+    write_json({"b": [1, 2], "a": "ü"})
+    assert json.loads(stdout.text()) == {"b": [1, 2], "a": "ü"}
+
+
+# Buffered like a real pipe, whatever the environment running the tests asks for.
+CHILD_ENV = {k: v for k, v in os.environ.items() if k != "PYTHONUNBUFFERED"}
+
+# The row generator stands in for a slow network page: the second row only
+# comes once the first has reached the reader.
+SLOW_ROWS = """
+import sys
+from simplify_cli.display.output import write_rows
+
+def rows():
+    yield {"id": "first"}
+    sys.stdin.readline()
+    yield {"id": "second"}
+
+write_rows(rows(), sys.argv[1])
+"""
+
+
+@pytest.mark.parametrize("fmt", ["ndjson", "json", "tsv", "csv"])
+def test_rows_reach_a_pipe_as_they_are_produced(fmt: str) -> None:
+    proc = subprocess.Popen(
+        [sys.executable, "-c", SLOW_ROWS, fmt], stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=CHILD_ENV
+    )
+    assert proc.stdin is not None and proc.stdout is not None
+    try:
+        received = b""
+        while b"first" not in received:
+            ready, _, _ = select.select([proc.stdout], [], [], 10)
+            assert ready, "the first row was not written before the second was produced"
+            chunk = os.read(proc.stdout.fileno(), 4096)
+            assert chunk, "output ended early"
+            received += chunk
+    finally:
+        proc.stdin.close()
+        proc.stdout.close()
+        proc.wait(timeout=30)
+
+
+@pytest.mark.parametrize(
+    "call",
+    [
+        "write_rows(({'id': i} for i in range(200_000)), 'ndjson')",
+        "write_rows(({'id': i} for i in range(200_000)), 'csv')",
+        "write_json(list(range(500_000)))",
+    ],
+)
+def test_closed_pipe_exits_quietly(call: str) -> None:
+    code = f"from simplify_cli.display.output import write_json, write_rows; {call}"
+    proc = subprocess.Popen(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=CHILD_ENV
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    proc.stdout.readline()
+    proc.stdout.close()
+    stderr = proc.stderr.read()
+    assert proc.wait(timeout=30) == 0, stderr.decode()
+    assert b"BrokenPipeError" not in stderr
+
+
+def test_command_json_goes_through_write_json(monkeypatch: pytest.MonkeyPatch) -> None:
+    from typer.testing import CliRunner
+
+    from simplify_cli.app import app
+    from simplify_cli.display import output
+
+    written: list[object] = []
+    monkeypatch.setattr(output, "write_json", written.append)
+    assert CliRunner().invoke(app, ["cache", "stats", "--json"]).exit_code == 0
+    assert written and set(written[0]) >= {"path", "kinds"}
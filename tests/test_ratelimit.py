@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from simplify_cli.api.ratelimit import (
+    AdaptiveTransport,
+    adaptive_transports,
+    environment_proxies,
+    get_limiter,
+    parse_retry_after,
+)
+from simplify_cli.config import DEFAULT_CONFIG
+
+SETTINGS = {**DEFAULT_CONFIG["rate_limit"], "backoff_base": 0.0}
+PROXY_VARS = ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY")
+
+
+@pytest.fixture
+def clean_env(monkeypatch: pytest.MonkeyPatch) -> pytest.MonkeyPatch:
+    for name in PROXY_VARS:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    return monkeypatch
+
+
+def test_no_proxies(clean_env: pytest.MonkeyPatch) -> None:
+    assert environment_proxies() == {}
+
+
+def test_proxies_and_bypass(clean_env: pytest.MonkeyPatch) -> None:
+    clean_env.setenv("HTTPS_PROXY", "proxy.internal:3128")
+    clean_env.setenv("HTTP_PROXY", "http://proxy.internal:3128")
+    clean_env.setenv("NO_PROXY", "localhost, .corp.example, example.com,10.0.0.0/8,::1")
+    assert environment_proxies() == {
+        "http://": "http://proxy.internal:3128",
+        "https://": "http://proxy.internal:3128",
+        "all://localhost": None,
+        "all://*.corp.example": None,
+        "all://*example.com": None,
+        "all://10.0.0.0/8": None,
+        "all://[::1]": None,
+    }
+
+
+def test_no_proxy_star_disables_proxies(clean_env: pytest.MonkeyPatch) -> None:
+    clean_env.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    clean_env.setenv("NO_PROXY", "*")
+    assert environment_proxies() == {}
+
+
+def test_client_routes_through_wrapped_proxy(clean_env: pytest.MonkeyPatch) -> None:
+    clean_env.setenv("HTTPS_PROXY", "http://proxy.internal:3128")
+    clean_env.setenv("NO_PROXY", "api.example.com")
+    with httpx.Client(**adaptive_transports(settings=SETTINGS)) as client:
+        proxied = client._transport_for_url(httpx.URL("https://search.example.org/"))
+        direct = client._transport_for_url(httpx.URL("https://api.example.com/"))
+        assert isinstance(proxied, AdaptiveTransport) and isinstance(direct, AdaptiveTransport)
+        assert proxied is not direct
+        assert direct is client._transport
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("2.5") == 2.5
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_retries_idempotent_requests_only() -> None:
+    calls = {"GET": 0, "POST": 0}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls[request.method] += 1
+        if calls[request.method] < 3:
+            return httpx.Response(502)
+        return httpx.Response(200, text="ok")
+
+    transport = AdaptiveTransport(httpx.MockTransport(handler), settings=SETTINGS)
+    with httpx.Client(transport=transport) as client:
+        assert client.get("https://retry.test/").status_code == 200
+        assert client.post("https://retry.test/").status_code == 502
+    assert calls == {"GET": 3, "POST": 1}
+
+
+def test_streamed_response_holds_its_slot_until_closed() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=httpx.ByteStream(b"x" * 100))
+
+    limiter = get_limiter("stream.test", SETTINGS)
+    transport = AdaptiveTransport(httpx.MockTransport(handler), settings=SETTINGS)
+    with httpx.Client(transport=transport) as client:
+        with client.stream("GET", "https://stream.test/") as response:
+            assert limiter.in_flight == 1
+            assert response.read() == b"x" * 100
+        assert limiter.in_flight == 0
+        client.get("https://stream.test/")
+        assert limiter.in_flight == 0
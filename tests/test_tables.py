@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from rich.console import Console
+
+from simplify_cli.display.tables import grouped_results_table
+from simplify_cli.models.job import Job
+
+
+def render(table: object) -> str:
+    console = Console(width=200, record=True, color_system=None)
+    console.print(table)
+    return console.export_text()
+
+
+def test_grouped_table_keeps_markup_in_company_names() -> None:
+    job = Job(id="1", title="Engineer [Intern]", locations=["Remote"])
+    out = render(grouped_results_table([("[bold]Acme[/bold]", 1, [job])], total=1))
+    assert "[bold]Acme[/bold]" in out
+    assert "Engineer [Intern]" in out
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from simplify_cli.app import app
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def workdir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_failures_go_to_the_retry_file(tracker_api, workdir: Path) -> None:
+    tracker_api.fail = {"job-2"}
+    result = runner.invoke(app, ["tracker", "bulk", "save"], input="job-1\njob-2\n# comment\n\njob-3\n")
+    assert result.exit_code == 1
+    assert (workdir / "tracker-save-retry.txt").read_text() == "job-2\n"
+    assert "2 succeeded, 1 failed" in result.output
+
+
+def test_retry_file_removed_only_after_its_own_rerun(tracker_api, workdir: Path) -> None:
+    tracker_api.seed(3)
+    tracker_api.fail = {"job-2"}
+    assert runner.invoke(app, ["tracker", "bulk", "save"], input="job-1\njob-2\n").exit_code == 1
+    retry = workdir / "tracker-save-retry.txt"
+
+    # A clean run of another command, or of the same one from other input, leaves it alone.
+    assert runner.invoke(app, ["tracker", "bulk", "applied"], input="job-1\n").exit_code == 0
+    assert runner.invoke(app, ["tracker", "bulk", "status-update"], input="item-0001,applied\n").exit_code == 0
+    assert runner.invoke(app, ["tracker", "bulk", "save"], input="job-3\n").exit_code == 0
+    assert retry.read_text() == "job-2\n"
+
+    tracker_api.fail = set()
+    assert runner.invoke(app, ["tracker", "bulk", "save", str(retry)]).exit_code == 0
+    assert not retry.exists()
+
+
+def test_malformed_rows_are_rejected_not_retried(tracker_api, workdir: Path) -> None:
+    tracker_api.seed(2)
+    result = runner.invoke(
+        app,
+        ["tracker", "bulk", "status-update", "--json"],
+        input="item-0000,offer\nitem-0001\nitem-0001 promoted\n",
+    )
+    assert result.exit_code == 1
+    reports = [json.loads(line) for line in result.stdout.splitlines()]
+    assert [(r["row"], r["ok"], r["rejected"]) for r in reports] == [
+        (["item-0000", "offer"], True, False),
+        (["item-0001"], False, True),
+        (["item-0001", "promoted"], False, True),
+    ]
+    assert not (workdir / "tracker-status-retry.txt").exists()
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import gzip
+from pathlib import Path
+
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from simplify_cli.api import tracker
+from simplify_cli.api.client import SimplifyAPIClient
+from simplify_cli.api.ratelimit import RetryPolicy
+from simplify_cli.api.tracker import EXPORT_CHUNK_SIZE, download_csv, part_path
+from simplify_cli.app import app
+
+CSV = b"".join(b"item-%05d,Engineer,Company,Applied\n" % n for n in range(10_000))
+# Drops land on chunk boundaries; bytes of a partial chunk are never written, so never resumed from.
+CHUNK = EXPORT_CHUNK_SIZE
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tracker.time, "sleep", lambda seconds: None)
+
+
+def no_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(tracker, "retry_policy", lambda: RetryPolicy(max_retries=0))
+
+
+def download(dest: Path, compression: str | None = None) -> int:
+    with SimplifyAPIClient() as client:
+        return download_csv(client, dest, compression=compression)
+
+
+def leftovers(dest: Path) -> list[str]:
+    return sorted(p.name for p in dest.parent.iterdir() if p != dest)
+
+
+def test_plain_download(tracker_api, tmp_path: Path) -> None:
+    tracker_api.export = CSV
+    dest = tmp_path / "tracker.csv"
+    assert download(dest) == len(CSV)
+    assert dest.read_bytes() == CSV
+    assert leftovers(dest) == []
+    assert tracker_api.export_requests()[0].headers["Accept-Encoding"] == "identity"
+
+
+def test_gzip_is_written_as_it_arrives_and_resumed_within_a_run(tracker_api, tmp_path: Path) -> None:
+    tracker_api.export = CSV
+    tracker_api.drops = [CHUNK, 2 * CHUNK]
+    dest = tmp_path / "tracker.csv.gz"
+    assert download(dest, "gzip") == len(CSV)
+    assert gzip.decompress(dest.read_bytes()) == CSV
+    ranges = [r.headers.get("Range") for r in tracker_api.export_requests()]
+    assert ranges == [None, f"bytes={CHUNK}-", f"bytes={3 * CHUNK}-"]
+    assert leftovers(dest) == []
+
+
+def test_failed_first_request_leaves_no_part_file(tracker_api, tmp_path: Path) -> None:
+    tracker_api.export_status = 500
+    dest = tmp_path / "tracker.csv"
+    with pytest.raises(httpx.HTTPStatusError):
+        download(dest)
+    assert leftovers(dest) == [] and not dest.exists()
+
+
+@pytest.mark.parametrize("compression", [None, "gzip"])
+def test_resumes_across_runs(tracker_api, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, compression: str | None) -> None:
+    tracker_api.export = CSV
+    tracker_api.drops = [2 * CHUNK]
+    dest = tmp_path / ("tracker.csv.gz" if compression else "tracker.csv")
+    no_retries(monkeypatch)
+    with pytest.raises(httpx.ReadError):
+        download(dest, compression)
+    assert part_path(dest).exists() and not dest.exists()
+
+    assert download(dest, compression) == len(CSV)
+    second = tracker_api.export_requests()[-1]
+    assert (second.headers["Range"], second.headers["If-Range"]) == (f"bytes={2 * CHUNK}-", '"v1"')
+    data = dest.read_bytes()
+    assert (gzip.decompress(data) if compression else data) == CSV
+    assert leftovers(dest) == []
+
+
+def test_changed_export_starts_over(tracker_api, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    tracker_api.export = CSV
+    tracker_api.drops = [100_000]
+    dest = tmp_path / "tracker.csv.gz"
+    no_retries(monkeypatch)
+    with pytest.raises(httpx.ReadError):
+        download(dest, "gzip")
+
+    tracker_api.export = CSV[::-1]
+    tracker_api.etag = '"v2"'
+    assert download(dest, "gzip") == len(CSV)
+    assert gzip.decompress(dest.read_bytes()) == CSV[::-1]
+
+
+def test_export_command_reports_resume(tracker_api, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    tracker_api.export = CSV
+    tracker_api.drops = [1000]
+    dest = tmp_path / "out.csv"
+    no_retries(monkeypatch)
+    result = CliRunner().invoke(app, ["tracker", "export", "-o", str(dest)])
+    assert result.exit_code == 1
+    assert "Run the same command again" in result.output
+    result = CliRunner().invoke(app, ["tracker", "export", "-o", str(dest)])
+    assert result.exit_code == 0, result.output
+    assert dest.read_bytes() == CSV
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from simplify_cli.api.client import SimplifyAPIClient
+from simplify_cli.api.tracker_replica import (
+    full_refresh_age,
+    invalidate_replica,
+    query_replica,
+    query_replica_page,
+    refresh_replica,
+    replica_age,
+)
+from simplify_cli.app import app
+
+runner = CliRunner()
+
+
+def refresh(path: Path, **kwargs: bool) -> dict[str, int]:
+    with SimplifyAPIClient() as client:
+        return refresh_replica(client, path=path, **kwargs)
+
+
+def test_first_refresh_reads_everything(tracker_api, tmp_path: Path) -> None:
+    tracker_api.seed(250)
+    db = tmp_path / "tracker.db"
+    assert replica_age(db) is None
+    result = refresh(db)
+    assert result == {"added": 250, "updated": 0, "removed": 0, "total": 250, "pages": 3, "full": True}
+    assert replica_age(db) is not None and full_refresh_age(db) is not None
+
+
+def test_incremental_refresh_stops_at_first_unchanged_page(tracker_api, tmp_path: Path) -> None:
+    tracker_api.seed(250)
+    db = tmp_path / "tracker.db"
+    refresh(db)
+    tracker_api.items.insert(0, {**tracker_api.items[0], "id": "new", "tracked_date": "2027-01-01T00:00:00Z"})
+    result = refresh(db)
+    # The new item shifts page one, so page two is read before an unchanged full page is found.
+    assert (result["added"], result["pages"], result["full"]) == (1, 2, False)
+
+
+def test_incremental_refresh_misses_deletions_until_full(tracker_api, tmp_path: Path) -> None:
+    tracker_api.seed(250)
+    db = tmp_path / "tracker.db"
+    refresh(db)
+    del tracker_api.items[240]
+    assert refresh(db)["total"] == 250
+    result = refresh(db, full=True)
+    assert (result["removed"], result["total"]) == (1, 249)
+
+
+def test_invalidate_forces_full_refresh(tracker_api, tmp_path: Path) -> None:
+    tracker_api.seed(250)
+    db = tmp_path / "tracker.db"
+    refresh(db)
+    tracker_api.set_status("item-0220", "offer")
+    invalidate_replica(db)
+    assert replica_age(db) is None and full_refresh_age(db) is None
+    result = refresh(db, full=full_refresh_age(db) is None)
+    assert (result["updated"], result["pages"]) == (1, 3)
+    page = query_replica(status="offer", path=db)
+    assert [item["id"] for item in page["items"]] == ["item-0220"]
+
+
+def test_query_filters_and_sorts(tracker_api, tmp_path: Path) -> None:
+    tracker_api.seed(30)
+    db = tmp_path / "tracker.db"
+    refresh(db)
+    page = query_replica_page(company="Company 3", sort="tracked", descending=False, size=2, path=db)
+    assert page.total == 4 and page.pages == 2
+    assert [item.id for item in page.items] == ["item-0024", "item-0017"]
+    since = query_replica(since="2025-12-31T23:00:00Z", path=db)
+    assert [item["id"] for item in since["items"]] == ["item-0000", "item-0001"]
+
+
+def test_status_update_past_first_page_shows_in_list(tracker_api) -> None:
+    tracker_api.seed(250)
+    assert runner.invoke(app, ["tracker", "list", "--json"]).exit_code == 0
+    result = runner.invoke(app, ["tracker", "status-update", "item-0220", "offer"])
+    assert result.exit_code == 0, result.output
+    result = runner.invoke(app, ["tracker", "list", "-s", "offer", "--json"])
+    assert result.exit_code == 0, result.output
+    assert [item["id"] for item in json.loads(result.stdout)["items"]] == ["item-0220"]
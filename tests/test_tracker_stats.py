@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from simplify_cli.api.client import SimplifyAPIClient
+from simplify_cli.api.tracker_replica import refresh_replica
+from simplify_cli.api.tracker_stats import compute_stats
+from simplify_cli.app import app
+
+runner = CliRunner()
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def item(item_id: str, company: str, tracked: str, *events: tuple[int, str]) -> dict:
+    return {
+        "id": item_id,
+        "job_posting_id": f"job-{item_id}",
+        "job_posting_title": "Engineer",
+        "company": {"name": company},
+        "tracked_date": tracked,
+        "status_events": [{"status": status, "timestamp": ts} for status, ts in events],
+    }
+
+
+ITEMS = [
+    # Applied on a Monday, interview five days later.
+    item(
+        "a",
+        "Stripe",
+        "2026-02-01T00:00:00Z",
+        (1, "2026-02-01T00:00:00Z"),
+        (2, "2026-02-02T00:00:00Z"),
+        (3, "2026-02-07T00:00:00Z"),
+    ),
+    # Applied and offered without a recorded interview.
+    item("b", "Stripe", "2026-01-20T00:00:00Z", (2, "2026-01-20T00:00:00Z"), (4, "2026-01-25T00:00:00Z")),
+    # No response for more than the ghost window.
+    item("c", "Acme", "2026-01-05T00:00:00Z", (2, "2026-01-05T00:00:00Z")),
+    # Only saved.
+    item("d", "Acme", "2026-01-01T00:00:00Z", (1, "2026-01-01T00:00:00Z")),
+]
+
+
+def build_replica(tracker_api, path: Path) -> None:
+    tracker_api.items = ITEMS
+    with SimplifyAPIClient() as client:
+        refresh_replica(client, path=path)
+
+
+def test_compute_stats(tracker_api, tmp_path: Path) -> None:
+    db = tmp_path / "tracker.db"
+    build_replica(tracker_api, db)
+    stats = compute_stats(now=NOW, path=db)
+    assert stats["items"] == 4
+    assert stats["counts"] == {
+        "saved": 2,
+        "applications": 3,
+        "interviews": 2,
+        "offers": 1,
+        "rejections": 0,
+        "withdrawn": 0,
+    }
+    assert stats["conversion_rates"]["application_to_interview"] == 66.7
+    assert stats["ghost_rate_percent"] == 33.3
+    assert stats["average_days_to_first_response"] == 5.0
+    assert stats["most_active_weekday"] == {"name": "Monday", "applications": 2}
+    assert [w["week"] for w in stats["weekly"]][:2] == ["2025-12-29", "2026-01-05"]
+
+
+def test_compute_stats_filters(tracker_api, tmp_path: Path) -> None:
+    db = tmp_path / "tracker.db"
+    build_replica(tracker_api, db)
+    assert compute_stats(company="acme", now=NOW, path=db)["items"] == 2
+    assert compute_stats(status="offer", now=NOW, path=db)["items"] == 1
+    assert compute_stats(since="2026-01-20", until="2026-01-31", now=NOW, path=db)["items"] == 1
+
+
+def test_stats_defaults_to_server_statistics(tracker_api) -> None:
+    tracker_api.sankey = [{"debug_info": {"statistics": {"ghost_rate_percent": 12.5}}}]
+    result = runner.invoke(app, ["tracker", "stats", "--json"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.stdout) == tracker_api.sankey
+    assert tracker_api.pages_read() == 0
+
+
+def test_local_stats_are_opt_in(tracker_api) -> None:
+    tracker_api.items = ITEMS
+    for args in (["--local"], ["--company", "Stripe"]):
+        result = runner.invoke(app, ["tracker", "stats", "--json", *args])
+        assert result.exit_code == 0, result.output
+        assert "weekly" in json.loads(result.stdout)
+    assert json.loads(result.stdout)["items"] == 2